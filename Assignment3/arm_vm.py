@@ -0,0 +1,218 @@
+"""
+ARM full-system virtual memory experiments (virtual_memory.py --isa=arm).
+
+In SE mode gem5 does not model address translation faithfully: X86 fixes
+the page size to 4KB and its TLBs are fully associative, and ARM resolves
+every access straight from the process page table without touching the
+TLBs at all. Page size, TLB associativity and page walks only become real
+in full-system mode, so this module boots Linux on an ArmBoard from the
+gem5 standard library:
+- ArmMMU L1 instruction/data TLBs and the shared L2 TLB with configurable
+  size and associativity
+- private page-walker caches between the table walkers and the L2
+- the translation granule (4K/16K/64K) is chosen by the guest kernel
+  (CONFIG_ARM64_{4K,16K,64K}_PAGES), so every granule needs its own kernel
+
+The kernel boots on atomic cores; the first `m5 exit` in the boot script
+switches to timing cores and resets the stats, the second one ends the
+run, so the stats cover the benchmark only.
+"""
+
+import m5
+from m5.objects import ArmDefaultRelease, ArmMMU, VExpress_GEM5_Foundation
+
+from gem5.components.boards.arm_board import ArmBoard
+from gem5.components.cachehierarchies.classic.private_l1_private_l2_cache_hierarchy import (
+    PrivateL1PrivateL2CacheHierarchy,
+)
+from gem5.components.memory import SingleChannelDDR3_1600
+from gem5.components.processors.cpu_types import CPUTypes
+from gem5.components.processors.simple_switchable_processor import (
+    SimpleSwitchableProcessor,
+)
+from gem5.isas import ISA
+from gem5.resources.resource import (
+    DiskImageResource,
+    KernelResource,
+    obtain_resource,
+)
+from gem5.simulate.exit_event import ExitEvent
+from gem5.simulate.simulator import Simulator
+
+# Default kernel resource of every granule (None: must be given with --kernel)
+GRANULE_KERNELS = {
+    '4kB': 'arm64-linux-kernel-5.4.49',
+    '16kB': None,
+    '64kB': None,
+}
+BOOTLOADER = 'arm64-bootloader-foundation'
+
+# Location of the aarch64 matrix_benchmark inside the disk image
+BENCHMARK_PATH = '/home/gem5/matrix_benchmark'
+
+
+class WalkCacheHierarchy(PrivateL1PrivateL2CacheHierarchy):
+    """Private L1/L2 hierarchy with a configurable page-walker cache size."""
+
+    def __init__(self, walker_cache_size, **kwargs):
+        super().__init__(**kwargs)
+        self._walker_cache_size = walker_cache_size
+
+    def incorporate_cache(self, board):
+        super().incorporate_cache(board)
+        for cache in list(self.iptw_caches) + list(self.dptw_caches):
+            cache.size = self._walker_cache_size
+
+
+def configure_tlbs(board, tlb_size, tlb_assoc, l2_tlb_size, l2_tlb_assoc):
+    """Resize the L1 and shared L2 TLBs of every core (atomic and timing)."""
+    for mmu in board.descendants():
+        if not isinstance(mmu, ArmMMU):
+            continue
+        for tlb in (mmu.itb, mmu.dtb):
+            tlb.size = tlb_size
+            tlb.assoc = tlb_assoc
+        mmu.l2_shared.size = l2_tlb_size
+        mmu.l2_shared.assoc = l2_tlb_assoc
+
+
+def create_arm_board(tlb_size, tlb_assoc, l2_tlb_size, l2_tlb_assoc,
+                     walker_cache_size):
+    """Create a single-core ArmBoard with the requested TLBs/walker caches."""
+    processor = SimpleSwitchableProcessor(
+        starting_core_type=CPUTypes.ATOMIC,
+        switch_core_type=CPUTypes.TIMING,
+        isa=ISA.ARM,
+        num_cores=1,
+    )
+    cache_hierarchy = WalkCacheHierarchy(
+        walker_cache_size,
+        l1d_size='16KiB',
+        l1i_size='16KiB',
+        l2_size='256KiB',
+    )
+    board = ArmBoard(
+        clk_freq='1GHz',
+        processor=processor,
+        memory=SingleChannelDDR3_1600(size='2GiB'),
+        cache_hierarchy=cache_hierarchy,
+        release=ArmDefaultRelease(),
+        platform=VExpress_GEM5_Foundation(),
+    )
+    configure_tlbs(board, tlb_size, tlb_assoc, l2_tlb_size, l2_tlb_assoc)
+    return board
+
+
+def run_arm_board(board, granule, kernel, disk_image, benchmark_args=()):
+    """Boot the board, run the benchmark from the disk image and dump stats."""
+    if kernel:
+        kernel_resource = KernelResource(kernel)
+    else:
+        kernel_resource = obtain_resource(GRANULE_KERNELS[granule])
+
+    command = ' '.join([BENCHMARK_PATH] + list(benchmark_args))
+    board.set_kernel_disk_workload(
+        kernel=kernel_resource,
+        disk_image=DiskImageResource(disk_image, root_partition='1'),
+        bootloader=obtain_resource(BOOTLOADER),
+        readfile_contents=f"m5 exit\n{command}\nm5 exit\n",
+    )
+
+    def on_exit():
+        # Boot finished: measure the benchmark on the timing cores only
+        board.processor.switch()
+        m5.stats.reset()
+        yield False
+        yield True
+
+    simulator = Simulator(board=board, on_exit_event={ExitEvent.EXIT: on_exit()})
+    simulator.run()
+    m5.stats.dump()
+
+
+def sum_stat(stats, suffix):
+    """Sum of every stat whose name ends with suffix (over all cores)."""
+    return sum(value for name, value in stats.items() if name.endswith(suffix))
+
+
+def arm_tlb_stats(stats):
+    """I-TLB, D-TLB and shared L2 TLB hits/misses from the final stats dump."""
+    itlb_accesses = sum_stat(stats, '.mmu.itb.instAccesses')
+    itlb_misses = sum_stat(stats, '.mmu.itb.instMisses')
+    dtlb_accesses = (sum_stat(stats, '.mmu.dtb.readAccesses') +
+                     sum_stat(stats, '.mmu.dtb.writeAccesses'))
+    dtlb_misses = (sum_stat(stats, '.mmu.dtb.readMisses') +
+                   sum_stat(stats, '.mmu.dtb.writeMisses'))
+    l2_accesses = sum_stat(stats, '.mmu.l2_shared.accesses')
+    l2_misses = sum_stat(stats, '.mmu.l2_shared.misses')
+
+    return {
+        'itlb_hits': int(itlb_accesses - itlb_misses),
+        'itlb_misses': int(itlb_misses),
+        'dtlb_hits': int(dtlb_accesses - dtlb_misses),
+        'dtlb_misses': int(dtlb_misses),
+        'l2_tlb_hits': int(l2_accesses - l2_misses),
+        'l2_tlb_misses': int(l2_misses),
+    }
+
+
+def histogram_buckets(stats, suffix):
+    """(bucket upper bound, count) of every histogram whose name ends with
+    suffix, merged over all instances and sorted by bound."""
+    buckets = []
+    for name, count in stats.items():
+        prefix, _, bucket = name.rpartition('::')
+        if not prefix.endswith(suffix) or '-' not in bucket:
+            continue
+        try:
+            buckets.append((int(bucket.split('-')[1]), count))
+        except ValueError:
+            pass
+    return sorted(buckets)
+
+
+def percentile(buckets, pct):
+    """Upper bound of the bucket holding the pct-th percentile sample."""
+    total = sum(count for _, count in buckets)
+    seen = 0
+    for bound, count in buckets:
+        seen += count
+        if total > 0 and seen >= total * pct / 100.0:
+            return bound
+    return 0
+
+
+def arm_walk_stats(stats):
+    """Page-table walks of every walker and hits of the walker caches.
+    
+    walkServiceTime is the time from the start of a walk to its completion
+    (in ticks); walks that were squashed before starting are not included.
+    Percentiles are the upper bounds of the histogram buckets.
+    """
+    ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+    samples = sum_stat(stats, '_walker.walkServiceTime::samples')
+    walk_ticks = sum(
+        value * stats.get(name.replace('::mean', '::samples'), 0.0)
+        for name, value in stats.items()
+        if name.endswith('_walker.walkServiceTime::mean'))
+    buckets = histogram_buckets(stats, '_walker.walkServiceTime')
+
+    cache_accesses = sum(value for name, value in stats.items()
+                         if 'ptw_cache' in name and
+                         name.endswith('.overallAccesses::total'))
+    cache_hits = sum(value for name, value in stats.items()
+                     if 'ptw_cache' in name and
+                     name.endswith('.overallHits::total'))
+
+    return {
+        'walks': int(sum_stat(stats, '_walker.walks')),
+        'walk_ticks': walk_ticks,
+        'walk_latency_mean_ns': (walk_ticks / samples / ticks_per_ns
+                                 if samples > 0 else 0.0),
+        'walk_latency_p50_ns': percentile(buckets, 50) / ticks_per_ns,
+        'walk_latency_p90_ns': percentile(buckets, 90) / ticks_per_ns,
+        'walk_latency_p99_ns': percentile(buckets, 99) / ticks_per_ns,
+        'walker_cache_hit_rate': (100.0 * cache_hits / cache_accesses
+                                  if cache_accesses > 0 else 0.0),
+        'sim_ticks': stats.get('simTicks', 0.0),
+    }
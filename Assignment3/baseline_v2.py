@@ -26,13 +26,30 @@
 
 """Configurable cache classes for gem5 cache optimization experiments
 
-This file contains L1 I/D and L2 cache classes with full command-line
-configurability for size, associativity, and block size parameters.
-All cache parameters can be specified via command-line arguments.
+This file contains L1 I/D, L2 and optional L3 (last-level) cache classes
+with full command-line configurability for size, associativity, block size,
+latency, MSHR, replacement policy, prefetcher, L2 compression and L3
+inclusion parameters. All cache parameters can be specified via
+command-line arguments.
 """
 
+import math
+
 import m5
-from m5.objects import Cache
+from m5.objects import (
+    BDI,
+    BOPPrefetcher,
+    Cache,
+    CompressedTags,
+    CPack,
+    FPC,
+    LRURP,
+    RandomRP,
+    RRIPRP,
+    StridePrefetcher,
+    TaggedPrefetcher,
+    TreePLRURP,
+)
 
 # Add the common scripts to our path
 m5.util.addToPath("../../")
@@ -42,6 +59,131 @@ from common import SimpleOpts
 # Some specific options for caches
 # For all options see src/mem/cache/BaseCache.py
 
+# Replacement policies selectable per level
+# (see src/mem/cache/replacement_policies/ReplacementPolicies.py)
+REPLACEMENT_POLICIES = {
+    "lru": LRURP,
+    "plru": TreePLRURP,
+    "rrip": RRIPRP,
+    "random": RandomRP,
+}
+
+# Hardware prefetchers selectable per level
+# (see src/mem/cache/prefetch/Prefetcher.py)
+PREFETCHERS = {
+    "none": None,
+    "stride": StridePrefetcher,
+    "tagged": TaggedPrefetcher,
+    "bop": BOPPrefetcher,
+}
+
+# Compressors selectable for the L2 (see src/mem/cache/compressors/
+# Compressors.py); a compressed L2 uses CompressedTags, which keep up to
+# max_compression_ratio (default 2) tags per data block
+COMPRESSORS = {
+    "none": None,
+    "bdi": BDI,
+    "cpack": CPack,
+    "fpc": FPC,
+}
+
+# Storage model for comparing caches at equal area: tag bits of a 48-bit
+# physical address plus valid/dirty/coherence state per tag, and with
+# compression a compressed-size field (log2(block size) + 1 bits) per tag
+PHYS_ADDR_BITS = 48
+TAG_STATE_BITS = 4
+
+# L3 inclusion policies: name -> (L3 clusivity, L2 writeback_clean).
+# gem5's classic caches never back-invalidate the levels above, so there is
+# no strictly inclusive policy; "nine" fills the L3 on misses (mostly
+# inclusive), "exclusive" makes the L3 a victim cache that is filled by L2
+# evictions, which needs the L2 to write back clean lines as well.
+INCLUSION_POLICIES = {
+    "nine": ("mostly_incl", False),
+    "exclusive": ("mostly_excl", True),
+}
+
+
+# Latency and MSHR parameters settable per level as --<level>_<param>
+TIMING_PARAMS = (
+    "tag_latency",
+    "data_latency",
+    "response_latency",
+    "mshrs",
+    "tgts_per_mshr",
+)
+
+
+def add_timing_options(level, defaults):
+    """Add a --<level>_<param> option for every latency/MSHR parameter"""
+    for param in TIMING_PARAMS:
+        SimpleOpts.add_option(
+            f"--{level}_{param}",
+            help=f"{level.upper()} cache {param}. Default: {defaults[param]}"
+        )
+
+
+def apply_timing_options(cache, opts, level):
+    """Set the latency/MSHR parameters given on the command line"""
+    for param in TIMING_PARAMS:
+        value = getattr(opts, f"{level}_{param}", None)
+        if value:
+            setattr(cache, param, int(value))
+
+
+def make_replacement_policy(name):
+    """Create the replacement policy object for a --*_repl option value"""
+    return REPLACEMENT_POLICIES[name]()
+
+
+def make_prefetcher(name):
+    """Create the prefetcher object for a --*_prefetcher option value
+    (None for "none", i.e. no prefetcher)"""
+    prefetcher = PREFETCHERS[name]
+    return prefetcher() if prefetcher else None
+
+
+def apply_compressor(cache, name):
+    """Give a cache compressed tags and the compressor of a --*_compressor
+    option value (nothing for "none")"""
+    compressor = COMPRESSORS[name]
+    if compressor:
+        cache.tags = CompressedTags()
+        cache.compressor = compressor()
+
+
+def decompression_latency(compressor, block_size):
+    """Upper bound of the cycles to decompress one block, as gem5's
+    compressors model it: the block's chunks at decomp_chunks_per_cycle plus
+    decomp_extra_latency. A multi-compressor such as BDI adds its own extra
+    latency to the sub-compressor whose encoding the block uses; without
+    per-encoding stats the slowest one is assumed (exact for single
+    compressors). Returns 0 without a compressor."""
+    if compressor is None:
+        return 0
+    subs = getattr(compressor, "compressors", None)
+    if subs:
+        return int(compressor.decomp_extra_latency) + max(
+            decompression_latency(sub, block_size) for sub in subs)
+    chunks = block_size * 8 / int(compressor.chunk_size_bits)
+    return (math.ceil(chunks / int(compressor.decomp_chunks_per_cycle)) +
+            int(compressor.decomp_extra_latency))
+
+
+def cache_storage_kib(size, assoc, block_size, compressed=False,
+                      max_compression_ratio=2):
+    """Data plus tag storage of a cache in KiB (size in bytes), the area
+    proxy of the compressed vs uncompressed L2 comparison"""
+    blocks = size // block_size
+    sets = blocks // assoc
+    tag_bits = (PHYS_ADDR_BITS - int(math.log2(sets)) -
+                int(math.log2(block_size)) + TAG_STATE_BITS)
+    tags_per_block = 1
+    if compressed:
+        tag_bits += int(math.log2(block_size)) + 1
+        tags_per_block = max_compression_ratio
+    return (size * 8 + blocks * tags_per_block * tag_bits) / 8 / 1024
+
 
 class L1Cache(Cache):
     """Configurable L1 Cache with command-line options"""
@@ -63,6 +205,18 @@ class L1Cache(Cache):
         "--cache_line_size",
         help="Cache line/block size in bytes. Default: 64"
     )
+    SimpleOpts.add_option(
+        "--l1_repl",
+        choices=sorted(REPLACEMENT_POLICIES),
+        help="L1 I/D replacement policy. Default: lru"
+    )
+    add_timing_options("l1", {
+        "tag_latency": tag_latency,
+        "data_latency": data_latency,
+        "response_latency": response_latency,
+        "mshrs": mshrs,
+        "tgts_per_mshr": tgts_per_mshr,
+    })
 
     def __init__(self, options=None):
         super().__init__()
@@ -71,6 +225,13 @@ class L1Cache(Cache):
             if hasattr(options, 'l1_assoc') and options.l1_assoc:
                 self.assoc = int(options.l1_assoc)
 
+            # Set replacement policy if specified
+            if hasattr(options, 'l1_repl') and options.l1_repl:
+                self.replacement_policy = make_replacement_policy(options.l1_repl)
+
+            # Set latencies and MSHRs if specified
+            apply_timing_options(self, options, "l1")
+
     def connectBus(self, bus):
         """Connect this cache to a memory-side bus"""
         self.mem_side = bus.cpu_side_ports
@@ -91,11 +252,18 @@ class L1ICache(L1Cache):
         "--l1i_size", 
         help=f"L1 instruction cache size. Default: {size}"
     )
+    SimpleOpts.add_option(
+        "--l1i_prefetcher",
+        choices=sorted(PREFETCHERS),
+        help="L1 instruction cache prefetcher. Default: none"
+    )
 
     def __init__(self, opts=None):
         super().__init__(opts)
         if opts and hasattr(opts, 'l1i_size') and opts.l1i_size:
             self.size = opts.l1i_size
+        if opts and hasattr(opts, 'l1i_prefetcher') and opts.l1i_prefetcher:
+            self.prefetcher = make_prefetcher(opts.l1i_prefetcher)
 
     def connectCPU(self, cpu):
         """Connect this cache's port to a CPU icache port"""
@@ -112,11 +280,18 @@ class L1DCache(L1Cache):
         "--l1d_size", 
         help=f"L1 data cache size. Default: {size}"
     )
+    SimpleOpts.add_option(
+        "--l1d_prefetcher",
+        choices=sorted(PREFETCHERS),
+        help="L1 data cache prefetcher. Default: none"
+    )
 
     def __init__(self, opts=None):
         super().__init__(opts)
         if opts and hasattr(opts, 'l1d_size') and opts.l1d_size:
             self.size = opts.l1d_size
+        if opts and hasattr(opts, 'l1d_prefetcher') and opts.l1d_prefetcher:
+            self.prefetcher = make_prefetcher(opts.l1d_prefetcher)
 
     def connectCPU(self, cpu):
         """Connect this cache's port to a CPU dcache port"""
@@ -144,6 +319,28 @@ class L2Cache(Cache):
         "--l2_assoc", 
         help=f"L2 cache associativity. Default: {assoc}"
     )
+    SimpleOpts.add_option(
+        "--l2_repl",
+        choices=sorted(REPLACEMENT_POLICIES),
+        help="L2 cache replacement policy. Default: lru"
+    )
+    SimpleOpts.add_option(
+        "--l2_prefetcher",
+        choices=sorted(PREFETCHERS),
+        help="L2 cache prefetcher. Default: none"
+    )
+    SimpleOpts.add_option(
+        "--l2_compressor",
+        choices=sorted(COMPRESSORS),
+        help="L2 cache compressor (compressed tags). Default: none"
+    )
+    add_timing_options("l2", {
+        "tag_latency": tag_latency,
+        "data_latency": data_latency,
+        "response_latency": response_latency,
+        "mshrs": mshrs,
+        "tgts_per_mshr": tgts_per_mshr,
+    })
 
     def __init__(self, opts=None):
         super().__init__()
@@ -156,8 +353,88 @@ class L2Cache(Cache):
             if hasattr(opts, 'l2_assoc') and opts.l2_assoc:
                 self.assoc = int(opts.l2_assoc)
 
+            # Set replacement policy and prefetcher if specified
+            if hasattr(opts, 'l2_repl') and opts.l2_repl:
+                self.replacement_policy = make_replacement_policy(opts.l2_repl)
+            if hasattr(opts, 'l2_prefetcher') and opts.l2_prefetcher:
+                self.prefetcher = make_prefetcher(opts.l2_prefetcher)
+
+            # Set compressed tags and compressor if specified
+            if hasattr(opts, 'l2_compressor') and opts.l2_compressor:
+                apply_compressor(self, opts.l2_compressor)
+
+            # Set latencies and MSHRs if specified
+            apply_timing_options(self, opts, "l2")
+
+    def connectCPUSideBus(self, bus):
+        self.cpu_side = bus.mem_side_ports
+
+    def connectMemSideBus(self, bus):
+        self.mem_side = bus.cpu_side_ports
+
+
+class L3Cache(Cache):
+    """Configurable shared last-level cache (present only with --l3_size)"""
+
+    # Default parameters
+    size = "2MiB"
+    assoc = 16
+    tag_latency = 40
+    data_latency = 40
+    response_latency = 40
+    mshrs = 32
+    tgts_per_mshr = 12
+
+    # Add command-line options for L3 cache parameters
+    SimpleOpts.add_option(
+        "--l3_size",
+        help=f"L3 cache size; adds an L3 behind the L2. Default: no L3 "
+             f"({size} if only other --l3_* options are given)"
+    )
+    SimpleOpts.add_option(
+        "--l3_assoc",
+        help=f"L3 cache associativity. Default: {assoc}"
+    )
+    SimpleOpts.add_option(
+        "--l3_policy",
+        choices=sorted(INCLUSION_POLICIES),
+        help="L3 inclusion policy (classic caches cannot back-invalidate, "
+             "so there is no strictly inclusive L3). Default: nine"
+    )
+    add_timing_options("l3", {
+        "tag_latency": tag_latency,
+        "data_latency": data_latency,
+        "response_latency": response_latency,
+        "mshrs": mshrs,
+        "tgts_per_mshr": tgts_per_mshr,
+    })
+
+    def __init__(self, opts=None):
+        super().__init__()
+        if opts:
+            # Set size if specified
+            if hasattr(opts, 'l3_size') and opts.l3_size:
+                self.size = opts.l3_size
+
+            # Set associativity if specified
+            if hasattr(opts, 'l3_assoc') and opts.l3_assoc:
+                self.assoc = int(opts.l3_assoc)
+
+            # Set the inclusion policy if specified
+            if hasattr(opts, 'l3_policy') and opts.l3_policy:
+                self.clusivity = INCLUSION_POLICIES[opts.l3_policy][0]
+
+            # Set latencies and MSHRs if specified
+            apply_timing_options(self, opts, "l3")
+
     def connectCPUSideBus(self, bus):
         self.cpu_side = bus.mem_side_ports
 
     def connectMemSideBus(self, bus):
         self.mem_side = bus.cpu_side_ports
+
+
+def l3_enabled(opts):
+    """True if any --l3_* option asks for an L3 cache"""
+    return any(value for name, value in vars(opts).items()
+               if name.startswith("l3_"))
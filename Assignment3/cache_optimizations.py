@@ -6,6 +6,8 @@ This script tests various cache parameter combinations:
 - Cache sizes: 8KB, 16KB, 32KB, 64KB
 - Associativity: 1 (direct-mapped), 2, 4, 8, fully associative
 - Block sizes: 16B, 32B, 64B, 128B
+Cache latencies and MSHRs can be overridden with --l1_*/--l2_* options
+(e.g. --l1_mshrs=8), and every run reports memory-level parallelism.
 """
 
 import m5
@@ -13,6 +15,8 @@ from m5.objects import *
 import sys
 import os
 
+from cache_stats import mlp_metrics, print_mlp_metrics, read_final_stats
+
 base_folder = os.path.dirname(os.path.abspath(__file__))
 # Define cache classes
 class L1_ICache(Cache):
@@ -36,8 +40,36 @@ class L2Cache(Cache):
     mshrs = 20
     tgts_per_mshr = 12
 
-def create_system(cache_size='16kB', associativity=2, block_size=64):
-    """Create a gem5 system with specified cache parameters."""
+# Latency and MSHR parameters settable per level as --<level>_<param>
+TIMING_PARAMS = ('tag_latency', 'data_latency', 'response_latency',
+                 'mshrs', 'tgts_per_mshr')
+
+def add_timing_arguments(parser):
+    """Add --l1_<param> and --l2_<param> options for every TIMING_PARAMS entry."""
+    for level, cache in (('l1', L1_DCache), ('l2', L2Cache)):
+        for param in TIMING_PARAMS:
+            parser.add_argument(f'--{level}_{param}', type=int, default=None,
+                                help=f'{level.upper()} {param} (default: {getattr(cache, param)})')
+
+def timing_overrides(args, level):
+    """Latency/MSHR parameters given on the command line for one level."""
+    return {param: getattr(args, f'{level}_{param}') for param in TIMING_PARAMS
+            if getattr(args, f'{level}_{param}') is not None}
+
+def timing_columns(timing):
+    """CSV columns with the effective latency/MSHR parameters."""
+    columns = {}
+    for level, cache in (('l1', L1_DCache), ('l2', L2Cache)):
+        for param in TIMING_PARAMS:
+            columns[f'{level}_{param}'] = timing[level].get(param, getattr(cache, param))
+    return columns
+
+def create_system(cache_size='16kB', associativity=2, block_size=64, timing=None):
+    """Create a gem5 system with specified cache parameters.
+    
+    timing maps 'l1'/'l2' to latency/MSHR parameter overrides.
+    """
+    timing = timing or {'l1': {}, 'l2': {}}
     
     system = System()
     
@@ -61,10 +93,10 @@ def create_system(cache_size='16kB', associativity=2, block_size=64):
     
     # Create cache hierarchy with specified parameters
     # L1 Instruction Cache
-    system.cpu.icache = L1_ICache(size=cache_size, assoc=associativity)
+    system.cpu.icache = L1_ICache(size=cache_size, assoc=associativity, **timing['l1'])
     
     # L1 Data Cache
-    system.cpu.dcache = L1_DCache(size=cache_size, assoc=associativity)
+    system.cpu.dcache = L1_DCache(size=cache_size, assoc=associativity, **timing['l1'])
     
     # Connect L1 caches to CPU
     system.cpu.icache.cpu_side = system.cpu.icache_port
@@ -79,7 +111,7 @@ def create_system(cache_size='16kB', associativity=2, block_size=64):
     
     # L2 Cache (scaled proportionally)
     l2_size = f'{int(cache_size.split("k")[0]) * 16}kB'
-    system.l2cache = L2Cache(size=l2_size, assoc=associativity * 4)
+    system.l2cache = L2Cache(size=l2_size, assoc=associativity * 4, **timing['l2'])
     system.l2cache.cpu_side = system.l2bus.mem_side_ports
     system.l2cache.mem_side = system.membus.cpu_side_ports
     
@@ -100,15 +132,19 @@ def create_system(cache_size='16kB', associativity=2, block_size=64):
     
     return system
 
-def run_simulation(config_name, cache_size, associativity, block_size):
+def run_simulation(config_name, cache_size, associativity, block_size, timing=None):
     """Run a simulation with specified cache parameters."""
+    timing = timing or {'l1': {}, 'l2': {}}
     
     print(f"\n{'='*60}")
     print(f"Configuration: {config_name}")
     print(f"Cache Size: {cache_size}, Associativity: {associativity}, Block Size: {block_size}B")
+    for level in ('l1', 'l2'):
+        if timing[level]:
+            print(f"{level.upper()} overrides: {timing[level]}")
     print(f"{'='*60}")
     
-    system = create_system(cache_size, associativity, block_size)
+    system = create_system(cache_size, associativity, block_size, timing)
     
     # Set up workload
     binary_path = 'configs/practice/Assignment3/matrix_benchmark'
@@ -181,12 +217,21 @@ def run_simulation(config_name, cache_size, associativity, block_size):
         'l2_misses': stats.get('l2_misses', 0),
         'l2_hit_rate': l2_hit_rate
     }
+    results.update(timing_columns(timing))
     
     print(f"\nResults for {config_name}:")
     print(f"  L1 I-Cache Hit Rate: {icache_hit_rate:.2f}%")
     print(f"  L1 D-Cache Hit Rate: {dcache_hit_rate:.2f}%")
     print(f"  L2 Cache Hit Rate: {l2_hit_rate:.2f}%")
     
+    # Memory-level parallelism of every level
+    try:
+        mlp = mlp_metrics(read_final_stats(stats_file))
+        print_mlp_metrics(mlp)
+        results.update(mlp)
+    except FileNotFoundError:
+        pass
+    
     return results
 
 if __name__ == '__m5_main__':
@@ -217,12 +262,16 @@ if __name__ == '__m5_main__':
     parser.add_argument('config', nargs='?', default='size_16kB', 
                        choices=list(configurations.keys()),
                        help='Configuration name to run')
+    parser.add_argument('--label', default=None,
+                       help='Result name (default: the configuration name)')
+    add_timing_arguments(parser)
     
     args = parser.parse_args()
-    config_name = args.config
-    cache_size, associativity, block_size = configurations[config_name]
+    config_name = args.label or args.config
+    cache_size, associativity, block_size = configurations[args.config]
+    timing = {level: timing_overrides(args, level) for level in ('l1', 'l2')}
     
-    results = run_simulation(config_name, cache_size, associativity, block_size)
+    results = run_simulation(config_name, cache_size, associativity, block_size, timing)
     
     # Save individual result
     import csv
@@ -233,6 +282,7 @@ if __name__ == '__m5_main__':
                      'icache_hit_rate', 'dcache_hit_rate', 'l2_hit_rate',
                      'icache_hits', 'icache_misses', 'dcache_hits', 'dcache_misses',
                      'l2_hits', 'l2_misses']
+        fieldnames += [key for key in results if key not in fieldnames]
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerow(results)
@@ -0,0 +1,215 @@
+"""
+Statistics helpers shared by the Assignment 3 cache and virtual memory
+experiments.
+
+Reads the final dump of gem5's stats.txt and derives the memory-level
+parallelism (MLP) metrics of every cache level:
+- average outstanding misses: total MSHR miss latency divided by the
+  simulated time (Little's law), i.e. how many misses were in flight on
+  average
+- MSHR-full blocked cycles: cycles the cache refused new requests because
+  every MSHR was busy (no_mshrs) or an MSHR ran out of targets (no_targets)
+
+and the miss rate and average memory access time (AMAT) of every level,
+as well as the bandwidth, latency, row-buffer hit rate and energy of the
+DRAM channels behind them, and for a compressed L2 the compression ratio
+and decompression cost.
+"""
+
+# Cache levels of the Assignment 3 systems: (CSV key prefix, stats path)
+CACHE_LEVELS = [
+    ('l1i', 'system.cpu.icache'),
+    ('l1d', 'system.cpu.dcache'),
+    ('l2', 'system.l2cache'),
+]
+
+# Optional last-level cache (run_baseline_v2.py --l3_size)
+L3_LEVEL = ('l3', 'system.l3cache')
+
+
+def read_final_stats(stats_file):
+    """Return {stat name: value} of the last dump in stats_file."""
+    stats = {}
+
+    with open(stats_file, 'r') as f:
+        for line in f:
+            if line.startswith('---------- Begin Simulation Statistics'):
+                stats = {}
+                continue
+            parts = line.split()
+            if len(parts) < 2 or parts[0].startswith('-'):
+                continue
+            try:
+                stats[parts[0]] = float(parts[1])
+            except ValueError:
+                pass
+
+    return stats
+
+
+def mlp_metrics(stats, levels=CACHE_LEVELS):
+    """Average outstanding misses and MSHR-full blocked cycles per level."""
+    sim_ticks = stats.get('simTicks', 0.0)
+    cycles = stats.get('system.cpu.numCycles', 0.0)
+    results = {}
+
+    for level, path in levels:
+        miss_ticks = stats.get(f'{path}.overallMshrMissLatency::total', 0.0)
+        mshr_blocked = stats.get(f'{path}.blockedCycles::no_mshrs', 0.0)
+        targets_blocked = stats.get(f'{path}.blockedCycles::no_targets', 0.0)
+        results[f'{level}_avg_outstanding_misses'] = (
+            miss_ticks / sim_ticks if sim_ticks > 0 else 0.0)
+        results[f'{level}_mshr_blocked_cycles'] = int(mshr_blocked)
+        results[f'{level}_targets_blocked_cycles'] = int(targets_blocked)
+        results[f'{level}_mshr_blocked_pct'] = (
+            100.0 * mshr_blocked / cycles if cycles > 0 else 0.0)
+
+    return results
+
+
+def print_mlp_metrics(results, levels=CACHE_LEVELS):
+    """Print the MLP metrics of every cache level."""
+    print(f"\n  Memory-Level Parallelism:")
+    print(f"    {'Level':<6}{'Avg outstanding':>17}{'MSHR-full cycles':>18}"
+          f"{'Targets-full cycles':>21}")
+    for level, _ in levels:
+        print(f"    {level.upper():<6}"
+              f"{results[f'{level}_avg_outstanding_misses']:>17.3f}"
+              f"{results[f'{level}_mshr_blocked_cycles']:>11,} "
+              f"({results[f'{level}_mshr_blocked_pct']:5.2f}%)"
+              f"{results[f'{level}_targets_blocked_cycles']:>21,}")
+
+
+def amat_metrics(stats, levels, hit_latencies):
+    """Miss rate and AMAT of every level.
+    
+    hit_latencies maps a level to its hit latency in cycles. A level's AMAT
+    is hit latency + miss rate * average miss latency, where the measured
+    miss latency already includes every level below, so no recursion over
+    the hierarchy is needed. Latencies are reported in ns.
+    """
+    ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+    cycle_ns = stats.get('system.clk_domain.clock', 1000.0) / ticks_per_ns
+    results = {}
+
+    for level, path in levels:
+        accesses = stats.get(f'{path}.overallAccesses::total', 0.0)
+        misses = stats.get(f'{path}.overallMisses::total', 0.0)
+        miss_ticks = stats.get(f'{path}.overallMissLatency::total', 0.0)
+        miss_rate = misses / accesses if accesses > 0 else 0.0
+        miss_ns = miss_ticks / misses / ticks_per_ns if misses > 0 else 0.0
+        hit_ns = hit_latencies[level] * cycle_ns
+        results[f'{level}_miss_rate'] = 100.0 * miss_rate
+        results[f'{level}_avg_miss_latency_ns'] = miss_ns
+        results[f'{level}_amat_ns'] = hit_ns + miss_rate * miss_ns
+
+    return results
+
+
+def print_amat_metrics(results, levels):
+    """Print the miss rate and AMAT of every cache level."""
+    print(f"\n  Per-level Miss Rate and AMAT:")
+    print(f"    {'Level':<6}{'Miss rate':>11}{'Miss latency':>14}{'AMAT':>11}")
+    for level, _ in levels:
+        print(f"    {level.upper():<6}"
+              f"{results[f'{level}_miss_rate']:>10.2f}%"
+              f"{results[f'{level}_avg_miss_latency_ns']:>11.2f} ns"
+              f"{results[f'{level}_amat_ns']:>8.2f} ns")
+
+
+def dram_metrics(stats, ctrl_paths):
+    """Bandwidth, read latency, row-buffer hit rate and energy of the DRAM.
+    
+    Counts are summed over every memory controller (channel) in ctrl_paths;
+    latencies are per read burst and include queueing, in ns.
+    """
+    sim_seconds = stats.get('simSeconds', 0.0)
+    ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+    totals = dict.fromkeys(['bytes', 'read_bursts', 'write_bursts', 'row_hits',
+                            'access_ticks', 'queue_ticks', 'bus_util',
+                            'energy_pj'], 0.0)
+
+    for path in ctrl_paths:
+        dram = f'{path}.dram'
+        totals['bytes'] += (stats.get(f'{dram}.bytesRead::total', 0.0) +
+                            stats.get(f'{dram}.bytesWritten::total', 0.0))
+        totals['read_bursts'] += stats.get(f'{dram}.readBursts', 0.0)
+        totals['write_bursts'] += stats.get(f'{dram}.writeBursts', 0.0)
+        totals['row_hits'] += (stats.get(f'{dram}.readRowHits', 0.0) +
+                               stats.get(f'{dram}.writeRowHits', 0.0))
+        totals['access_ticks'] += stats.get(f'{dram}.totMemAccLat', 0.0)
+        totals['queue_ticks'] += stats.get(f'{dram}.totQLat', 0.0)
+        totals['bus_util'] += stats.get(f'{dram}.busUtil', 0.0)
+        totals['energy_pj'] += sum(
+            value for name, value in stats.items()
+            if name.startswith(f'{dram}.rank') and name.endswith('.totalEnergy'))
+
+    reads = totals['read_bursts']
+    bursts = reads + totals['write_bursts']
+    energy = totals['energy_pj'] * 1e-12
+    return {
+        'dram_bytes': int(totals['bytes']),
+        'dram_bandwidth_gbps': (totals['bytes'] / sim_seconds / 1e9
+                                if sim_seconds > 0 else 0.0),
+        'dram_bus_util': totals['bus_util'] / len(ctrl_paths),
+        'dram_read_latency_ns': (totals['access_ticks'] / reads / ticks_per_ns
+                                 if reads > 0 else 0.0),
+        'dram_queue_latency_ns': (totals['queue_ticks'] / reads / ticks_per_ns
+                                  if reads > 0 else 0.0),
+        'dram_row_hit_rate': 100.0 * totals['row_hits'] / bursts if bursts > 0 else 0.0,
+        'dram_energy_j': energy,
+        'dram_power_w': energy / sim_seconds if sim_seconds > 0 else 0.0,
+    }
+
+
+def print_dram_metrics(results):
+    """Print the DRAM bandwidth, latency, row-buffer and energy figures."""
+    print(f"\n  DRAM:")
+    print(f"    Bandwidth: {results['dram_bandwidth_gbps']:.3f} GB/s "
+          f"({results['dram_bytes']:,} bytes, "
+          f"{results['dram_bus_util']:.2f}% bus utilization)")
+    print(f"    Read Latency: {results['dram_read_latency_ns']:.2f} ns "
+          f"(queueing {results['dram_queue_latency_ns']:.2f} ns)")
+    print(f"    Row-buffer Hit Rate: {results['dram_row_hit_rate']:.2f}%")
+    print(f"    Energy: {results['dram_energy_j'] * 1e6:.2f} uJ "
+          f"({results['dram_power_w'] * 1e3:.2f} mW)")
+
+
+def compression_metrics(stats, cache_path, block_size, decomp_latency):
+    """Compression ratio and decompression cost of a compressed cache.
+    
+    The ratio is the block size over the average compressed size; blocks
+    that did not compress below the compressor's size threshold are stored
+    uncompressed. Every decompression (a read hit on a compressed block)
+    costs at most decomp_latency cycles on top of the hit latency, so the
+    decompression cycles are an upper bound. All zeros for an uncompressed
+    cache.
+    """
+    compressor = f'{cache_path}.compressor'
+    compressions = stats.get(f'{compressor}.compressions', 0.0)
+    size_bits = stats.get(f'{compressor}.compressionSizeBits', 0.0)
+    failed = stats.get(f'{compressor}.failedCompressions', 0.0)
+    decompressions = stats.get(f'{compressor}.decompressions', 0.0)
+    return {
+        'compressions': int(compressions),
+        'compression_ratio': (compressions * block_size * 8 / size_bits
+                              if size_bits > 0 else 0.0),
+        'uncompressed_pct': (100.0 * failed / compressions
+                             if compressions > 0 else 0.0),
+        'decompressions': int(decompressions),
+        'decomp_latency_max_cycles': decomp_latency,
+        'decomp_cycles_max': int(decompressions * decomp_latency),
+        'data_expansions': int(stats.get(f'{cache_path}.dataExpansions', 0.0)),
+    }
+
+
+def print_compression_metrics(results, label):
+    """Print the compression figures of one cache."""
+    print(f"\n  {label} Compression:")
+    print(f"    Compressions: {results['compressions']:,} "
+          f"(ratio {results['compression_ratio']:.3f}, "
+          f"{results['uncompressed_pct']:.2f}% stored uncompressed)")
+    print(f"    Decompressions: {results['decompressions']:,} "
+          f"x <= {results['decomp_latency_max_cycles']} cycles = "
+          f"<= {results['decomp_cycles_max']:,} cycles")
+    print(f"    Data Expansions: {results['data_expansions']:,}")
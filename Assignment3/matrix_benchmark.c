@@ -1,13 +1,41 @@
 /*
  * Matrix multiplication benchmark for cache analysis
  * This program creates memory access patterns that stress different cache parameters
+ *
+ * Usage: matrix_benchmark [--size=N] [--stride=N] [--seed=N] [--iterations=N]
+ *                         [--variant=NAME] [--tile=N]
+ *   --size        matrix dimension N (default: 128, i.e. 128KB per matrix)
+ *   --stride      element stride of the strided access test (default: 8;
+ *                 the repeated iterations use twice this stride)
+ *   --seed        seed of the first random access test (default: 42;
+ *                 the repeated iterations use seed+58, seed+59, ...)
+ *   --iterations  number of repeated iterations (default: 3)
+ *   --variant     matrix multiplication loop nest (default: ijk):
+ *                   ijk         naive, B walked down its columns
+ *                   ikj         row-wise, B and C walked along rows
+ *                   jik         column-outer, A rows reused per column of C
+ *                   tiled       ikj on --tile x --tile blocks
+ *                   transposed  B transposed first, then row-by-row dot
+ *                               products (one extra matrix)
+ *                 All variants add the products of every C element in the
+ *                 same (ascending k) order, so their results are identical.
+ *   --tile        block size of the tiled variant (default: 32)
  */
 
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include <time.h>
+#include <getopt.h>
 
-#define SIZE 128  // 128x128 matrices = 64KB of data (with doubles)
+#define DEFAULT_SIZE 128  // 128x128 matrices = 128KB of data each (with doubles)
+#define DEFAULT_STRIDE 8
+#define DEFAULT_SEED 42
+#define DEFAULT_ITERATIONS 3
+#define DEFAULT_TILE 32
+
+static int tile = DEFAULT_TILE;  // Block size of matrix_multiply_tiled
+static double **bt;              // B transposed (matrix_multiply_transposed)
 
 // Matrix multiplication - cache-unfriendly version (for testing)
 void matrix_multiply_ijk(double **a, double **b, double **c, int n) {
@@ -21,6 +49,93 @@ void matrix_multiply_ijk(double **a, double **b, double **c, int n) {
     }
 }
 
+// Loop interchange: the inner loop walks rows of B and C (unit stride)
+void matrix_multiply_ikj(double **a, double **b, double **c, int n) {
+    for (int i = 0; i < n; i++) {
+        for (int j = 0; j < n; j++) {
+            c[i][j] = 0.0;
+        }
+        for (int k = 0; k < n; k++) {
+            double aik = a[i][k];
+            for (int j = 0; j < n; j++) {
+                c[i][j] += aik * b[k][j];
+            }
+        }
+    }
+}
+
+// Column of C outermost: the same row of A is reused for every column
+void matrix_multiply_jik(double **a, double **b, double **c, int n) {
+    for (int j = 0; j < n; j++) {
+        for (int i = 0; i < n; i++) {
+            c[i][j] = 0.0;
+            for (int k = 0; k < n; k++) {
+                c[i][j] += a[i][k] * b[k][j];
+            }
+        }
+    }
+}
+
+// Cache blocking: ikj on tile x tile blocks, so that a block of B and the
+// rows of C it updates stay cache resident while they are reused
+void matrix_multiply_tiled(double **a, double **b, double **c, int n) {
+    for (int i = 0; i < n; i++) {
+        for (int j = 0; j < n; j++) {
+            c[i][j] = 0.0;
+        }
+    }
+    for (int ii = 0; ii < n; ii += tile) {
+        int i_end = ii + tile < n ? ii + tile : n;
+        for (int kk = 0; kk < n; kk += tile) {
+            int k_end = kk + tile < n ? kk + tile : n;
+            for (int jj = 0; jj < n; jj += tile) {
+                int j_end = jj + tile < n ? jj + tile : n;
+                for (int i = ii; i < i_end; i++) {
+                    for (int k = kk; k < k_end; k++) {
+                        double aik = a[i][k];
+                        for (int j = jj; j < j_end; j++) {
+                            c[i][j] += aik * b[k][j];
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+// Transpose B once per multiplication, then every C element is the dot
+// product of two rows (unit stride for both operands)
+void matrix_multiply_transposed(double **a, double **b, double **c, int n) {
+    for (int i = 0; i < n; i++) {
+        for (int j = 0; j < n; j++) {
+            bt[j][i] = b[i][j];
+        }
+    }
+    for (int i = 0; i < n; i++) {
+        for (int j = 0; j < n; j++) {
+            double sum = 0.0;
+            for (int k = 0; k < n; k++) {
+                sum += a[i][k] * bt[j][k];
+            }
+            c[i][j] = sum;
+        }
+    }
+}
+
+typedef void (*multiply_fn)(double **, double **, double **, int);
+
+static const struct {
+    const char *name;
+    multiply_fn multiply;
+} variants[] = {
+    {"ijk", matrix_multiply_ijk},
+    {"ikj", matrix_multiply_ikj},
+    {"jik", matrix_multiply_jik},
+    {"tiled", matrix_multiply_tiled},
+    {"transposed", matrix_multiply_transposed},
+};
+#define NUM_VARIANTS (int)(sizeof(variants) / sizeof(variants[0]))
+
 // Array sum - simple sequential access
 double array_sum(double *arr, int n) {
     double sum = 0.0;
@@ -50,24 +165,82 @@ double random_access(double *arr, int n, int seed) {
     return sum;
 }
 
-int main() {
+int main(int argc, char **argv) {
+    static const struct option options[] = {
+        {"size",       required_argument, NULL, 'n'},
+        {"stride",     required_argument, NULL, 's'},
+        {"seed",       required_argument, NULL, 'r'},
+        {"iterations", required_argument, NULL, 'i'},
+        {"variant",    required_argument, NULL, 'v'},
+        {"tile",       required_argument, NULL, 't'},
+        {NULL, 0, NULL, 0},
+    };
+    int size = DEFAULT_SIZE;
+    int stride = DEFAULT_STRIDE;
+    int seed = DEFAULT_SEED;
+    int iterations = DEFAULT_ITERATIONS;
+    const char *variant = "ijk";
+    multiply_fn multiply = NULL;
+    int c;
+    
+    while ((c = getopt_long(argc, argv, "", options, NULL)) != -1) {
+        switch (c) {
+          case 'n': size = atoi(optarg); break;
+          case 's': stride = atoi(optarg); break;
+          case 'r': seed = atoi(optarg); break;
+          case 'i': iterations = atoi(optarg); break;
+          case 'v': variant = optarg; break;
+          case 't': tile = atoi(optarg); break;
+          default: return 1;
+        }
+    }
+    if (size < 2 || stride < 1 || iterations < 0) {
+        printf("ERROR: --size must be >= 2, --stride >= 1, --iterations >= 0\n");
+        return 1;
+    }
+    for (int v = 0; v < NUM_VARIANTS; v++) {
+        if (strcmp(variant, variants[v].name) == 0) multiply = variants[v].multiply;
+    }
+    if (!multiply || tile < 1) {
+        printf("ERROR: --variant must be ijk, ikj, jik, tiled or transposed "
+               "and --tile >= 1\n");
+        return 1;
+    }
+    
     printf("Starting cache benchmark...\n");
+    if (argc > 1) {
+        int matrices = multiply == matrix_multiply_transposed ? 5 : 4;
+        printf("Size: %d, stride: %d, seed: %d, iterations: %d "
+               "(working set: %zu bytes)\n", size, stride, seed, iterations,
+               matrices * (size_t)size * size * sizeof(double));
+        printf("Multiply: %s", variant);
+        if (multiply == matrix_multiply_tiled) {
+            printf(" (%dx%d tiles)", tile, tile);
+        }
+        printf("\n");
+    }
     
     // Allocate matrices
-    double **A = (double **)malloc(SIZE * sizeof(double *));
-    double **B = (double **)malloc(SIZE * sizeof(double *));
-    double **C = (double **)malloc(SIZE * sizeof(double *));
+    double **A = (double **)malloc(size * sizeof(double *));
+    double **B = (double **)malloc(size * sizeof(double *));
+    double **C = (double **)malloc(size * sizeof(double *));
     
-    for (int i = 0; i < SIZE; i++) {
-        A[i] = (double *)malloc(SIZE * sizeof(double));
-        B[i] = (double *)malloc(SIZE * sizeof(double));
-        C[i] = (double *)malloc(SIZE * sizeof(double));
+    for (int i = 0; i < size; i++) {
+        A[i] = (double *)malloc(size * sizeof(double));
+        B[i] = (double *)malloc(size * sizeof(double));
+        C[i] = (double *)malloc(size * sizeof(double));
+    }
+    if (multiply == matrix_multiply_transposed) {
+        bt = (double **)malloc(size * sizeof(double *));
+        for (int i = 0; i < size; i++) {
+            bt[i] = (double *)malloc(size * sizeof(double));
+        }
     }
     
     // Initialize matrices
-    printf("Initializing matrices (%dx%d)...\n", SIZE, SIZE);
-    for (int i = 0; i < SIZE; i++) {
-        for (int j = 0; j < SIZE; j++) {
+    printf("Initializing matrices (%dx%d)...\n", size, size);
+    for (int i = 0; i < size; i++) {
+        for (int j = 0; j < size; j++) {
             A[i][j] = (double)(i + j);
             B[i][j] = (double)(i - j);
             C[i][j] = 0.0;
@@ -76,44 +249,45 @@ int main() {
     
     // Test 1: Matrix multiplication (stresses all cache levels)
     printf("Running matrix multiplication...\n");
-    matrix_multiply_ijk(A, B, C, SIZE);
+    multiply(A, B, C, size);
     printf("Matrix multiply result[0][0] = %f\n", C[0][0]);
     
     // Test 2: Sequential array access
-    double *large_array = (double *)malloc(SIZE * SIZE * sizeof(double));
-    for (int i = 0; i < SIZE * SIZE; i++) {
+    double *large_array = (double *)malloc(size * size * sizeof(double));
+    for (int i = 0; i < size * size; i++) {
         large_array[i] = (double)i * 1.5;
     }
     
     printf("Running sequential access test...\n");
-    double sum1 = array_sum(large_array, SIZE * SIZE);
+    double sum1 = array_sum(large_array, size * size);
     printf("Sequential sum = %f\n", sum1);
     
     // Test 3: Strided access (tests block size impact)
     printf("Running strided access test...\n");
-    double sum2 = strided_access(large_array, SIZE * SIZE, 8);
-    printf("Strided sum (stride=8) = %f\n", sum2);
+    double sum2 = strided_access(large_array, size * size, stride);
+    printf("Strided sum (stride=%d) = %f\n", stride, sum2);
     
     // Test 4: Random access (tests associativity)
     printf("Running random access test...\n");
-    double sum3 = random_access(large_array, SIZE * SIZE, 42);
+    double sum3 = random_access(large_array, size * size, seed);
     printf("Random sum = %f\n", sum3);
     
     // Multiple iterations to generate more cache activity
     printf("Running repeated iterations...\n");
-    for (int iter = 0; iter < 3; iter++) {
-        matrix_multiply_ijk(A, B, C, SIZE);
-        sum1 = array_sum(large_array, SIZE * SIZE);
-        sum2 = strided_access(large_array, SIZE * SIZE, 16);
-        sum3 = random_access(large_array, SIZE * SIZE, iter + 100);
+    for (int iter = 0; iter < iterations; iter++) {
+        multiply(A, B, C, size);
+        sum1 = array_sum(large_array, size * size);
+        sum2 = strided_access(large_array, size * size, 2 * stride);
+        sum3 = random_access(large_array, size * size, seed + 58 + iter);
     }
     
+    int mid = size / 2 - 1;
     printf("Benchmark complete!\n");
-    printf("Final results: matrix[63][63]=%f, sums=%f,%f,%f\n", 
-           C[63][63], sum1, sum2, sum3);
+    printf("Final results: matrix[%d][%d]=%f, sums=%f,%f,%f\n", 
+           mid, mid, C[mid][mid], sum1, sum2, sum3);
     
     // Cleanup
-    for (int i = 0; i < SIZE; i++) {
+    for (int i = 0; i < size; i++) {
         free(A[i]);
         free(B[i]);
         free(C[i]);
@@ -121,6 +295,12 @@ int main() {
     free(A);
     free(B);
     free(C);
+    if (bt) {
+        for (int i = 0; i < size; i++) {
+            free(bt[i]);
+        }
+        free(bt);
+    }
     free(large_array);
     
     return 0;
@@ -9,16 +9,177 @@ import m5
 from m5.objects import *
 import sys
 import os
+import math
 import argparse
 
 # Import cache classes from baseline_v2
 import baseline_v2
-from baseline_v2 import L1ICache, L1DCache, L2Cache
+from baseline_v2 import (L1ICache, L1DCache, L2Cache, L3Cache, TIMING_PARAMS,
+                         INCLUSION_POLICIES, l3_enabled, decompression_latency,
+                         cache_storage_kib)
+from cache_stats import (CACHE_LEVELS, L3_LEVEL, mlp_metrics, print_mlp_metrics,
+                         amat_metrics, print_amat_metrics, dram_metrics,
+                         print_dram_metrics, compression_metrics,
+                         print_compression_metrics, read_final_stats)
+from m5.util.convert import toMemorySize
 
 # Add the common scripts to our path
 m5.util.addToPath("../../")
 from common import SimpleOpts
 
+# Workload defaults (must match matrix_benchmark.c)
+DEFAULT_MATRIX_SIZE = 128
+DEFAULT_STRIDE = 8
+DEFAULT_SEED = 42
+DEFAULT_ITERATIONS = 3
+DEFAULT_TILE = 32
+
+# Matrix multiplication loop nests of matrix_benchmark --variant
+MATRIX_VARIANTS = ['ijk', 'ikj', 'jik', 'tiled', 'transposed']
+
+# Workload options passed through to matrix_benchmark: (option, flag)
+WORKLOAD_OPTIONS = [
+    ('matrix_size', 'size'),
+    ('stride', 'stride'),
+    ('seed', 'seed'),
+    ('iterations', 'iterations'),
+    ('matrix_variant', 'variant'),
+    ('tile_size', 'tile'),
+]
+
+# Cache levels that may have a prefetcher: (CSV/stat key prefix, stats path)
+PREFETCH_LEVELS = [
+    ('l1i', 'system.cpu.icache'),
+    ('l1d', 'system.cpu.dcache'),
+    ('l2', 'system.l2cache'),
+]
+
+# Prefetcher statistics to collect: stats.txt name -> stats dict key
+PREFETCH_STATS = {}
+for level, path in PREFETCH_LEVELS:
+    PREFETCH_STATS[f'{path}.prefetcher.pfIssued'] = f'{level}_pf_issued'
+    PREFETCH_STATS[f'{path}.prefetcher.pfUseful'] = f'{level}_pf_useful'
+    PREFETCH_STATS[f'{path}.demandMisses::total'] = f'{level}_demand_misses'
+
+# DRAM technologies selectable with --mem_type
+# (see src/mem/DRAMInterface.py; gem5 has no LPDDR4 model, LPDDR3 is the
+# closest low-power part before LPDDR5)
+DRAM_TYPES = {
+    'ddr3': DDR3_1600_8x8,
+    'ddr4': DDR4_2400_8x8,
+    'lpddr3': LPDDR3_1600_1x32,
+    'lpddr5': LPDDR5_6400_1x16_BG_BL32,
+    'hbm': HBM_1000_4H_1x128,
+}
+PAGE_POLICIES = ['open', 'open_adaptive', 'close', 'close_adaptive']
+SCHED_POLICIES = ['frfcfs', 'fcfs']
+
+def option_or(opts, name, default):
+    """Value of a command-line option, or its default if not given."""
+    value = getattr(opts, name, None)
+    return default if value is None else value
+
+def cache_levels(opts):
+    """(key, stats path) of every cache level in the simulated hierarchy."""
+    return CACHE_LEVELS + ([L3_LEVEL] if l3_enabled(opts) else [])
+
+def mem_channels(opts):
+    """Number of memory channels (one memory controller each)."""
+    return int(option_or(opts, 'mem_channels', 1))
+
+def mem_ctrl_paths(opts):
+    """Stats path of every memory controller."""
+    if mem_channels(opts) == 1:
+        return ['system.mem_ctrl']
+    return [f'system.mem_ctrl{i}' for i in range(mem_channels(opts))]
+
+def hit_latencies(opts):
+    """Hit latency in cycles of every level: tags and data are looked up in
+    parallel, so a hit costs the larger of the two latencies."""
+    latencies = {}
+    for level, cache in (('l1i', L1ICache), ('l1d', L1DCache),
+                         ('l2', L2Cache), ('l3', L3Cache)):
+        prefix = 'l1' if level.startswith('l1') else level
+        latencies[level] = max(
+            int(option_or(opts, f'{prefix}_tag_latency', cache.tag_latency)),
+            int(option_or(opts, f'{prefix}_data_latency', cache.data_latency)))
+    return latencies
+
+def line_size(opts):
+    """Cache line size in bytes."""
+    return int(option_or(opts, 'cache_line_size', 64))
+
+def l2_compressed(opts):
+    """True if --l2_compressor gives the L2 compressed tags."""
+    return option_or(opts, 'l2_compressor', 'none') != 'none'
+
+def l2_storage_kib(opts):
+    """Data + tag storage of the L2 in KiB, to compare compressed and
+    uncompressed L2s of equal area."""
+    # L2Cache.size is a ParamValue, not the size string toMemorySize expects
+    return cache_storage_kib(toMemorySize(option_or(opts, 'l2_size', '256KiB')),
+                             int(option_or(opts, 'l2_assoc', L2Cache.assoc)),
+                             line_size(opts), l2_compressed(opts))
+
+def prefetch_metrics(stats, level):
+    """Prefetch accuracy and coverage of one cache level.
+    
+    Accuracy is the fraction of issued prefetches that were later hit by a
+    demand access; coverage is the fraction of would-be demand misses that
+    a prefetch turned into hits.
+    """
+    issued = stats.get(f'{level}_pf_issued', 0)
+    useful = stats.get(f'{level}_pf_useful', 0)
+    misses = stats.get(f'{level}_demand_misses', 0)
+    accuracy = useful / issued * 100 if issued > 0 else 0
+    coverage = useful / (useful + misses) * 100 if useful + misses > 0 else 0
+    return issued, accuracy, coverage
+
+def workload_args(opts):
+    """Build the matrix_benchmark problem-size arguments from command line."""
+    args = []
+    for name, flag in WORKLOAD_OPTIONS:
+        value = option_or(opts, name, None)
+        if value is not None:
+            args.append(f'--{flag}={value}')
+    return args
+
+def matrix_working_set(opts):
+    """Bytes touched by matrix_benchmark: A, B, C and the large array (and
+    B transposed for the transposed variant)."""
+    size = int(option_or(opts, 'matrix_size', DEFAULT_MATRIX_SIZE))
+    matrices = 5 if option_or(opts, 'matrix_variant', 'ijk') == 'transposed' else 4
+    return matrices * size * size * 8
+
+def create_memory_controllers(system, opts):
+    """Memory controllers for --mem_type/--mem_channels/--page_policy/--mem_sched.
+    
+    With several channels the address range is interleaved across them at
+    --mem_intlv_size granularity (like configs/common/MemConfig.py), so that
+    consecutive blocks go to different channels.
+    """
+    channels = mem_channels(opts)
+    intlv_bits = int(math.log2(channels))
+    intlv_low_bit = int(math.log2(int(option_or(opts, 'mem_intlv_size', 64))))
+    mem_range = system.mem_ranges[0]
+    
+    ctrls = []
+    for i in range(channels):
+        ctrl = MemCtrl()
+        ctrl.dram = DRAM_TYPES[option_or(opts, 'mem_type', 'ddr3')]()
+        if channels > 1:
+            ctrl.dram.range = AddrRange(mem_range.start, size=mem_range.size(),
+                                        intlvHighBit=intlv_low_bit + intlv_bits - 1,
+                                        intlvBits=intlv_bits, intlvMatch=i)
+        else:
+            ctrl.dram.range = mem_range
+        if hasattr(opts, 'page_policy') and opts.page_policy:
+            ctrl.dram.page_policy = opts.page_policy
+        if hasattr(opts, 'mem_sched') and opts.mem_sched:
+            ctrl.mem_sched_policy = opts.mem_sched
+        ctrls.append(ctrl)
+    return ctrls
+
 def create_system(opts):
     """Create a gem5 system with specified cache parameters from command line."""
     
@@ -62,13 +223,26 @@ def create_system(opts):
     # L2 Cache
     system.l2cache = L2Cache(opts)
     system.l2cache.cpu_side = system.l2bus.mem_side_ports
-    system.l2cache.mem_side = system.membus.cpu_side_ports
     
-    # Create memory controller
-    system.mem_ctrl = MemCtrl()
-    system.mem_ctrl.dram = DDR3_1600_8x8()
-    system.mem_ctrl.dram.range = system.mem_ranges[0]
-    system.mem_ctrl.port = system.membus.mem_side_ports
+    # Optional L3 (last-level) cache between the L2 and the memory bus
+    if l3_enabled(opts):
+        system.l3bus = L2XBar()
+        system.l2cache.connectMemSideBus(system.l3bus)
+        
+        system.l3cache = L3Cache(opts)
+        system.l3cache.connectCPUSideBus(system.l3bus)
+        system.l3cache.connectMemSideBus(system.membus)
+        
+        # An exclusive L3 is only filled by L2 evictions, clean ones included
+        policy = option_or(opts, 'l3_policy', 'nine')
+        system.l2cache.writeback_clean = INCLUSION_POLICIES[policy][1]
+    else:
+        system.l2cache.mem_side = system.membus.cpu_side_ports
+    
+    # Create one memory controller per channel
+    system.mem_ctrl = create_memory_controllers(system, opts)
+    for mem_ctrl in system.mem_ctrl:
+        mem_ctrl.port = system.membus.mem_side_ports
     
     # Connect system port to memory bus
     system.system_port = system.membus.cpu_side_ports
@@ -103,6 +277,13 @@ def run_simulation(opts):
     else:
         print(f"  L2 Cache Size: 256KiB (default)")
     
+    if l3_enabled(opts):
+        print(f"  L3 Cache: {option_or(opts, 'l3_size', L3Cache.size)}, "
+              f"{option_or(opts, 'l3_assoc', L3Cache.assoc)}-way, "
+              f"{option_or(opts, 'l3_policy', 'nine')}")
+    else:
+        print(f"  L3 Cache: none (default)")
+    
     if hasattr(opts, 'l1_assoc') and opts.l1_assoc:
         print(f"  L1 Associativity: {opts.l1_assoc}")
     else:
@@ -117,10 +298,35 @@ def run_simulation(opts):
         print(f"  Cache Line Size: {opts.cache_line_size} bytes")
     else:
         print(f"  Cache Line Size: 64 bytes (default)")
+    
+    print(f"  Replacement Policy: L1 {option_or(opts, 'l1_repl', 'lru')}, "
+          f"L2 {option_or(opts, 'l2_repl', 'lru')}")
+    print(f"  L2 Compressor: {option_or(opts, 'l2_compressor', 'none')} "
+          f"(storage {l2_storage_kib(opts):.1f} KiB data + tags)")
+    print(f"  Prefetchers: L1I {option_or(opts, 'l1i_prefetcher', 'none')}, "
+          f"L1D {option_or(opts, 'l1d_prefetcher', 'none')}, "
+          f"L2 {option_or(opts, 'l2_prefetcher', 'none')}")
+    for level, cache in (('l1', L1ICache), ('l2', L2Cache), ('l3', L3Cache)):
+        if level == 'l3' and not l3_enabled(opts):
+            continue
+        timing = ', '.join(f"{param}={option_or(opts, f'{level}_{param}', getattr(cache, param))}"
+                           for param in TIMING_PARAMS)
+        print(f"  {level.upper()} Timing/MSHRs: {timing}")
+    
+    print(f"  Memory: {option_or(opts, 'mem_type', 'ddr3')} x {mem_channels(opts)} "
+          f"channel(s), page policy {option_or(opts, 'page_policy', 'open_adaptive')}, "
+          f"scheduler {option_or(opts, 'mem_sched', 'frfcfs')}")
+    
+    print(f"  Workload Arguments: {' '.join(workload_args(opts)) or '(defaults)'}")
+    print(f"  Working Set: {matrix_working_set(opts):,} bytes")
     print(f"{'='*70}\n")
     
     system = create_system(opts)
     
+    # Cycles a compressed L2 adds to a hit on a compressed block
+    decomp_latency = (decompression_latency(system.l2cache.compressor, line_size(opts))
+                      if l2_compressed(opts) else 0)
+    
     # Set up workload
     binary_path = opts.binary if hasattr(opts, 'binary') and opts.binary else 'configs/practice/Assignment3/matrix_benchmark'
     
@@ -134,7 +340,7 @@ def run_simulation(opts):
     
     # Create process
     process = Process()
-    process.cmd = [binary_path]
+    process.cmd = [binary_path] + workload_args(opts)
     system.cpu.workload = process
     system.cpu.createThreads()
     
@@ -156,10 +362,14 @@ def run_simulation(opts):
     m5.stats.dump()
     
     # Parse and display statistics
-    parse_and_display_stats(opts)
+    parse_and_display_stats(opts, decomp_latency)
 
-def parse_and_display_stats(opts):
-    """Parse statistics from m5out/stats.txt and display results."""
+def parse_and_display_stats(opts, decomp_latency=0):
+    """Parse statistics from m5out/stats.txt and display results.
+    
+    decomp_latency is the upper bound of the L2 decompression latency in
+    cycles (0 for an uncompressed L2).
+    """
     
     stats_file = 'm5out/stats.txt'
     stats = {}
@@ -189,6 +399,14 @@ def parse_and_display_stats(opts):
                     stats['l2_hits'] = int(line.split()[1])
                 elif 'system.l2cache.overallMisses::total' in line:
                     stats['l2_misses'] = int(line.split()[1])
+                elif 'system.l3cache.overallHits::total' in line:
+                    stats['l3_hits'] = int(line.split()[1])
+                elif 'system.l3cache.overallMisses::total' in line:
+                    stats['l3_misses'] = int(line.split()[1])
+                else:
+                    parts = line.split()
+                    if len(parts) >= 2 and parts[0] in PREFETCH_STATS:
+                        stats[PREFETCH_STATS[parts[0]]] = float(parts[1])
     except FileNotFoundError:
         print(f"Warning: Could not find {stats_file}")
         return
@@ -203,6 +421,9 @@ def parse_and_display_stats(opts):
     l2_total = stats.get('l2_hits', 0) + stats.get('l2_misses', 0)
     l2_hit_rate = (stats.get('l2_hits', 0) / l2_total * 100) if l2_total > 0 else 0
     
+    l3_total = stats.get('l3_hits', 0) + stats.get('l3_misses', 0)
+    l3_hit_rate = (stats.get('l3_hits', 0) / l3_total * 100) if l3_total > 0 else 0
+    
     # Display results
     print(f"\n{'='*70}")
     print(f"Simulation Results:")
@@ -220,15 +441,44 @@ def parse_and_display_stats(opts):
     print(f"    Hits: {stats.get('l2_hits', 0):,}")
     print(f"    Misses: {stats.get('l2_misses', 0):,}")
     print(f"    Hit Rate: {l2_hit_rate:.2f}%")
+    if l3_enabled(opts):
+        print(f"\n  L3 Cache:")
+        print(f"    Hits: {stats.get('l3_hits', 0):,}")
+        print(f"    Misses: {stats.get('l3_misses', 0):,}")
+        print(f"    Hit Rate: {l3_hit_rate:.2f}%")
+    for level, _ in PREFETCH_LEVELS:
+        if option_or(opts, f'{level}_prefetcher', 'none') == 'none':
+            continue
+        issued, accuracy, coverage = prefetch_metrics(stats, level)
+        print(f"\n  {level.upper()} Prefetcher ({getattr(opts, f'{level}_prefetcher')}):")
+        print(f"    Issued: {issued:,.0f}")
+        print(f"    Accuracy: {accuracy:.2f}%")
+        print(f"    Coverage: {coverage:.2f}%")
+    
+    # Memory-level parallelism, miss rate and AMAT of every level
+    final_stats = read_final_stats(stats_file)
+    levels = cache_levels(opts)
+    mlp = mlp_metrics(final_stats, levels)
+    print_mlp_metrics(mlp, levels)
+    amat = amat_metrics(final_stats, levels, hit_latencies(opts))
+    print_amat_metrics(amat, levels)
+    dram = dram_metrics(final_stats, mem_ctrl_paths(opts))
+    print_dram_metrics(dram)
+    compression = compression_metrics(final_stats, 'system.l2cache',
+                                      line_size(opts), decomp_latency)
+    if l2_compressed(opts):
+        print_compression_metrics(compression, 'L2')
     print(f"{'='*70}\n")
     
     # Save results to CSV if config_name specified
     if hasattr(opts, 'config_name') and opts.config_name:
         save_results_csv(opts, stats, sim_ticks, sim_seconds, 
-                        icache_hit_rate, dcache_hit_rate, l2_hit_rate)
+                        icache_hit_rate, dcache_hit_rate, l2_hit_rate, mlp,
+                        l3_hit_rate, amat, dram, compression)
 
 def save_results_csv(opts, stats, sim_ticks, sim_seconds, 
-                     icache_hit_rate, dcache_hit_rate, l2_hit_rate):
+                     icache_hit_rate, dcache_hit_rate, l2_hit_rate, mlp,
+                     l3_hit_rate, amat, dram, compression):
     """Save results to individual CSV file."""
     import csv
     
@@ -251,8 +501,58 @@ def save_results_csv(opts, stats, sim_ticks, sim_seconds,
         'dcache_hit_rate': f'{dcache_hit_rate:.2f}',
         'l2_hits': stats.get('l2_hits', 0),
         'l2_misses': stats.get('l2_misses', 0),
-        'l2_hit_rate': f'{l2_hit_rate:.2f}'
+        'l2_hit_rate': f'{l2_hit_rate:.2f}',
+        'matrix_size': option_or(opts, 'matrix_size', DEFAULT_MATRIX_SIZE),
+        'stride': option_or(opts, 'stride', DEFAULT_STRIDE),
+        'seed': option_or(opts, 'seed', DEFAULT_SEED),
+        'iterations': option_or(opts, 'iterations', DEFAULT_ITERATIONS),
+        'matrix_variant': option_or(opts, 'matrix_variant', 'ijk'),
+        'tile_size': (option_or(opts, 'tile_size', DEFAULT_TILE)
+                      if option_or(opts, 'matrix_variant', 'ijk') == 'tiled' else ''),
+        'working_set_bytes': matrix_working_set(opts),
+        'l1_repl': option_or(opts, 'l1_repl', 'lru'),
+        'l2_repl': option_or(opts, 'l2_repl', 'lru'),
     }
+    for level, _ in PREFETCH_LEVELS:
+        issued, accuracy, coverage = prefetch_metrics(stats, level)
+        results[f'{level}_prefetcher'] = option_or(opts, f'{level}_prefetcher', 'none')
+        results[f'{level}_pf_issued'] = int(issued)
+        results[f'{level}_pf_accuracy'] = f'{accuracy:.2f}'
+        results[f'{level}_pf_coverage'] = f'{coverage:.2f}'
+    for level, cache in (('l1', L1ICache), ('l2', L2Cache)):
+        for param in TIMING_PARAMS:
+            results[f'{level}_{param}'] = option_or(opts, f'{level}_{param}', getattr(cache, param))
+    for key, value in mlp.items():
+        results[key] = f'{value:.3f}' if isinstance(value, float) else value
+    # Keep the columns of runs with and without an L3 aligned
+    for key in mlp_metrics({}, [L3_LEVEL]):
+        results.setdefault(key, '')
+    if l3_enabled(opts):
+        results['l3_size'] = option_or(opts, 'l3_size', L3Cache.size)
+        results['l3_assoc'] = option_or(opts, 'l3_assoc', L3Cache.assoc)
+        results['l3_policy'] = option_or(opts, 'l3_policy', 'nine')
+    else:
+        results['l3_size'] = 'none'
+        results['l3_assoc'] = ''
+        results['l3_policy'] = ''
+    results['l3_hits'] = stats.get('l3_hits', 0)
+    results['l3_misses'] = stats.get('l3_misses', 0)
+    results['l3_hit_rate'] = f'{l3_hit_rate:.2f}'
+    for level, _ in CACHE_LEVELS + [L3_LEVEL]:
+        for metric in ('miss_rate', 'avg_miss_latency_ns', 'amat_ns'):
+            value = amat.get(f'{level}_{metric}')
+            results[f'{level}_{metric}'] = f'{value:.3f}' if value is not None else ''
+    results['mem_type'] = option_or(opts, 'mem_type', 'ddr3')
+    results['mem_channels'] = mem_channels(opts)
+    results['page_policy'] = option_or(opts, 'page_policy', 'open_adaptive')
+    results['mem_sched'] = option_or(opts, 'mem_sched', 'frfcfs')
+    for key, value in dram.items():
+        results[key] = f'{value:.6g}' if isinstance(value, float) else value
+    # Compression figures are zeros for an uncompressed L2
+    results['l2_compressor'] = option_or(opts, 'l2_compressor', 'none')
+    results['l2_storage_kib'] = f'{l2_storage_kib(opts):.1f}'
+    for key, value in compression.items():
+        results[f'l2_{key}'] = f'{value:.3f}' if isinstance(value, float) else value
     
     # Determine output directory and filename
     if hasattr(opts, 'output_dir') and opts.output_dir:
@@ -291,9 +591,67 @@ if __name__ == '__m5_main__':
         help='Output directory for individual result files. Default: configs/practice/Assignment3/results_v2'
     )
     
+    # Workload problem size (passed through to matrix_benchmark)
+    SimpleOpts.add_option(
+        '--matrix_size',
+        help=f'Matrix dimension N passed to the benchmark. Default: {DEFAULT_MATRIX_SIZE}'
+    )
+    SimpleOpts.add_option(
+        '--stride',
+        help=f'Element stride of the strided access test. Default: {DEFAULT_STRIDE}'
+    )
+    SimpleOpts.add_option(
+        '--seed',
+        help=f'Seed of the random access test. Default: {DEFAULT_SEED}'
+    )
+    SimpleOpts.add_option(
+        '--iterations',
+        help=f'Number of repeated iterations. Default: {DEFAULT_ITERATIONS}'
+    )
+    SimpleOpts.add_option(
+        '--matrix_variant',
+        choices=MATRIX_VARIANTS,
+        help='Matrix multiplication loop nest (ijk, ikj, jik, tiled, '
+             'transposed). Default: ijk'
+    )
+    SimpleOpts.add_option(
+        '--tile_size',
+        help=f'Block size of the tiled variant. Default: {DEFAULT_TILE}'
+    )
+    
+    # Main memory
+    SimpleOpts.add_option(
+        '--mem_type',
+        choices=sorted(DRAM_TYPES),
+        help='DRAM technology. Default: ddr3'
+    )
+    SimpleOpts.add_option(
+        '--mem_channels',
+        help='Number of memory channels (power of two), interleaved. Default: 1'
+    )
+    SimpleOpts.add_option(
+        '--mem_intlv_size',
+        help='Channel interleaving granularity in bytes. Default: 64'
+    )
+    SimpleOpts.add_option(
+        '--page_policy',
+        choices=PAGE_POLICIES,
+        help='DRAM row-buffer (page) policy. Default: open_adaptive'
+    )
+    SimpleOpts.add_option(
+        '--mem_sched',
+        choices=SCHED_POLICIES,
+        help='Memory controller scheduling policy. Default: frfcfs'
+    )
+    
     # Parse arguments
     args = SimpleOpts.parse_args()
     
+    channels = mem_channels(args)
+    if channels < 1 or channels & (channels - 1):
+        print(f"Error: --mem_channels must be a power of two (got {channels})")
+        sys.exit(1)
+    
     # Run simulation
     run_simulation(args)
 
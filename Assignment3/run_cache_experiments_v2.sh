@@ -15,11 +15,11 @@ echo "Cache Optimization Experiments - Version 2"
 echo "Using configurable baseline_v2 cache classes"
 echo "======================================================================"
 
-# Step 1: Check if binary exists, if not compile it
+# Step 1: Compile the binary if it is missing or older than its source
 echo ""
 echo "Step 1: Checking/compiling matrix benchmark..."
 echo "----------------------------------------------------------------------"
-if [ ! -f "${BINARY}" ]; then
+if [ ! -f "${BINARY}" ] || [ "${BASE_DIR}/matrix_benchmark.c" -nt "${BINARY}" ]; then
     if [ -f "${BASE_DIR}/matrix_benchmark.c" ]; then
         echo "Compiling matrix_benchmark.c..."
         gcc -O2 -static "${BASE_DIR}/matrix_benchmark.c" -o "${BINARY}" -lm
@@ -29,9 +29,15 @@ if [ ! -f "${BINARY}" ]; then
         exit 1
     fi
 else
-    echo "✓ Binary exists: ${BINARY}"
+    echo "✓ Binary up to date: ${BINARY}"
 fi
 ls -lh "${BINARY}"
+# A binary built before --variant ignores it and SET 13 would run ijk
+# every time
+if ! "${BINARY}" --size=8 --iterations=0 --variant=tiled | grep -q "Multiply: tiled"; then
+    echo "✗ ${BINARY} does not support --variant; rebuild it from matrix_benchmark.c"
+    exit 1
+fi
 
 # Step 2: Create results directory
 echo ""
@@ -61,6 +67,7 @@ run_experiment() {
     local l1_assoc="$5"
     local l2_assoc="$6"
     local cache_line="$7"
+    local extra_opts="${8:-}"  # optional extra run_baseline_v2.py options
     
     total_experiments=$((total_experiments + 1))
     
@@ -69,6 +76,9 @@ run_experiment() {
     echo "----------------------------------------------------------------------"
     echo "  L1I: ${l1i_size}, L1D: ${l1d_size}, L2: ${l2_size}"
     echo "  L1 Assoc: ${l1_assoc}, L2 Assoc: ${l2_assoc}, Block: ${cache_line}B"
+    if [ -n "${extra_opts}" ]; then
+        echo "  Options: ${extra_opts}"
+    fi
     echo ""
     
     if ./build/X86/gem5.opt "${BASE_DIR}/run_baseline_v2.py" \
@@ -80,7 +90,8 @@ run_experiment() {
         --cache_line_size="${cache_line}" \
         --config_name="${name}" \
         --output_dir="${RESULTS_DIR}" \
-        --binary="${BINARY}"; then
+        --binary="${BINARY}" \
+        ${extra_opts}; then
         completed_experiments=$((completed_experiments + 1))
         echo "✓ ${name} completed successfully"
     else
@@ -183,6 +194,146 @@ run_experiment "optimized_1" "32KiB"  "128KiB" "512KiB" 4 16 64
 run_experiment "optimized_2" "32KiB"  "128KiB" "1MiB"   4 16 64
 run_experiment "optimized_3" "64KiB"  "128KiB" "1MiB"   8 16 128
 
+# ======================================================================
+# EXPERIMENT SET 8: REPLACEMENT POLICY VARIATIONS
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 8: Replacement Policy Variations"
+echo "======================================================================"
+
+for repl in plru rrip random; do
+    run_experiment "repl_l1_${repl}" "16KiB" "64KiB" "256KiB" 2 8 64 "--l1_repl=${repl}"
+    run_experiment "repl_l2_${repl}" "16KiB" "64KiB" "256KiB" 2 8 64 "--l2_repl=${repl}"
+done
+
+# ======================================================================
+# EXPERIMENT SET 9: PREFETCHER VARIATIONS
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 9: Prefetcher Variations"
+echo "======================================================================"
+
+for pf in stride tagged bop; do
+    run_experiment "pf_l1d_${pf}" "16KiB" "64KiB" "256KiB" 2 8 64 "--l1d_prefetcher=${pf}"
+    run_experiment "pf_l2_${pf}"  "16KiB" "64KiB" "256KiB" 2 8 64 "--l2_prefetcher=${pf}"
+done
+run_experiment "pf_l1i_tagged" "16KiB" "64KiB" "256KiB" 2 8 64 "--l1i_prefetcher=tagged"
+run_experiment "pf_l1d_stride_l2_bop" "16KiB" "64KiB" "256KiB" 2 8 64 \
+    "--l1d_prefetcher=stride --l2_prefetcher=bop"
+
+# ======================================================================
+# EXPERIMENT SET 10: LATENCY AND MSHR VARIATIONS
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 10: Latency and MSHR Variations"
+echo "======================================================================"
+
+for mshrs in 1 2 8 16; do
+    run_experiment "l1_mshrs_${mshrs}" "16KiB" "64KiB" "256KiB" 2 8 64 "--l1_mshrs=${mshrs}"
+done
+for mshrs in 4 8 32 64; do
+    run_experiment "l2_mshrs_${mshrs}" "16KiB" "64KiB" "256KiB" 2 8 64 "--l2_mshrs=${mshrs}"
+done
+run_experiment "l1_tgts_1" "16KiB" "64KiB" "256KiB" 2 8 64 "--l1_tgts_per_mshr=1"
+for lat in 1 4; do
+    run_experiment "l1_latency_${lat}" "16KiB" "64KiB" "256KiB" 2 8 64 \
+        "--l1_tag_latency=${lat} --l1_data_latency=${lat} --l1_response_latency=${lat}"
+done
+for lat in 10 40; do
+    run_experiment "l2_latency_${lat}" "16KiB" "64KiB" "256KiB" 2 8 64 \
+        "--l2_tag_latency=${lat} --l2_data_latency=${lat} --l2_response_latency=${lat}"
+done
+
+# ======================================================================
+# EXPERIMENT SET 11: L2 SIZE WITH AND WITHOUT A SHARED L3
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 11: L2 Size With and Without an L3"
+echo "======================================================================"
+
+# The runs without an L3 are baseline and the l2_size_* runs of set 3
+for l2 in 128KiB 256KiB 512KiB; do
+    for policy in nine exclusive; do
+        run_experiment "l3_2MiB_${policy}_l2_${l2}" "16KiB" "64KiB" "${l2}" 2 8 64 \
+            "--l3_size=2MiB --l3_policy=${policy}"
+    done
+done
+run_experiment "l3_8MiB_nine" "16KiB" "64KiB" "256KiB" 2 8 64 "--l3_size=8MiB"
+
+# ======================================================================
+# EXPERIMENT SET 12: MAIN MEMORY VARIATIONS
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 12: Main Memory Variations"
+echo "======================================================================"
+
+for mem in ddr4 lpddr3 lpddr5 hbm; do
+    run_experiment "mem_${mem}" "16KiB" "64KiB" "256KiB" 2 8 64 "--mem_type=${mem}"
+done
+for channels in 2 4; do
+    run_experiment "mem_ddr3_${channels}ch" "16KiB" "64KiB" "256KiB" 2 8 64 \
+        "--mem_channels=${channels}"
+done
+run_experiment "mem_close_page" "16KiB" "64KiB" "256KiB" 2 8 64 "--page_policy=close"
+run_experiment "mem_fcfs" "16KiB" "64KiB" "256KiB" 2 8 64 "--mem_sched=fcfs"
+
+# ======================================================================
+# EXPERIMENT SET 13: LOOP ORDER AND CACHE BLOCKING OF THE MULTIPLY
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 13: Loop Order and Cache Blocking"
+echo "======================================================================"
+
+# The ijk runs are baseline and sets 1 and 4; each variant repeats the
+# L1D size and associativity sweeps so the optimal L1D can be compared
+for variant in ikj jik tiled transposed; do
+    run_experiment "mm_${variant}" "16KiB" "64KiB" "256KiB" 2 8 64 \
+        "--matrix_variant=${variant}"
+    for l1d in 8KiB 16KiB 32KiB 128KiB; do
+        run_experiment "mm_${variant}_l1d_${l1d}" "16KiB" "${l1d}" "256KiB" 2 8 64 \
+            "--matrix_variant=${variant}"
+    done
+    for assoc in 1 4 8; do
+        run_experiment "mm_${variant}_l1_assoc_${assoc}" "16KiB" "64KiB" "256KiB" ${assoc} 8 64 \
+            "--matrix_variant=${variant}"
+    done
+done
+# Tile size against a small L1D: 3 tiles of 8 x 8 .. 64 x 64 doubles
+for tile in 8 16 64; do
+    run_experiment "mm_tiled_${tile}_l1d_16KiB" "16KiB" "16KiB" "256KiB" 2 8 64 \
+        "--matrix_variant=tiled --tile_size=${tile}"
+done
+
+# ======================================================================
+# EXPERIMENT SET 14: COMPRESSED L2 AGAINST LARGER UNCOMPRESSED L2s
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 14: Compressed vs Uncompressed L2"
+echo "======================================================================"
+
+# A 256KiB 8-way L2 with compressed tags stores up to twice the blocks.
+# Its data + tag storage (l2_storage_kib) is about that of a 288KiB 9-way
+# L2 (equal area); l2_size_512KB of set 3 is the physically doubled L2.
+for compressor in bdi cpack fpc; do
+    run_experiment "l2_${compressor}" "16KiB" "64KiB" "256KiB" 2 8 64 \
+        "--l2_compressor=${compressor}"
+done
+run_experiment "l2_equal_area_288KiB" "16KiB" "64KiB" "288KiB" 2 9 64
+
 # ======================================================================
 # SUMMARY
 # ======================================================================
@@ -8,8 +8,15 @@ set -e  # Exit on error
 BASE_DIR="configs/practice/Assignment3"
 GEM5_BIN="./build/X86/gem5.opt"
 CONFIG_SCRIPT="${BASE_DIR}/virtual_memory.py"
+BINARY="${BASE_DIR}/matrix_benchmark"
 RESULTS_DIR="${BASE_DIR}/results_v2"
 RESULTS_FILE="${RESULTS_DIR}/all_vm_experiments.csv"
+# ARM full-system runs (SET 4) need an ARM build and a disk image holding
+# the aarch64 matrix_benchmark; 16kB/64kB granules need matching kernels
+ARM_GEM5_BIN="${ARM_GEM5_BIN:-./build/ARM/gem5.opt}"
+ARM_DISK_IMAGE="${ARM_DISK_IMAGE:-}"
+ARM_KERNEL_16K="${ARM_KERNEL_16K:-}"
+ARM_KERNEL_64K="${ARM_KERNEL_64K:-}"
 
 echo "======================================================================"
 echo "Virtual Memory Experiments - Version 2"
@@ -25,11 +32,25 @@ echo "Expected Results:"
 echo "  - Page size experiments will show IDENTICAL results (all use 4KB)"
 echo "  - TLB size experiments SHOULD show DIFFERENT results"
 echo "  - TLB assoc experiments will show IDENTICAL results (all fully assoc)"
+echo "  - Runs identical to an earlier one are not simulated again"
+echo "    (duplicate_of column); SET 4 runs ARM full system where every"
+echo "    parameter is real"
 echo "======================================================================"
 
-# Step 1: Create results directory
+# Step 1: Compile the binary if it is missing or older than its source
 echo ""
-echo "Step 1: Setting up results directory..."
+echo "Step 1: Checking/compiling matrix benchmark..."
+echo "----------------------------------------------------------------------"
+if [ ! -f "${BINARY}" ] || [ "${BASE_DIR}/matrix_benchmark.c" -nt "${BINARY}" ]; then
+    gcc -O2 -static "${BASE_DIR}/matrix_benchmark.c" -o "${BINARY}" -lm
+    echo "✓ Compiled successfully: ${BINARY}"
+else
+    echo "✓ Binary up to date: ${BINARY}"
+fi
+
+# Step 2: Create results directory
+echo ""
+echo "Step 2: Setting up results directory..."
 echo "----------------------------------------------------------------------"
 mkdir -p "${RESULTS_DIR}"
 # Remove old individual VM result files if they exist
@@ -37,9 +58,9 @@ mkdir -p "${RESULTS_DIR}"
 # echo "✓ Cleaned up old VM result files"
 echo "✓ Results will be saved to: ${RESULTS_DIR}"
 
-# Step 2: Run experiments
+# Step 3: Run experiments
 echo ""
-echo "Step 2: Running virtual memory experiments..."
+echo "Step 3: Running virtual memory experiments..."
 echo "======================================================================"
 echo ""
 
@@ -48,16 +69,23 @@ total_experiments=0
 completed_experiments=0
 
 # Function to run an experiment
+# Extra arguments are passed on to virtual_memory.py
 run_vm_experiment() {
     local config_name="$1"
+    shift
+    local gem5_bin="${GEM5_BIN}"
+    
+    if [[ " $* " == *" --isa=arm "* ]]; then
+        gem5_bin="${ARM_GEM5_BIN}"
+    fi
     
     total_experiments=$((total_experiments + 1))
     
     echo ""
-    echo "Experiment ${total_experiments}: ${config_name}"
+    echo "Experiment ${total_experiments}: ${config_name} $*"
     echo "----------------------------------------------------------------------"
     
-    if ${GEM5_BIN} "${CONFIG_SCRIPT}" "${config_name}" > /dev/null 2>&1; then
+    if ${gem5_bin} "${CONFIG_SCRIPT}" "${config_name}" "$@" > /dev/null 2>&1; then
         completed_experiments=$((completed_experiments + 1))
         echo "✓ ${config_name} completed successfully"
     else
@@ -103,6 +131,48 @@ run_vm_experiment "tlb_assoc_2"
 run_vm_experiment "tlb_assoc_4"
 run_vm_experiment "tlb_assoc_8"
 
+# ======================================================================
+# EXPERIMENT SET 4: ARM FULL SYSTEM (granule, TLB assoc, L2 TLB, walker cache)
+# ======================================================================
+echo ""
+echo ""
+echo "======================================================================"
+echo "EXPERIMENT SET 4: ARM Full System (page size and associativity are real)"
+echo "======================================================================"
+
+if [ -n "${ARM_DISK_IMAGE}" ]; then
+    ARM_ARGS=(--isa=arm "--disk_image=${ARM_DISK_IMAGE}")
+    
+    # Translation granules
+    run_vm_experiment "page_4kB" "${ARM_ARGS[@]}" --label=arm_page_4kB
+    if [ -n "${ARM_KERNEL_16K}" ]; then
+        run_vm_experiment "page_16kB" "${ARM_ARGS[@]}" \
+            "--kernel=${ARM_KERNEL_16K}" --label=arm_page_16kB
+    fi
+    if [ -n "${ARM_KERNEL_64K}" ]; then
+        run_vm_experiment "page_64kB" "${ARM_ARGS[@]}" \
+            "--kernel=${ARM_KERNEL_64K}" --label=arm_page_64kB
+    fi
+    
+    # L1 TLB size and associativity
+    for config in tlb_32 tlb_128 tlb_assoc_2 tlb_assoc_4 tlb_assoc_8; do
+        run_vm_experiment "${config}" "${ARM_ARGS[@]}" --label="arm_${config}"
+    done
+    
+    # Shared L2 TLB size and page-walker cache size
+    for entries in 256 512 2048; do
+        run_vm_experiment "page_4kB" "${ARM_ARGS[@]}" --l2_tlb_size=${entries} \
+            --label=arm_l2_tlb_${entries}
+    done
+    for size in 1KiB 4KiB 32KiB; do
+        run_vm_experiment "page_4kB" "${ARM_ARGS[@]}" --walker_cache_size=${size} \
+            --label=arm_walker_${size}
+    done
+else
+    echo "Skipped: set ARM_DISK_IMAGE (and ARM_KERNEL_16K/ARM_KERNEL_64K for"
+    echo "the larger granules) to run the ARM full-system experiments"
+fi
+
 # ======================================================================
 # SUMMARY
 # ======================================================================
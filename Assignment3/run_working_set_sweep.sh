@@ -0,0 +1,102 @@
+#!/bin/bash
+
+# Script to sweep the matrix_benchmark working set with the baseline cache
+# configuration, to show where each cache level stops fitting the data.
+# Working set = 4 * N * N * 8 bytes (matrices A, B, C and the large array)
+
+set -e  # Exit on error
+
+BASE_DIR="configs/practice/Assignment3"
+BINARY="${BASE_DIR}/matrix_benchmark"
+RESULTS_DIR="${BASE_DIR}/results_working_set"
+RESULTS_FILE="${RESULTS_DIR}/all_working_set_experiments.csv"
+
+echo "======================================================================"
+echo "Working-Set Size Sweep"
+echo "Baseline caches: L1I 16KiB, L1D 64KiB, L2 256KiB"
+echo "======================================================================"
+
+# Step 1: Compile the binary if it is missing or older than its source
+echo ""
+echo "Step 1: Checking/compiling matrix benchmark..."
+echo "----------------------------------------------------------------------"
+if [ ! -f "${BINARY}" ] || [ "${BASE_DIR}/matrix_benchmark.c" -nt "${BINARY}" ]; then
+    gcc -O2 -static "${BASE_DIR}/matrix_benchmark.c" -o "${BINARY}" -lm
+    echo "✓ Compiled successfully: ${BINARY}"
+else
+    echo "✓ Binary up to date: ${BINARY}"
+fi
+
+# Step 2: Create results directory
+echo ""
+echo "Step 2: Setting up results directory..."
+echo "----------------------------------------------------------------------"
+mkdir -p "${RESULTS_DIR}"
+rm -f "${RESULTS_DIR}"/*_result.csv
+echo "✓ Results will be saved to: ${RESULTS_DIR}"
+
+# Step 3: Run experiments
+echo ""
+echo "Step 3: Running working-set sweep..."
+echo "======================================================================"
+
+total_experiments=0
+completed_experiments=0
+
+# Matrix dimensions: 8KiB, 32KiB, 72KiB, 128KiB, 288KiB, 512KiB, 1.1MiB, 2MiB
+for size in 16 32 48 64 96 128 192 256; do
+    name="ws_n${size}"
+    total_experiments=$((total_experiments + 1))
+
+    echo ""
+    echo "Experiment ${total_experiments}: ${name} (working set $((4 * size * size * 8)) bytes)"
+    echo "----------------------------------------------------------------------"
+
+    if ./build/X86/gem5.opt "${BASE_DIR}/run_baseline_v2.py" \
+        --l1i_size="16KiB" \
+        --l1d_size="64KiB" \
+        --l2_size="256KiB" \
+        --l1_assoc=2 \
+        --l2_assoc=8 \
+        --cache_line_size=64 \
+        --matrix_size="${size}" \
+        --iterations=1 \
+        --config_name="${name}" \
+        --output_dir="${RESULTS_DIR}" \
+        --binary="${BINARY}"; then
+        completed_experiments=$((completed_experiments + 1))
+        echo "✓ ${name} completed successfully"
+    else
+        echo "✗ ${name} failed"
+    fi
+done
+
+echo ""
+echo "======================================================================"
+echo "Experiments Completed!"
+echo "======================================================================"
+echo "  Total experiments: ${total_experiments}"
+echo "  Completed: ${completed_experiments}"
+echo "  Failed: $((total_experiments - completed_experiments))"
+
+# Combine results
+first_result=$(find "${RESULTS_DIR}" -name "*_result.csv" -type f | head -n 1)
+
+if [ -n "$first_result" ]; then
+    head -1 "$first_result" > "${RESULTS_FILE}"
+    for result_file in "${RESULTS_DIR}"/*_result.csv; do
+        if [ -f "$result_file" ]; then
+            tail -n +2 "$result_file" >> "${RESULTS_FILE}"
+        fi
+    done
+    echo "✓ Combined results saved to: ${RESULTS_FILE}"
+
+    # Column of working_set_bytes, looked up by name in the header
+    ws_column=$(head -n 1 "${RESULTS_FILE}" | tr ',' '\n' | grep -n -x 'working_set_bytes' | cut -d: -f1)
+    echo ""
+    echo "To see hit rates against working set size:"
+    echo "  (head -n 1 ${RESULTS_FILE} && tail -n +2 ${RESULTS_FILE} | sort -t, -k${ws_column},${ws_column} -n) | column -t -s,"
+    echo ""
+else
+    echo "✗ No result files found to combine"
+fi
@@ -3,14 +3,41 @@
 """
 Virtual memory configuration for gem5.
 This script tests different page sizes and TLB configurations.
+Cache latencies and MSHRs can be overridden with --l1_*/--l2_* options
+(e.g. --l2_mshrs=32), and every run reports memory-level parallelism.
+
+--isa=x86 (default) runs in SE mode, where only the TLB size is real.
+--isa=arm boots Linux on an ARM board (see arm_vm.py) so that the page
+size (translation granule), TLB associativity, the shared L2 TLB and the
+page-walker caches take effect. Runs whose effective parameters match an
+earlier result are not simulated again: the earlier result is copied.
+
+Every run reports the page-table walk cost (walks, walk latency
+distribution, walker cache hit rate, share of the simulated time spent
+walking; latencies need --isa=arm, X86 SE mode resolves misses from the
+process page table at no cost) and the TLB reach against the working set
+of matrix_benchmark (--matrix_size).
 """
 
 import m5
 from m5.objects import *
 import sys
 import os
+import csv
+import glob
+
+from cache_stats import mlp_metrics, print_mlp_metrics, read_final_stats
+from m5.util.convert import toMemorySize
 
 base_folder = os.path.dirname(os.path.abspath(__file__))
+
+# matrix_benchmark --size default; A, B, C and the large array are N*N doubles
+DEFAULT_MATRIX_SIZE = 128
+
+def working_set_bytes(matrix_size):
+    """Data footprint of matrix_benchmark for an N x N problem."""
+    return 4 * matrix_size * matrix_size * 8
+
 # Define cache classes
 class L1_ICache(Cache):
     tag_latency = 2
@@ -33,17 +60,78 @@ class L2Cache(Cache):
     mshrs = 20
     tgts_per_mshr = 12
 
-def create_system_with_vm(page_size='4kB', tlb_size=64, tlb_assoc=4):
+# Latency and MSHR parameters settable per level as --<level>_<param>
+TIMING_PARAMS = ('tag_latency', 'data_latency', 'response_latency',
+                 'mshrs', 'tgts_per_mshr')
+
+def add_timing_arguments(parser):
+    """Add --l1_<param> and --l2_<param> options for every TIMING_PARAMS entry."""
+    for level, cache in (('l1', L1_DCache), ('l2', L2Cache)):
+        for param in TIMING_PARAMS:
+            parser.add_argument(f'--{level}_{param}', type=int, default=None,
+                                help=f'{level.upper()} {param} (default: {getattr(cache, param)})')
+
+def timing_overrides(args, level):
+    """Latency/MSHR parameters given on the command line for one level."""
+    return {param: getattr(args, f'{level}_{param}') for param in TIMING_PARAMS
+            if getattr(args, f'{level}_{param}') is not None}
+
+def timing_columns(timing):
+    """CSV columns with the effective latency/MSHR parameters."""
+    columns = {}
+    for level, cache in (('l1', L1_DCache), ('l2', L2Cache)):
+        for param in TIMING_PARAMS:
+            columns[f'{level}_{param}'] = timing[level].get(param, getattr(cache, param))
+    return columns
+
+def effective_params(isa, page_size, tlb_size, tlb_assoc, timing, arm=None,
+                     matrix_size=DEFAULT_MATRIX_SIZE):
+    """Parameters that actually take effect, used to detect duplicate runs.
+    
+    X86 SE mode always uses 4KB pages and fully associative TLBs, so page
+    size and associativity variations collapse onto the same run.
+    """
+    if isa == 'x86':
+        params = {'isa': 'x86', 'eff_page_size': '4kB', 'eff_tlb_size': tlb_size,
+                  'eff_tlb_assoc': 'full', 'l2_tlb_size': '', 'l2_tlb_assoc': '',
+                  'walker_cache_size': '', 'kernel': ''}
+        params.update(timing_columns(timing))
+    else:
+        params = {'isa': 'arm', 'eff_page_size': page_size, 'eff_tlb_size': tlb_size,
+                  'eff_tlb_assoc': tlb_assoc, 'l2_tlb_size': arm['l2_tlb_size'],
+                  'l2_tlb_assoc': arm['l2_tlb_assoc'],
+                  'walker_cache_size': arm['walker_cache_size'],
+                  'kernel': arm['kernel'] or ''}
+        params.update({key: '' for key in timing_columns(timing)})
+    params['matrix_size'] = matrix_size
+    return params
+
+def find_duplicate(result_dir, config_name, effective):
+    """Earlier result (CSV row) of another configuration with identical
+    effective parameters, or None."""
+    for result_file in sorted(glob.glob(os.path.join(result_dir, '*_vm_result.csv'))):
+        with open(result_file, newline='') as f:
+            row = next(csv.DictReader(f), None)
+        if (row and row['config'] != config_name and not row.get('duplicate_of')
+                and all(row.get(key) == str(value) for key, value in effective.items())):
+            return row
+    return None
+
+def create_system_with_vm(page_size='4kB', tlb_size=64, tlb_assoc=4, timing=None):
     """Create a gem5 system with virtual memory enabled.
     
+    timing maps 'l1'/'l2' to cache latency/MSHR parameter overrides.
+    
     IMPORTANT LIMITATIONS FOR X86 IN SE MODE:
     - Page size is HARDCODED to 4KB in X86 architecture (cannot be changed)
     - TLB size CAN be configured (this is done below)
     - TLB associativity is NOT configurable for X86TLB (fully associative by default)
     
-    For full control over page size and TLB parameters, use ARM architecture or FS mode.
+    For full control over page size and TLB parameters, use --isa=arm
+    (full-system ARM board, see arm_vm.py).
     """
     
+    timing = timing or {'l1': {}, 'l2': {}}
     system = System()
     
     # Set up clock domain
@@ -75,8 +163,8 @@ def create_system_with_vm(page_size='4kB', tlb_size=64, tlb_assoc=4):
     system.membus = SystemXBar()
     
     # Create cache hierarchy
-    system.cpu.icache = L1_ICache(size='16kB', assoc=2)
-    system.cpu.dcache = L1_DCache(size='16kB', assoc=2)
+    system.cpu.icache = L1_ICache(size='16kB', assoc=2, **timing['l1'])
+    system.cpu.dcache = L1_DCache(size='16kB', assoc=2, **timing['l1'])
     
     # Connect L1 caches to CPU
     system.cpu.icache.cpu_side = system.cpu.icache_port
@@ -90,7 +178,7 @@ def create_system_with_vm(page_size='4kB', tlb_size=64, tlb_assoc=4):
     system.cpu.dcache.mem_side = system.l2bus.cpu_side_ports
     
     # L2 Cache
-    system.l2cache = L2Cache(size='256kB', assoc=8)
+    system.l2cache = L2Cache(size='256kB', assoc=8, **timing['l2'])
     system.l2cache.cpu_side = system.l2bus.mem_side_ports
     system.l2cache.mem_side = system.membus.cpu_side_ports
     
@@ -111,16 +199,60 @@ def create_system_with_vm(page_size='4kB', tlb_size=64, tlb_assoc=4):
     
     return system
 
-def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc):
-    """Run a simulation with specified virtual memory parameters."""
+def run_arm_vm_simulation(config_name, page_size, tlb_size, tlb_assoc, arm,
+                          matrix_size=DEFAULT_MATRIX_SIZE):
+    """Run the benchmark on the full-system ARM board; returns TLB and
+    page-walk stats."""
+    from arm_vm import (create_arm_board, run_arm_board, arm_tlb_stats,
+                        arm_walk_stats)
+    
+    print(f"\n{'='*60}")
+    print(f"Virtual Memory Configuration: {config_name} (ARM full system)")
+    print(f"Granule: {page_size}, L1 TLBs: {tlb_size} entries {tlb_assoc}-way, "
+          f"L2 TLB: {arm['l2_tlb_size']} entries {arm['l2_tlb_assoc']}-way")
+    print(f"Walker caches: {arm['walker_cache_size']}, "
+          f"Kernel: {arm['kernel'] or 'default ' + page_size + ' kernel'}")
+    print(f"{'='*60}")
+    
+    board = create_arm_board(tlb_size, tlb_assoc, arm['l2_tlb_size'],
+                             arm['l2_tlb_assoc'], arm['walker_cache_size'])
+    run_arm_board(board, page_size, arm['kernel'], arm['disk_image'],
+                  [f'--size={matrix_size}'])
+    
+    stats = read_final_stats(os.path.join(m5.options.outdir, 'stats.txt'))
+    results = arm_tlb_stats(stats)
+    results.update(arm_walk_stats(stats))
+    return results
+
+def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc, timing=None,
+                      arm=None, matrix_size=DEFAULT_MATRIX_SIZE):
+    """Run a simulation with specified virtual memory parameters.
+    
+    arm holds the ARM-only options for --isa=arm, None for X86 SE mode.
+    """
+    timing = timing or {'l1': {}, 'l2': {}}
+    
+    if arm:
+        stats = run_arm_vm_simulation(config_name, page_size, tlb_size,
+                                      tlb_assoc, arm, matrix_size)
+        results = vm_results(config_name, page_size, tlb_size, tlb_assoc, stats,
+                             effective_params('arm', page_size, tlb_size,
+                                              tlb_assoc, timing, arm,
+                                              matrix_size))
+        # No MLP for the stdlib hierarchy; keep the CSV columns aligned
+        results.update({key: '' for key in mlp_metrics({})})
+        return results
     
     print(f"\n{'='*60}")
     print(f"Virtual Memory Configuration: {config_name}")
     print(f"Requested - Page Size: {page_size}, TLB Size: {tlb_size}, TLB Assoc: {tlb_assoc}")
     print(f"X86 Limitations: Page=4KB(fixed), TLB Size={tlb_size}(configurable), Assoc=FA(fixed)")
+    for level in ('l1', 'l2'):
+        if timing[level]:
+            print(f"{level.upper()} overrides: {timing[level]}")
     print(f"{'='*60}")
     
-    system = create_system_with_vm(page_size, tlb_size, tlb_assoc)
+    system = create_system_with_vm(page_size, tlb_size, tlb_assoc, timing)
     
     # Set up workload
     binary_path = 'configs/practice/Assignment3/matrix_benchmark'
@@ -128,7 +260,7 @@ def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc):
     
     # Create process
     process = Process()
-    process.cmd = [binary_path]
+    process.cmd = [binary_path, f'--size={matrix_size}']
     system.cpu.workload = process
     system.cpu.createThreads()
     
@@ -151,7 +283,6 @@ def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc):
         'itlb_misses': 0,
         'dtlb_hits': 0,
         'dtlb_misses': 0,
-        'page_faults': 0
     }
     
     try:
@@ -198,9 +329,29 @@ def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc):
             stats['itlb_hits'] = itlb_accesses - stats['itlb_misses']
             stats['dtlb_hits'] = dtlb_accesses - stats['dtlb_misses']
             
+            # No walker in SE mode: every miss is a (free) page table lookup
+            stats['walks'] = stats['itlb_misses'] + stats['dtlb_misses']
+            
     except FileNotFoundError:
         print(f"Warning: Could not find {stats_file}")
     
+    results = vm_results(config_name, page_size, tlb_size, tlb_assoc, stats,
+                         effective_params('x86', page_size, tlb_size,
+                                          tlb_assoc, timing,
+                                          matrix_size=matrix_size))
+    
+    # Memory-level parallelism of every cache level
+    try:
+        mlp = mlp_metrics(read_final_stats(stats_file))
+        print_mlp_metrics(mlp)
+        results.update(mlp)
+    except FileNotFoundError:
+        pass
+    
+    return results
+
+def vm_results(config_name, page_size, tlb_size, tlb_assoc, stats, effective):
+    """Result row of one run: TLB hit rates plus the effective parameters."""
     # Calculate hit rates
     itlb_total = stats['itlb_hits'] + stats['itlb_misses']
     itlb_hit_rate = (stats['itlb_hits'] / itlb_total * 100) if itlb_total > 0 else 0
@@ -219,16 +370,85 @@ def run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc):
         'dtlb_hits': stats['dtlb_hits'],
         'dtlb_misses': stats['dtlb_misses'],
         'dtlb_hit_rate': dtlb_hit_rate,
-        'page_faults': stats['page_faults']
+        # Faults are handled by the process page table (SE) or the guest
+        # kernel (FS) without a gem5 statistic
+        'page_faults': '',
+        'duplicate_of': '',
     }
+    results.update(effective)
+    results['l2_tlb_hits'] = stats.get('l2_tlb_hits', '')
+    results['l2_tlb_misses'] = stats.get('l2_tlb_misses', '')
     
     print(f"\nResults for {config_name}:")
     print(f"  I-TLB Hit Rate: {itlb_hit_rate:.2f}%")
     print(f"  D-TLB Hit Rate: {dtlb_hit_rate:.2f}%")
-    print(f"  Page Faults: {stats['page_faults']}")
+    if 'l2_tlb_hits' in stats:
+        l2_total = stats['l2_tlb_hits'] + stats['l2_tlb_misses']
+        l2_hit_rate = (stats['l2_tlb_hits'] / l2_total * 100) if l2_total > 0 else 0
+        print(f"  L2 TLB Hit Rate: {l2_hit_rate:.2f}%")
+    
+    results.update(walk_metrics(stats))
+    results.update(reach_metrics(effective))
+    print_walk_metrics(results)
     
     return results
 
+def walk_metrics(stats):
+    """Page-walk count, latency distribution and cost of one run.
+    
+    Latencies, walker cache hit rate and walk time are blank when the
+    simulation does not model walks (X86 SE mode).
+    """
+    results = {'walks': stats.get('walks', 0)}
+    timed = 'walk_ticks' in stats
+    for key in ('walk_latency_mean_ns', 'walk_latency_p50_ns',
+                'walk_latency_p90_ns', 'walk_latency_p99_ns',
+                'walker_cache_hit_rate'):
+        results[key] = stats[key] if timed else ''
+    if timed and stats['sim_ticks'] > 0:
+        results['walk_time_pct'] = 100.0 * stats['walk_ticks'] / stats['sim_ticks']
+    else:
+        results['walk_time_pct'] = ''
+    return results
+
+def reach_metrics(effective):
+    """TLB reach (entries * page size) of the D-TLB and the L2 TLB compared
+    with the working set of matrix_benchmark."""
+    page_bytes = toMemorySize(effective['eff_page_size'])
+    working_set = working_set_bytes(effective['matrix_size'])
+    dtlb_reach = effective['eff_tlb_size'] * page_bytes
+    results = {
+        'working_set_bytes': working_set,
+        'dtlb_reach_bytes': dtlb_reach,
+        'dtlb_reach_coverage': 100.0 * dtlb_reach / working_set,
+        'l2_tlb_reach_bytes': '',
+        'l2_tlb_reach_coverage': '',
+    }
+    if effective['l2_tlb_size'] != '':
+        l2_reach = effective['l2_tlb_size'] * page_bytes
+        results['l2_tlb_reach_bytes'] = l2_reach
+        results['l2_tlb_reach_coverage'] = 100.0 * l2_reach / working_set
+    return results
+
+def print_walk_metrics(results):
+    """Print the page-walk cost and the TLB reach of one run."""
+    print(f"\n  Page Walks: {results['walks']:,}")
+    if results['walk_time_pct'] == '':
+        print(f"    Walk latency: not modeled (SE mode, misses use the process page table)")
+    else:
+        print(f"    Walk latency: mean {results['walk_latency_mean_ns']:.1f} ns, "
+              f"p50 <= {results['walk_latency_p50_ns']:.0f} ns, "
+              f"p90 <= {results['walk_latency_p90_ns']:.0f} ns, "
+              f"p99 <= {results['walk_latency_p99_ns']:.0f} ns")
+        print(f"    Walker cache hit rate: {results['walker_cache_hit_rate']:.2f}%")
+        print(f"    Time spent in walks: {results['walk_time_pct']:.2f}%")
+    print(f"  TLB Reach (working set {results['working_set_bytes'] // 1024} KiB):")
+    print(f"    D-TLB: {results['dtlb_reach_bytes'] // 1024} KiB "
+          f"({results['dtlb_reach_coverage']:.1f}% of working set)")
+    if results['l2_tlb_reach_bytes'] != '':
+        print(f"    L2 TLB: {results['l2_tlb_reach_bytes'] // 1024} KiB "
+              f"({results['l2_tlb_reach_coverage']:.1f}% of working set)")
+
 if __name__ == '__m5_main__':
     import argparse
     
@@ -237,6 +457,9 @@ if __name__ == '__m5_main__':
     # - Page size is HARDCODED to 4KB (page_size parameter has no effect)
     # - TLB associativity is NOT configurable (tlb_assoc parameter has no effect)
     # - Only TLB size can be varied
+    # Runs that collapse onto an earlier one are deduplicated (see
+    # find_duplicate). With --isa=arm every axis is real; page sizes are
+    # translation granules (4kB, 16kB, 64kB).
     
     configurations = {
         # Page size variations - WARNING: These will NOT produce different results
@@ -255,27 +478,86 @@ if __name__ == '__m5_main__':
         'tlb_assoc_2': ('4kB', 64, 2),   # Will be fully assoc anyway
         'tlb_assoc_4': ('4kB', 64, 4),   # Will be fully assoc anyway
         'tlb_assoc_8': ('4kB', 64, 8),   # Will be fully assoc anyway
+        
+        # ARM translation granules (--isa=arm only)
+        'page_64kB': ('64kB', 64, 4),
     }
     
     parser = argparse.ArgumentParser(description='Run virtual memory experiments')
     parser.add_argument('config', nargs='?', default='tlb_64', 
                        choices=list(configurations.keys()),
                        help='Configuration name to run')
+    parser.add_argument('--label', default=None,
+                       help='Result name (default: the configuration name)')
+    parser.add_argument('--isa', default='x86', choices=['x86', 'arm'],
+                       help='x86: SE mode (only TLB size is real); '
+                            'arm: full-system ARM board')
+    parser.add_argument('--l2_tlb_size', type=int, default=1024,
+                       help='ARM shared L2 TLB entries')
+    parser.add_argument('--l2_tlb_assoc', type=int, default=8,
+                       help='ARM shared L2 TLB associativity')
+    parser.add_argument('--walker_cache_size', default='8KiB',
+                       help='ARM page-walker cache size (per walker)')
+    parser.add_argument('--kernel', default=None,
+                       help='ARM kernel built for the page size of the '
+                            'configuration (default: gem5 resource for 4kB)')
+    parser.add_argument('--disk_image', default=None,
+                       help='ARM disk image containing the aarch64 '
+                            'matrix_benchmark (required with --isa=arm)')
+    parser.add_argument('--matrix_size', type=int, default=DEFAULT_MATRIX_SIZE,
+                       help='matrix_benchmark --size (working set: '
+                            '4 * N * N doubles)')
+    parser.add_argument('--no_dedup', action='store_true',
+                       help='Simulate even if an identical run already exists')
+    add_timing_arguments(parser)
     
     args = parser.parse_args()
-    config_name = args.config
-    page_size, tlb_size, tlb_assoc = configurations[config_name]
-    
-    results = run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc)
+    config_name = args.label or args.config
+    page_size, tlb_size, tlb_assoc = configurations[args.config]
+    timing = {level: timing_overrides(args, level) for level in ('l1', 'l2')}
+    
+    arm = None
+    if args.isa == 'arm':
+        from arm_vm import GRANULE_KERNELS
+        if timing['l1'] or timing['l2']:
+            print("Error: --l1_*/--l2_* overrides apply to the X86 hierarchy only")
+            sys.exit(1)
+        if not args.disk_image:
+            print("Error: --isa=arm needs --disk_image with the aarch64 matrix_benchmark")
+            sys.exit(1)
+        if page_size not in GRANULE_KERNELS:
+            print(f"Error: ARM granules are {', '.join(GRANULE_KERNELS)} (got {page_size})")
+            sys.exit(1)
+        if not args.kernel and not GRANULE_KERNELS[page_size]:
+            print(f"Error: a {page_size} granule needs --kernel built with that page size")
+            sys.exit(1)
+        arm = {'l2_tlb_size': args.l2_tlb_size, 'l2_tlb_assoc': args.l2_tlb_assoc,
+               'walker_cache_size': args.walker_cache_size, 'kernel': args.kernel,
+               'disk_image': args.disk_image}
+    
+    result_dir = os.path.join(base_folder, 'results_v2')
+    os.makedirs(result_dir, exist_ok=True)
+    effective = effective_params(args.isa, page_size, tlb_size, tlb_assoc, timing, arm,
+                                 args.matrix_size)
+    duplicate = None if args.no_dedup else find_duplicate(result_dir, config_name, effective)
+    if duplicate:
+        # Same effective parameters: reuse the earlier result
+        print(f"{config_name}: effective parameters identical to "
+              f"{duplicate['config']}, reusing its result (--no_dedup to rerun)")
+        results = dict(duplicate, config=config_name, page_size=page_size,
+                       tlb_size=tlb_size, tlb_assoc=tlb_assoc,
+                       duplicate_of=duplicate['config'])
+    else:
+        results = run_vm_simulation(config_name, page_size, tlb_size, tlb_assoc,
+                                    timing, arm, args.matrix_size)
     
     # Save individual result
-    import csv
-    os.makedirs(os.path.join(base_folder, 'results_v2'), exist_ok=True)
-    result_file = f'{os.path.join(base_folder, "results_v2")}/{config_name}_vm_result.csv'
+    result_file = f'{result_dir}/{config_name}_vm_result.csv'
     with open(result_file, 'w', newline='') as csvfile:
         fieldnames = ['config', 'page_size', 'tlb_size', 'tlb_assoc',
                      'itlb_hit_rate', 'dtlb_hit_rate', 'page_faults',
                      'itlb_hits', 'itlb_misses', 'dtlb_hits', 'dtlb_misses']
+        fieldnames += [key for key in results if key not in fieldnames]
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerow(results)
@@ -1,12 +1,258 @@
+/*
+ * ILP microbenchmark suite
+ *
+ * Each kernel isolates one property of the instruction stream so that the
+ * effect of a pipeline parameter (width, branch predictor, ROB/IQ size, SMT
+ * policy) can be attributed to it:
+ *   depchain  one long chain of dependent integer multiply-adds (IPC is
+ *             bounded by the operation latency, width does not help)
+ *   indep     eight independent integer ALU streams (IPC bounded by width
+ *             and the number of ALUs)
+ *   branch    data-dependent branches on pseudo-random bits (~50% taken,
+ *             not learnable by any predictor)
+ *   pointer   pointer chasing through a random cyclic linked list (IPC
+ *             bounded by load latency; --nodes sets the footprint)
+ *   fp        eight independent floating-point multiply-add streams (IPC
+ *             bounded by FP unit count and latency)
+ *
+ * Usage: benchmark [--iterations=N] [--nodes=N] [--seed=N] [kernel ...]
+ *   kernel        one or more of the names above, or "all" (default: all)
+ *   --iterations  loop iterations per kernel (default: 1000000)
+ *   --nodes       linked-list nodes of the pointer kernel, 64 bytes each
+ *                 (default: 4096, i.e. 256KB)
+ *   --seed        PRNG seed of the branch and pointer kernels (default: 1)
+ *
+ * Every kernel runs inside its own region of interest. When compiled with
+ * -DILP_M5OPS the ROI is marked with m5_work_begin/m5_work_end (work id =
+ * kernel index below); my_o3_se.py --roi resets the stats at the begin and
+ * dumps them at the end, so each stats dump covers exactly one kernel and
+ * excludes program start-up, input generation and printing. Without
+ * -DILP_M5OPS the markers compile to nothing.
+ *
+ * Build with m5ops (libm5 from gem5/util/m5):
+ *   gcc -O2 -static -DILP_M5OPS -I$GEM5/include benchmark.c -o benchmark \
+ *       -L$GEM5/util/m5/build/x86/out -lm5
+ */
+
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
 #include <stdint.h>
+#include <getopt.h>
+
+#ifdef ILP_M5OPS
+#include <gem5/m5ops.h>
+#define ROI_BEGIN(id) m5_work_begin((id), 0)
+#define ROI_END(id)   m5_work_end((id), 0)
+#else
+#define ROI_BEGIN(id) ((void)(id))
+#define ROI_END(id)   ((void)(id))
+#endif
+
+#define DEFAULT_ITERATIONS 1000000
+#define DEFAULT_NODES 4096
+#define DEFAULT_SEED 1
+
+// Linked-list node of the pointer kernel, one per cache line
+typedef struct Node {
+    struct Node *next;
+    char pad[64 - sizeof(struct Node *)];
+} Node;
+
+static int num_nodes = DEFAULT_NODES;
+static uint64_t seed = DEFAULT_SEED;
+
+// xorshift64 PRNG
+static uint64_t next_random(uint64_t *state) {
+    uint64_t x = *state;
+    x ^= x << 13;
+    x ^= x >> 7;
+    x ^= x << 17;
+    *state = x;
+    return x;
+}
+
+// Dependency chain: every operation needs the result of the previous one
+static uint64_t kernel_depchain(long iterations) {
+    uint64_t x = 1;
+    for (long i = 0; i < iterations; i++) {
+        // The empty asm after each step keeps the compiler from folding
+        // the chain into a single multiply-add
+        x = x * 3 + 1;
+        __asm__ volatile("" : "+r"(x));
+        x = x * 5 + 3;
+        __asm__ volatile("" : "+r"(x));
+        x = x * 7 + 5;
+        __asm__ volatile("" : "+r"(x));
+        x = x * 9 + 7;
+        __asm__ volatile("" : "+r"(x));
+    }
+    return x;
+}
+
+// Independent ALU streams: eight accumulators with no cross dependencies
+static uint64_t kernel_indep(long iterations) {
+    uint64_t a = 1, b = 2, c = 3, d = 4, e = 5, f = 6, g = 7, h = 8;
+    for (long i = 0; i < iterations; i++) {
+        a += i;  b ^= i;  c += 11; d ^= 13;
+        e += 3;  f ^= 5;  g += 7;  h ^= 9;
+        // Keep the streams in registers without letting the compiler fold them
+        __asm__ volatile("" : "+r"(a), "+r"(b), "+r"(c), "+r"(d));
+        __asm__ volatile("" : "+r"(e), "+r"(f), "+r"(g), "+r"(h));
+    }
+    return a + b + c + d + e + f + g + h;
+}
+
+// Unpredictable branches: the direction depends on pseudo-random input bits
+static uint64_t kernel_branch(long iterations, const uint8_t *bits) {
+    uint64_t taken = 0, not_taken = 0;
+    for (long i = 0; i < iterations; i++) {
+        // The empty asm keeps the compiler from turning the branch into a cmov
+        if (bits[i]) {
+            __asm__ volatile("");
+            taken += i;
+        } else {
+            __asm__ volatile("");
+            not_taken ^= i;
+        }
+    }
+    return taken + not_taken;
+}
+
+// Pointer chasing: every load address comes from the previous load
+static uint64_t kernel_pointer(long iterations, Node *head) {
+    Node *p = head;
+    for (long i = 0; i < iterations; i++) {
+        p = p->next;
+    }
+    return (uint64_t)(p - head);  // index of the final node
+}
+
+// FP throughput: eight independent multiply-add streams
+static uint64_t kernel_fp(long iterations) {
+    double a = 1.0, b = 1.1, c = 1.2, d = 1.3, e = 1.4, f = 1.5, g = 1.6, h = 1.7;
+    const double m = 0.999999, k = 0.5;
+    for (long i = 0; i < iterations; i++) {
+        a = a * m + k;  b = b * m + k;  c = c * m + k;  d = d * m + k;
+        e = e * m + k;  f = f * m + k;  g = g * m + k;  h = h * m + k;
+    }
+    return (uint64_t)(a + b + c + d + e + f + g + h);
+}
+
+// Random single-cycle permutation of the nodes (Sattolo's algorithm)
+static Node *build_list(Node *nodes, int n) {
+    uint64_t state = seed;
+    int *order = (int *)malloc(n * sizeof(int));
+
+    if (!order) return NULL;
+    for (int i = 0; i < n; i++) order[i] = i;
+    for (int i = n - 1; i > 0; i--) {
+        int j = (int)(next_random(&state) % i);
+        int tmp = order[i];
+        order[i] = order[j];
+        order[j] = tmp;
+    }
+    for (int i = 0; i < n; i++) {
+        nodes[order[i]].next = &nodes[order[(i + 1) % n]];
+    }
+    free(order);
+    return &nodes[0];
+}
+
+// Kernel names, indexed by the m5ops work id
+static const char *const kernel_names[] = {
+    "depchain", "indep", "branch", "pointer", "fp",
+};
+#define NUM_KERNELS (int)(sizeof(kernel_names) / sizeof(kernel_names[0]))
+
+static int run_kernel(int id, long iterations) {
+    uint8_t *bits = NULL;
+    Node *nodes = NULL;
+    Node *head = NULL;
+    uint64_t result = 0;
+
+    // Inputs are generated outside the ROI
+    if (id == 2) {
+        uint64_t state = seed;
+        bits = (uint8_t *)malloc(iterations);
+        if (!bits) return 1;
+        for (long i = 0; i < iterations; i++) {
+            bits[i] = next_random(&state) & 1;
+        }
+    } else if (id == 3) {
+        nodes = (Node *)malloc(num_nodes * sizeof(Node));
+        if (!nodes || !(head = build_list(nodes, num_nodes))) return 1;
+    }
+
+    ROI_BEGIN(id);
+    switch (id) {
+      case 0: result = kernel_depchain(iterations); break;
+      case 1: result = kernel_indep(iterations); break;
+      case 2: result = kernel_branch(iterations, bits); break;
+      case 3: result = kernel_pointer(iterations, head); break;
+      case 4: result = kernel_fp(iterations); break;
+    }
+    ROI_END(id);
+
+    printf("%-9s %ld iterations, result %llu\n", kernel_names[id], iterations,
+           (unsigned long long)result);
+    free(bits);
+    free(nodes);
+    return 0;
+}
+
+static int find_kernel(const char *name) {
+    for (int k = 0; k < NUM_KERNELS; k++) {
+        if (strcmp(name, kernel_names[k]) == 0) return k;
+    }
+    return -1;
+}
+
+int main(int argc, char **argv) {
+    static const struct option options[] = {
+        {"iterations", required_argument, NULL, 'i'},
+        {"nodes",      required_argument, NULL, 'n'},
+        {"seed",       required_argument, NULL, 'r'},
+        {NULL, 0, NULL, 0},
+    };
+    long iterations = DEFAULT_ITERATIONS;
+    int selected[NUM_KERNELS] = {0};
+    int c;
+
+    while ((c = getopt_long(argc, argv, "", options, NULL)) != -1) {
+        switch (c) {
+          case 'i': iterations = atol(optarg); break;
+          case 'n': num_nodes = atoi(optarg); break;
+          case 'r': seed = strtoull(optarg, NULL, 0); break;
+          default: return 1;
+        }
+    }
+    if (iterations < 1 || num_nodes < 2 || seed == 0) {
+        printf("ERROR: --iterations must be >= 1, --nodes >= 2 and --seed != 0\n");
+        return 1;
+    }
+
+    if (optind == argc) {
+        for (int k = 0; k < NUM_KERNELS; k++) selected[k] = 1;
+    }
+    for (int a = optind; a < argc; a++) {
+        int k = find_kernel(argv[a]);
+        if (strcmp(argv[a], "all") == 0) {
+            for (k = 0; k < NUM_KERNELS; k++) selected[k] = 1;
+        } else if (k < 0) {
+            printf("ERROR: unknown kernel '%s' (depchain, indep, branch, "
+                   "pointer, fp or all)\n", argv[a]);
+            return 1;
+        } else {
+            selected[k] = 1;
+        }
+    }
 
-int main() {
-    volatile int sum = 0;
-    for (int i = 0; i < 1000; i++) {
-        if (i & 1) sum += i;     // branch + integer
-        else      sum -= i;
+    for (int k = 0; k < NUM_KERNELS; k++) {
+        if (selected[k] && run_kernel(k, iterations) != 0) {
+            printf("ERROR: Memory allocation failed!\n");
+            return 1;
+        }
     }
-    printf("%d\n", sum);
     return 0;
 }
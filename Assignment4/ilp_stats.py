@@ -0,0 +1,206 @@
+"""
+Statistics helpers for the ILP experiments.
+
+Parses gem5's stats.txt (one dump per benchmark kernel when my_o3_se.py
+runs with --roi) and derives the metrics printed at the end of a run:
+per-kernel IPC, branch prediction accuracy, back-end stall breakdown, and
+the per-thread IPC, weighted speedup and fairness of SMT runs.
+"""
+
+BEGIN_MARKER = '---------- Begin Simulation Statistics ----------'
+
+
+def read_stat_dumps(stats_file):
+    """Return a list with one {stat name: value} dict per dump in stats_file."""
+    dumps = []
+    current = None
+
+    with open(stats_file, 'r') as f:
+        for line in f:
+            if line.startswith(BEGIN_MARKER):
+                current = {}
+                dumps.append(current)
+                continue
+            if current is None:
+                continue
+            parts = line.split()
+            if len(parts) < 2 or parts[0].startswith('-'):
+                continue
+            try:
+                current[parts[0]] = float(parts[1])
+            except ValueError:
+                pass
+
+    return dumps
+
+
+def summarize_kernel(stats, kernel, cpu_path='system.cpu'):
+    """Instructions, cycles and IPC of one ROI (one stats dump)."""
+    insts = stats.get(f'{cpu_path}.commitStats0.numInsts', 0.0)
+    cycles = stats.get(f'{cpu_path}.numCycles', 0.0)
+
+    return {
+        'kernel': kernel,
+        'insts': insts,
+        'cycles': cycles,
+        'ipc': insts / cycles if cycles > 0 else 0.0,
+    }
+
+
+def print_kernel_table(kernel_results):
+    """Print the per-kernel metrics of an ROI run."""
+    print("\n" + "="*60)
+    print("Per-kernel Statistics (ROI)")
+    print("="*60)
+    print(f"  {'Kernel':<12}{'Insts':>14}{'Cycles':>14}{'IPC':>8}")
+    for k in kernel_results:
+        print(f"  {k['kernel']:<12}{k['insts']:>14.0f}{k['cycles']:>14.0f}"
+              f"{k['ipc']:>8.3f}")
+    print("="*60)
+
+
+def summarize_branch(stats, label, num_threads=1, cpu_path='system.cpu'):
+    """Branch prediction metrics of one stats dump, summed over threads.
+    
+    MPKI counts committed branches mispredicted per thousand committed
+    instructions. Squash cycles are the cycles fetch spent squashing the
+    wrong path after a misprediction was detected.
+    """
+    bp = f'{cpu_path}.branchPred'
+    insts = sum(stats.get(f'{cpu_path}.commitStats{t}.numInsts', 0.0)
+                for t in range(num_threads))
+    branches = sum(stats.get(f'{bp}.committed_{t}::total', 0.0)
+                   for t in range(num_threads))
+    mispredicted = sum(stats.get(f'{bp}.mispredicted_{t}::total', 0.0)
+                       for t in range(num_threads))
+    cycles = stats.get(f'{cpu_path}.numCycles', 0.0)
+    squash_cycles = stats.get(f'{cpu_path}.fetch.status::squashing', 0.0)
+
+    return {
+        'label': label,
+        'branches': branches,
+        'mispredicted': mispredicted,
+        'mispredict_rate': mispredicted / branches if branches > 0 else 0.0,
+        'mpki': 1000.0 * mispredicted / insts if insts > 0 else 0.0,
+        'btb_hit_rate': stats.get(f'{bp}.BTBHitRatio', 0.0),
+        'ras_used': stats.get(f'{bp}.ras.used', 0.0),
+        'squash_cycles': squash_cycles,
+        'squash_cycle_pct': 100.0 * squash_cycles / cycles if cycles > 0 else 0.0,
+    }
+
+
+def print_branch_table(branch_results):
+    """Print the branch prediction metrics of every measured region."""
+    print("\n" + "="*72)
+    print("Branch Prediction")
+    print("="*72)
+    print(f"  {'Region':<10}{'Branches':>12}{'Mispred':>10}{'Rate':>8}"
+          f"{'MPKI':>8}{'BTB hit':>9}{'Squash cyc':>14}")
+    for b in branch_results:
+        print(f"  {b['label']:<10}{b['branches']:>12.0f}{b['mispredicted']:>10.0f}"
+              f"{100 * b['mispredict_rate']:>7.2f}%{b['mpki']:>8.2f}"
+              f"{100 * b['btb_hit_rate']:>8.1f}%"
+              f"{b['squash_cycles']:>9.0f} ({b['squash_cycle_pct']:.1f}%)")
+    print("="*72)
+
+
+# Back-end stall events counted by rename (name in the table, stat name)
+STALL_EVENTS = [
+    ('ROB full', 'rename.ROBFullEvents'),
+    ('IQ full', 'rename.IQFullEvents'),
+    ('LQ full', 'rename.LQFullEvents'),
+    ('SQ full', 'rename.SQFullEvents'),
+    ('Regs full', 'rename.fullRegistersEvents'),
+]
+
+
+def summarize_stalls(stats, label, cpu_path='system.cpu'):
+    """Back-end stall breakdown of one stats dump.
+    
+    Rename is where a full ROB, IQ, LQ/SQ or physical register file stops
+    the pipeline, so the breakdown uses rename's block events and its
+    blocked and serialize-stall cycles. fu_busy counts issue attempts that
+    found no free functional unit.
+    """
+    cycles = stats.get(f'{cpu_path}.numCycles', 0.0)
+    blocked = stats.get(f'{cpu_path}.rename.status::Blocked', 0.0)
+    serialize = stats.get(f'{cpu_path}.rename.status::SerializeStall', 0.0)
+    results = {
+        'label': label,
+        'rename_blocked_pct': 100.0 * blocked / cycles if cycles > 0 else 0.0,
+        'serialize_pct': 100.0 * serialize / cycles if cycles > 0 else 0.0,
+        'fu_busy': stats.get(f'{cpu_path}.fuBusy', 0.0),
+    }
+    for name, stat in STALL_EVENTS:
+        results[name] = stats.get(f'{cpu_path}.{stat}', 0.0)
+    return results
+
+
+def print_stall_table(stall_results):
+    """Print the stall breakdown of every measured region."""
+    print("\n" + "="*88)
+    print("Back-end Stalls (rename block events)")
+    print("="*88)
+    header = ''.join(f'{name:>11}' for name, _ in STALL_EVENTS)
+    print(f"  {'Region':<10}{header}{'Blocked':>9}{'Serial':>8}{'FU busy':>9}")
+    for r in stall_results:
+        events = ''.join(f'{r[name]:>11.0f}' for name, _ in STALL_EVENTS)
+        print(f"  {r['label']:<10}{events}{r['rename_blocked_pct']:>8.1f}%"
+              f"{r['serialize_pct']:>7.1f}%{r['fu_busy']:>9.0f}")
+    print("  Blocked/Serial: % of cycles rename was blocked / serializing")
+    print("="*88)
+
+
+def summarize_smt(stats, num_threads, baseline_ipc=None, cpu_path='system.cpu'):
+    """Per-thread IPC of an SMT run, plus weighted speedup and fairness.
+    
+    With the single-thread IPC of every thread's program (baseline_ipc),
+    each thread's relative progress is ipc_smt / ipc_alone. Weighted
+    speedup is the sum of the relative progress of all threads, and
+    harmonic fairness is their harmonic mean (1.0 = no thread slowed down,
+    low values = one thread starved by the others).
+    """
+    cycles = stats.get(f'{cpu_path}.numCycles', 0.0)
+    threads = []
+    for t in range(num_threads):
+        insts = stats.get(f'{cpu_path}.commitStats{t}.numInsts', 0.0)
+        threads.append({
+            'thread': t,
+            'insts': insts,
+            'ipc': insts / cycles if cycles > 0 else 0.0,
+        })
+
+    results = {
+        'cycles': cycles,
+        'threads': threads,
+        'total_ipc': sum(t['ipc'] for t in threads),
+    }
+    if baseline_ipc:
+        relative = [t['ipc'] / base for t, base in zip(threads, baseline_ipc)]
+        for t, rel in zip(threads, relative):
+            t['relative_ipc'] = rel
+        results['weighted_speedup'] = sum(relative)
+        results['harmonic_fairness'] = (
+            len(relative) / sum(1.0 / r for r in relative)
+            if all(r > 0 for r in relative) else 0.0)
+
+    return results
+
+
+def print_smt_summary(results):
+    """Print the per-thread IPC and the SMT throughput/fairness metrics."""
+    print("\n" + "="*60)
+    print("SMT Statistics")
+    print("="*60)
+    print(f"  {'Thread':<8}{'Insts':>14}{'IPC':>8}{'IPC/alone':>11}")
+    for t in results['threads']:
+        relative = t.get('relative_ipc')
+        relative = f"{relative:>11.3f}" if relative is not None else f"{'n/a':>11}"
+        print(f"  {t['thread']:<8}{t['insts']:>14.0f}{t['ipc']:>8.3f}{relative}")
+    print(f"  Total IPC: {results['total_ipc']:.3f}")
+    if 'weighted_speedup' in results:
+        print(f"  Weighted speedup: {results['weighted_speedup']:.3f}")
+        print(f"  Harmonic fairness: {results['harmonic_fairness']:.3f}")
+    else:
+        print("  Weighted speedup / fairness: n/a (pass --baseline-ipc)")
+    print("="*60)
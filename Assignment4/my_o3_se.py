@@ -2,12 +2,154 @@
 from m5.objects import *
 import m5
 import argparse
+import os
+
+from ilp_stats import (print_branch_table, print_kernel_table,
+                       print_smt_summary, print_stall_table, read_stat_dumps,
+                       summarize_branch, summarize_kernel, summarize_smt,
+                       summarize_stalls)
+
+# Kernel names of benchmark.c, indexed by the m5ops work id
+ROI_KERNELS = ["depchain", "indep", "branch", "pointer", "fp"]
+
+# Functional units of the DefaultFUPool: (option, FUDesc class, default count)
+FU_TYPES = [
+    ("int-alus", IntALU, 6),
+    ("int-mult-div", IntMultDiv, 2),
+    ("fp-alus", FP_ALU, 4),
+    ("fp-mult-div", FP_MultDiv, 2),
+    ("read-ports", ReadPort, 0),
+    ("simd-units", SIMD_Unit, 4),
+    ("pred-alus", PredALU, 1),
+    ("write-ports", WritePort, 0),
+    ("rdwr-ports", RdWrPort, 4),
+    ("ipr-ports", IprPort, 1),
+]
+
+# Architectural registers per thread of the gem5 X86 register files
+# (including microcode temporaries); rename needs more physical registers
+X86_ARCH_INT_REGS = 38
+X86_ARCH_FLOAT_REGS = 56
+
+# Widest pipeline stage the O3CPU is compiled for (MaxWidth in o3/limits.hh)
+O3_MAX_WIDTH = 12
+
+# Conditional branch predictors selectable with --bp
+BP_TYPES = {
+    "local": LocalBP,
+    "bimode": BiModeBP,
+    "tournament": TournamentBP,
+    "tage": TAGE,
+    "ltage": LTAGE,
+}
+# Predictors whose counter tables --bp-entries sizes, and those whose tagged
+# tables --tage-log-entries sizes
+BP_ENTRIES_TYPES = ("local", "bimode", "tournament")
+TAGE_TYPES = ("tage", "ltage")
+PERCEPTRON_BUDGETS = {
+    "8KB": MultiperspectivePerceptron8KB,
+    "64KB": MultiperspectivePerceptron64KB,
+}
+
+
+def make_conditional_predictor(args):
+    """Build the conditional predictor selected by --bp and its size options.
+    
+    Returns None for the default predictor (--bp=simple).
+    """
+    if args.bp == "none":
+        # Configure a minimal LocalBP that approximates "no prediction"
+        # With only 1 entry and 1-bit counter, it can barely learn patterns
+        print("Note: Using minimal LocalBP (1 entry, 1-bit) to simulate poor prediction")
+        return LocalBP(
+            localPredictorSize=1,  # Only 1 entry (no real history)
+            localCtrBits=1         # 1-bit counter (weakly taken/not-taken)
+        )
+    if args.bp == "simple":
+        # Keep the default O3CPU predictor
+        return None
+    if args.bp == "perceptron":
+        return PERCEPTRON_BUDGETS[args.perceptron_budget]()
+
+    # Size options of other predictors are rejected at parse time
+    bp = BP_TYPES[args.bp]()
+    if args.bp_entries is not None:
+        if args.bp == "local":
+            bp.localPredictorSize = args.bp_entries
+        elif args.bp == "bimode":
+            bp.globalPredictorSize = args.bp_entries
+            bp.choicePredictorSize = args.bp_entries
+        elif args.bp == "tournament":
+            bp.localPredictorSize = args.bp_entries
+            bp.localHistoryTableSize = args.bp_entries
+            bp.globalPredictorSize = args.bp_entries
+            bp.choicePredictorSize = args.bp_entries
+    if args.tage_log_entries is not None:
+        # Keep the base (bimodal) table, resize the tagged tables
+        tage = bp.tage
+        tage.logTagTableSizes = ([tage.logTagTableSizes[0]] +
+                                 [args.tage_log_entries] * int(tage.nHistoryTables))
+    return bp
+
+
+def validate_backend(args, num_threads):
+    """Return the reasons a width/back-end combination cannot work."""
+    errors = []
+    widths = {name: getattr(args, name) for name in
+              ["fetchWidth", "decodeWidth", "renameWidth",
+               "dispatchWidth", "issueWidth", "commitWidth"]}
+    for name, width in widths.items():
+        if width < 1:
+            errors.append(f"--{name} must be at least 1")
+        elif width > O3_MAX_WIDTH:
+            errors.append(f"--{name}={width} exceeds the O3CPU maximum "
+                          f"width of {O3_MAX_WIDTH}")
+        elif width > args.rob_entries:
+            errors.append(f"--{name}={width} is wider than the ROB "
+                          f"(--rob-entries={args.rob_entries})")
+    for name in ["dispatchWidth", "issueWidth"]:
+        if widths[name] > args.iq_entries:
+            errors.append(f"--{name}={widths[name]} is wider than the IQ "
+                          f"(--iq-entries={args.iq_entries})")
+    if args.iq_entries > args.rob_entries:
+        errors.append(f"--iq-entries={args.iq_entries} exceeds "
+                      f"--rob-entries={args.rob_entries}")
+    for name in ["lq_entries", "sq_entries"]:
+        if getattr(args, name) < 1:
+            errors.append(f"--{name.replace('_', '-')} must be at least 1")
+    for name, arch_regs in [("phys_int_regs", X86_ARCH_INT_REGS),
+                            ("phys_float_regs", X86_ARCH_FLOAT_REGS)]:
+        needed = arch_regs * num_threads + args.renameWidth
+        if getattr(args, name) < needed:
+            errors.append(f"--{name.replace('_', '-')}={getattr(args, name)} "
+                          f"leaves no registers to rename into (need at least "
+                          f"{needed} for {num_threads} thread(s))")
+    counts = {option: getattr(args, option.replace("-", "_"))
+              for option, _, _ in FU_TYPES}
+    counts = {option: default if counts[option] is None else counts[option]
+              for option, _, default in FU_TYPES}
+    if counts["int-alus"] < 1:
+        errors.append("--int-alus must be at least 1")
+    if counts["read-ports"] + counts["rdwr-ports"] < 1:
+        errors.append("loads need at least one --read-ports or --rdwr-ports unit")
+    if counts["write-ports"] + counts["rdwr-ports"] < 1:
+        errors.append("stores need at least one --write-ports or --rdwr-ports unit")
+    return errors
+
 
 parser = argparse.ArgumentParser()
-parser.add_argument("--cmd", required=True, help="binary to run")
-parser.add_argument("--args", default="", help="arguments for the binary")
+parser.add_argument("--cmd", required=True,
+                    help="binary to run; with SMT, a ';'-separated list with "
+                         "one binary per hardware thread (reused cyclically)")
+parser.add_argument("--args", default="",
+                    help="arguments for the binary; with SMT, ';'-separated "
+                         "per thread like --cmd")
 parser.add_argument("--cpu-clock", default="1GHz")
 parser.add_argument("--mem-size", default="512MB")
+parser.add_argument("--roi", action="store_true",
+                    help="one stats dump per benchmark kernel, or with SMT "
+                         "one dump while every thread is in its kernel "
+                         "(needs a benchmark built with -DILP_M5OPS)")
 
 # Superscalar knobs (single-core)
 parser.add_argument("--fetchWidth", type=int, default=4)
@@ -17,15 +159,84 @@ parser.add_argument("--dispatchWidth", type=int, default=4)
 parser.add_argument("--issueWidth", type=int, default=4)
 parser.add_argument("--commitWidth", type=int, default=4)
 
-# SMT knobs
-parser.add_argument("--threads", type=int, default=1, help="num HW threads")
-parser.add_argument("--smt", action="store_true", help="enable SMT policy knobs")
+# Back-end resources (defaults are the O3CPU defaults)
+parser.add_argument("--rob-entries", type=int, default=192)
+parser.add_argument("--iq-entries", type=int, default=64)
+parser.add_argument("--lq-entries", type=int, default=32)
+parser.add_argument("--sq-entries", type=int, default=32)
+parser.add_argument("--phys-int-regs", type=int, default=256)
+parser.add_argument("--phys-float-regs", type=int, default=256)
 
-# Branch predictor
-parser.add_argument("--bp", choices=["none", "simple"], default="simple")
+# Functional unit pool: units of each type (default: DefaultFUPool counts)
+for option, _, default in FU_TYPES:
+    parser.add_argument(f"--{option}", type=int, default=None,
+                        help=f"default: {default}")
+
+# SMT knobs (default: one hardware thread per --cmd entry)
+parser.add_argument("--threads", type=int, default=None, help="num HW threads")
+parser.add_argument("--smt", action="store_true",
+                    help="round-robin fetch/commit across all threads "
+                         "(shorthand for the two policies below)")
+parser.add_argument("--smt-fetch-policy",
+                    choices=["RoundRobin", "Branch", "IQCount", "LSQCount"])
+parser.add_argument("--smt-fetching-threads", type=int, default=None,
+                    help="threads fetched from per cycle")
+parser.add_argument("--smt-commit-policy", choices=["RoundRobin", "OldestReady"])
+parser.add_argument("--smt-iq-policy", choices=["Dynamic", "Partitioned", "Threshold"])
+parser.add_argument("--smt-lsq-policy", choices=["Dynamic", "Partitioned", "Threshold"])
+parser.add_argument("--smt-rob-policy", choices=["Dynamic", "Partitioned", "Threshold"])
+parser.add_argument("--smt-iq-threshold", type=int, default=None,
+                    help="max IQ entries per thread (Threshold policy)")
+parser.add_argument("--smt-lsq-threshold", type=int, default=None,
+                    help="max LSQ entries per thread (Threshold policy)")
+parser.add_argument("--smt-rob-threshold", type=int, default=None,
+                    help="max ROB entries per thread (Threshold policy)")
+parser.add_argument("--max-insts", type=int, default=0,
+                    help="stop when any thread commits this many instructions "
+                         "(keeps every thread running for the whole "
+                         "measurement; 0 = run to completion)")
+parser.add_argument("--baseline-ipc", default="",
+                    help="comma-separated single-thread IPC of each thread's "
+                         "program, for weighted speedup and fairness")
+
+# Branch predictor (simple = the O3CPU default, a Tournament predictor)
+parser.add_argument("--bp",
+                    choices=["none", "simple", "perceptron"] + sorted(BP_TYPES),
+                    default="simple")
+parser.add_argument("--bp-entries", type=int, default=None,
+                    help="entries of every counter table of the local, "
+                         "bimode and tournament predictors (power of 2)")
+parser.add_argument("--tage-log-entries", type=int, default=None,
+                    help="log2 entries of every tagged table (tage, ltage)")
+parser.add_argument("--perceptron-budget", choices=sorted(PERCEPTRON_BUDGETS),
+                    default="8KB", help="storage budget of the perceptron")
+parser.add_argument("--btb-entries", type=int, default=None)
+parser.add_argument("--btb-assoc", type=int, default=None)
+parser.add_argument("--ras-entries", type=int, default=None)
 
 args = parser.parse_args()
 
+cmds = args.cmd.split(";")
+cmd_args = args.args.split(";")
+num_threads = args.threads if args.threads is not None else len(cmds)
+baseline_ipc = [float(v) for v in args.baseline_ipc.split(",") if v]
+
+if num_threads < 1:
+    parser.error("--threads must be at least 1")
+if len(cmds) > num_threads:
+    parser.error(f"{len(cmds)} binaries given for {num_threads} hardware threads")
+if baseline_ipc and len(baseline_ipc) != num_threads:
+    parser.error("--baseline-ipc needs one value per hardware thread")
+if args.bp_entries is not None and args.bp not in BP_ENTRIES_TYPES:
+    parser.error(f"--bp-entries sizes the {', '.join(BP_ENTRIES_TYPES)} "
+                 f"predictors, not --bp={args.bp}")
+if args.tage_log_entries is not None and args.bp not in TAGE_TYPES:
+    parser.error(f"--tage-log-entries sizes the {', '.join(TAGE_TYPES)} "
+                 f"predictors, not --bp={args.bp}")
+backend_errors = validate_backend(args, num_threads)
+if backend_errors:
+    parser.error("invalid pipeline configuration:\n  " + "\n  ".join(backend_errors))
+
 # -----------------------
 # 1) System
 # -----------------------
@@ -34,8 +245,12 @@ system.clk_domain = SrcClockDomain(clock=args.cpu_clock, voltage_domain=VoltageD
 system.mem_mode = "timing"
 system.mem_ranges = [AddrRange(args.mem_size)]
 
+# ROI mode: the benchmark's m5_work_begin/m5_work_end exit the simulation loop
+if args.roi:
+    system.exit_on_work_items = True
+
 # Enable multi-threading support if requested
-if args.threads > 1:
+if num_threads > 1:
     system.multi_thread = True
 
 # -----------------------
@@ -51,35 +266,66 @@ system.cpu.dispatchWidth = args.dispatchWidth
 system.cpu.issueWidth    = args.issueWidth
 system.cpu.commitWidth   = args.commitWidth
 
-# Enable multi-threading (SMT-ish) by setting numThreads
-system.cpu.numThreads = args.threads
-
-# Optional SMT policies (only meaningful when threads > 1)
-if args.threads > 1 and args.smt:
-    # Note: Some SMT policies may not be available in all gem5 versions
-    # O3CPU will automatically handle multi-threading when numThreads > 1
-    try:
-        system.cpu.smtFetchPolicy = "RoundRobin"
-        system.cpu.smtCommitPolicy = "RoundRobin"
-        system.cpu.smtNumFetchingThreads = args.threads
-    except AttributeError:
-        # SMT policies not available in this gem5 version
-        # SMT will still work with default policies
-        print("Note: Using default SMT policies (advanced policies not available)")
+# Back-end resources
+system.cpu.numROBEntries    = args.rob_entries
+system.cpu.numIQEntries     = args.iq_entries
+system.cpu.LQEntries        = args.lq_entries
+system.cpu.SQEntries        = args.sq_entries
+system.cpu.numPhysIntRegs   = args.phys_int_regs
+system.cpu.numPhysFloatRegs = args.phys_float_regs
+
+# Functional unit pool, rebuilt only if any unit count was changed
+fu_counts = [getattr(args, option.replace("-", "_")) for option, _, _ in FU_TYPES]
+if any(count is not None for count in fu_counts):
+    fu_list = []
+    for (option, fu_class, default), count in zip(FU_TYPES, fu_counts):
+        fu = fu_class()
+        fu.count = default if count is None else count
+        fu_list.append(fu)
+    system.cpu.fuPool = FUPool(FUList=fu_list)
+
+# Enable SMT by setting numThreads
+system.cpu.numThreads = num_threads
+
+# SMT resource-sharing policies (only meaningful when threads > 1);
+# anything not given keeps the O3CPU default
+if num_threads > 1:
+    if args.smt:
+        args.smt_fetch_policy = args.smt_fetch_policy or "RoundRobin"
+        args.smt_commit_policy = args.smt_commit_policy or "RoundRobin"
+        if args.smt_fetching_threads is None:
+            args.smt_fetching_threads = num_threads
+    smt_params = {
+        "smtFetchPolicy": args.smt_fetch_policy,
+        "smtNumFetchingThreads": args.smt_fetching_threads,
+        "smtCommitPolicy": args.smt_commit_policy,
+        "smtIQPolicy": args.smt_iq_policy,
+        "smtIQThreshold": args.smt_iq_threshold,
+        "smtLSQPolicy": args.smt_lsq_policy,
+        "smtLSQThreshold": args.smt_lsq_threshold,
+        "smtROBPolicy": args.smt_rob_policy,
+        "smtROBThreshold": args.smt_rob_threshold,
+    }
+    for name, value in smt_params.items():
+        if value is not None:
+            setattr(system.cpu, name, value)
+            print(f"SMT: {name} = {value}")
+
+if args.max_insts:
+    system.cpu.max_insts_any_thread = args.max_insts
 
 # Branch predictor
-if args.bp == "none":
-    # Configure a minimal LocalBP that approximates "no prediction"
-    # With only 1 entry and 1-bit counter, it can barely learn patterns
-    from m5.objects import LocalBP
-    system.cpu.branchPred.conditionalPredictor = LocalBP(
-        localPredictorSize=1,  # Only 1 entry (no real history)
-        localCtrBits=1         # 1-bit counter (weakly taken/not-taken)
-    )
-    print("Note: Using minimal LocalBP (1 entry, 1-bit) to simulate poor prediction")
-else:
-    # Use default branch predictor (Tournament/TAGE-based)
-    pass
+conditional_predictor = make_conditional_predictor(args)
+if conditional_predictor is not None:
+    system.cpu.branchPred.conditionalPredictor = conditional_predictor
+if args.btb_entries is not None or args.btb_assoc is not None:
+    system.cpu.branchPred.btb = SimpleBTB()
+    if args.btb_entries is not None:
+        system.cpu.branchPred.btb.numEntries = args.btb_entries
+    if args.btb_assoc is not None:
+        system.cpu.branchPred.btb.associativity = args.btb_assoc
+if args.ras_entries is not None:
+    system.cpu.branchPred.ras = ReturnAddrStack(numEntries=args.ras_entries)
 
 # -----------------------
 # 3) Memory system: simple L1I/L1D + membus + DDR3
@@ -99,7 +345,7 @@ system.cpu.dcache.mem_side = system.membus.cpu_side_ports
 system.cpu.createInterruptController()
 
 # Connect interrupt controller ports for each thread
-for i in range(args.threads):
+for i in range(num_threads):
     system.cpu.interrupts[i].pio = system.membus.mem_side_ports
     system.cpu.interrupts[i].int_requestor = system.membus.cpu_side_ports
     system.cpu.interrupts[i].int_responder = system.membus.mem_side_ports
@@ -114,24 +360,23 @@ system.system_port = system.membus.cpu_side_ports
 # -----------------------
 # 4) Workload (SE mode)
 # -----------------------
-cmd = [args.cmd] + ([a for a in args.args.split()] if args.args else [])
+system.workload = SEWorkload.init_compatible(cmds[0])
 
-system.workload = SEWorkload.init_compatible(args.cmd)
-
-# If threads>1, create one process per thread (simplest SMT demo)
+# If threads>1, create one process per thread, each running its own binary
 # Each thread needs its own Process instance to avoid memory mapping conflicts
-if args.threads == 1:
+if num_threads == 1:
     process = Process()
-    process.cmd = cmd
+    process.cmd = [cmds[0]] + cmd_args[0].split()
     system.cpu.workload = process
 else:
     # Create separate Process instances for each thread with unique PIDs
     processes = []
-    for i in range(args.threads):
+    for i in range(num_threads):
         p = Process()
-        p.cmd = cmd
+        p.cmd = [cmds[i % len(cmds)]] + cmd_args[i % len(cmd_args)].split()
         p.pid = 100 + i  # Assign unique PIDs starting from 100
         processes.append(p)
+        print(f"Thread {i}: {' '.join(p.cmd)}")
     system.cpu.workload = processes
 
 system.cpu.createThreads()
@@ -143,5 +388,59 @@ root = Root(full_system=False, system=system)
 m5.instantiate()
 
 print("Beginning simulation!")
-exit_event = m5.simulate()
-print(f"Exiting @ tick {m5.curTick()} because {exit_event.getCause()}")
+kernels = []
+started = []
+while True:
+    exit_event = m5.simulate()
+    cause = exit_event.getCause()
+    if not args.roi:
+        break
+    code = exit_event.getCode()
+    kernel = (ROI_KERNELS[code] if 0 <= code < len(ROI_KERNELS)
+              else f"kernel{code}")
+    if num_threads > 1:
+        # SMT: one dump from the moment every thread is in its kernel until
+        # the first thread leaves its kernel, so all threads share the
+        # pipeline for the whole measurement
+        if cause == "workbegin":
+            started.append(kernel)
+            if len(started) == num_threads:
+                m5.stats.reset()
+            continue
+        if cause == "workend" and len(started) == num_threads:
+            m5.stats.dump()
+            kernels.append("+".join(started))
+        elif cause == "workend":
+            print(f"Warning: {kernel} left its ROI before every thread "
+                  f"entered its own (run the other kernels longer); "
+                  f"reporting the run from its start up to that point")
+        break
+    # Reset at the start of every kernel and dump at its end, so each
+    # stats dump covers exactly one kernel
+    if cause == "workbegin":
+        m5.stats.reset()
+    elif cause == "workend":
+        m5.stats.dump()
+        kernels.append(kernel)
+    else:
+        break
+print(f"Exiting @ tick {m5.curTick()} because {cause}")
+
+# Dump now so the summaries can read the final stats
+m5.stats.dump()
+dumps = read_stat_dumps(os.path.join(m5.options.outdir, "stats.txt"))
+if args.roi and kernels:
+    # One dump per kernel, in the order the kernels ran
+    measured = list(zip(kernels, dumps))
+    print_kernel_table([summarize_kernel(stats, kernel)
+                        for kernel, stats in measured])
+else:
+    if args.roi and not started:
+        print("Warning: no ROI work items seen (benchmark built without "
+              "-DILP_M5OPS?); reporting the whole run")
+    measured = [("all", dumps[-1])]
+print_branch_table([summarize_branch(stats, label, num_threads)
+                    for label, stats in measured])
+print_stall_table([summarize_stalls(stats, label) for label, stats in measured])
+if num_threads > 1:
+    print_smt_summary(summarize_smt(measured[0][1], num_threads, baseline_ipc))
@@ -1,104 +1,196 @@
 #!/bin/bash
 # Assignment 4: ILP Experiments Script
+#
+# Every pipeline configuration is run once per benchmark kernel, so that the
+# effect of width and branch prediction can be attributed to dependency
+# chains, independent ALU work, unpredictable branches, load latency or FP
+# throughput. Runs use --roi: build the benchmark with -DILP_M5OPS (see
+# README) so that the stats cover only the kernel loop.
 
 OUTPUT_BASE="configs/practice/Assignment4/results"
 mkdir -p $OUTPUT_BASE
 
 BENCHMARK="./configs/practice/Assignment4/benchmark"
 CONFIG="configs/practice/Assignment4/my_o3_se.py"
+KERNELS="depchain indep branch pointer fp"
+ITERATIONS=200000
+
+# run_config <name> <kernel> [my_o3_se.py options...]
+run_config() {
+  local name=$1
+  local kernel=$2
+  shift 2
+  build/X86/gem5.opt \
+    $CONFIG \
+    --cmd=$BENCHMARK \
+    --args="--iterations=$ITERATIONS $kernel" \
+    --roi \
+    "$@" \
+    > ${OUTPUT_BASE}/${kernel}_${name}.log 2>&1
+  cp m5out/stats.txt ${OUTPUT_BASE}/${kernel}_${name}_stats.txt
+}
 
 echo "=========================================="
 echo "ILP Assignment Experiments"
 echo "=========================================="
 
-# Experiment 1: Baseline with Branch Prediction
-echo ""
-echo "Experiment 1: Baseline (4-wide superscalar, simple branch predictor)"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  > ${OUTPUT_BASE}/baseline.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/baseline_stats.txt
-echo "✓ Baseline complete"
-
-# Experiment 2: No Branch Prediction
-echo ""
-echo "Experiment 2: Without Branch Prediction"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --bp=none \
-  > ${OUTPUT_BASE}/no_bp.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/no_bp_stats.txt
-echo "✓ No branch prediction complete"
-
-# Experiment 3: Single-issue (narrow pipeline)
-echo ""
-echo "Experiment 3: Single-issue Pipeline"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --fetchWidth=1 --decodeWidth=1 --renameWidth=1 \
-  --dispatchWidth=1 --issueWidth=1 --commitWidth=1 \
-  > ${OUTPUT_BASE}/single_issue.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/single_issue_stats.txt
-echo "✓ Single-issue complete"
-
-# Experiment 4: Dual-issue
-echo ""
-echo "Experiment 4: Dual-issue Pipeline"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --fetchWidth=2 --decodeWidth=2 --renameWidth=2 \
-  --dispatchWidth=2 --issueWidth=2 --commitWidth=2 \
-  > ${OUTPUT_BASE}/dual_issue.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/dual_issue_stats.txt
-echo "✓ Dual-issue complete"
-
-# Experiment 5: Baseline 4-wide (reference)
-echo ""
-echo "Experiment 5: 4-wide Superscalar (Reference)"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  > ${OUTPUT_BASE}/quad_issue.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/quad_issue_stats.txt
-echo "✓ 4-wide complete"
-
-# Experiment 6: 8-wide superscalar
+for KERNEL in $KERNELS; do
+  echo ""
+  echo "Kernel: $KERNEL"
+
+  # Experiment 1: Baseline with Branch Prediction
+  run_config baseline $KERNEL
+  echo "✓ Baseline (4-wide, default branch predictor) complete"
+
+  # Experiment 2: No Branch Prediction
+  run_config no_bp $KERNEL --bp=none
+  echo "✓ No branch prediction complete"
+
+  # Experiments 3-6: Superscalar width sweep
+  for WIDTH in 1 2 4 8; do
+    run_config width_${WIDTH} $KERNEL \
+      --fetchWidth=$WIDTH --decodeWidth=$WIDTH --renameWidth=$WIDTH \
+      --dispatchWidth=$WIDTH --issueWidth=$WIDTH --commitWidth=$WIDTH
+    echo "✓ ${WIDTH}-wide complete"
+  done
+done
+
+# Branch predictor design space (branch kernel: unpredictable branches,
+# depchain: loop branches only)
 echo ""
-echo "Experiment 6: 8-wide Superscalar"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --fetchWidth=8 --decodeWidth=8 --renameWidth=8 \
-  --dispatchWidth=8 --issueWidth=8 --commitWidth=8 \
-  > ${OUTPUT_BASE}/eight_issue.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/eight_issue_stats.txt
-echo "✓ 8-wide complete"
-
-# Experiment 7: SMT with 2 threads
+echo "Branch predictor experiments"
+for KERNEL in branch depchain; do
+  for BP in local bimode tournament tage ltage perceptron; do
+    run_config bp_${BP} $KERNEL --bp=$BP
+    echo "✓ $KERNEL: $BP predictor complete"
+  done
+done
+
+# Predictor, BTB and RAS sizes
+for ENTRIES in 256 1024 4096 16384; do
+  run_config bp_tournament_${ENTRIES} branch --bp=tournament --bp-entries=$ENTRIES
+  echo "✓ Tournament with $ENTRIES-entry tables complete"
+done
+for LOG in 7 9 11; do
+  run_config bp_tage_log${LOG} branch --bp=tage --tage-log-entries=$LOG
+  echo "✓ TAGE with 2^$LOG-entry tagged tables complete"
+done
+for BTB in 64 256 1024 4096; do
+  run_config btb_${BTB} depchain --btb-entries=$BTB
+  echo "✓ $BTB-entry BTB complete"
+done
+for RAS in 4 16; do
+  run_config ras_${RAS} depchain --ras-entries=$RAS
+  echo "✓ $RAS-entry RAS complete"
+done
+
+# Back-end resources (8-wide front end, so the back end is the bottleneck)
+WIDE="--fetchWidth=8 --decodeWidth=8 --renameWidth=8 --dispatchWidth=8 --issueWidth=8 --commitWidth=8"
 echo ""
-echo "Experiment 7: SMT with 2 threads"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --threads=2 \
-  > ${OUTPUT_BASE}/smt_2threads.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/smt_2threads_stats.txt
-echo "✓ SMT 2-threads complete"
-
-# Experiment 8: SMT with 4 threads
+echo "Back-end resource experiments"
+for ROB in 32 64 128 256; do
+  run_config rob_${ROB} pointer $WIDE --rob-entries=$ROB --iq-entries=$((ROB / 2))
+  echo "✓ ${ROB}-entry ROB complete"
+done
+for IQ in 8 16 32 64; do
+  run_config iq_${IQ} indep $WIDE --iq-entries=$IQ
+  echo "✓ ${IQ}-entry IQ complete"
+done
+for LSQ in 8 16 32 64; do
+  run_config lsq_${LSQ} pointer $WIDE --lq-entries=$LSQ --sq-entries=$LSQ
+  echo "✓ ${LSQ}-entry LQ/SQ complete"
+done
+for REGS in 64 96 128 256; do
+  run_config regs_${REGS} indep $WIDE --phys-int-regs=$REGS
+  echo "✓ $REGS physical integer registers complete"
+done
+for ALUS in 1 2 4 6; do
+  run_config alus_${ALUS} indep $WIDE --int-alus=$ALUS
+  echo "✓ $ALUS integer ALUs complete"
+done
+for FPUS in 1 2 4; do
+  run_config fpus_${FPUS} fp $WIDE --fp-alus=$FPUS --fp-mult-div=$FPUS
+  echo "✓ $FPUS FP ALUs/multipliers complete"
+done
+
+# Experiments 7-8: SMT, one kernel per hardware thread
+# With --roi every run measures from the moment all threads are in their
+# kernel loop until the first thread leaves it, so all threads share the
+# pipeline for the whole measurement and input generation is excluded. The
+# single-thread IPC of each kernel's ROI, with the same arguments, is the
+# baseline for weighted speedup and harmonic fairness.
+SMT_ITERATIONS=200000
+SMT_PAIRS="indep:depchain branch:fp pointer:indep"
+SMT_POLICIES="Dynamic Partitioned Threshold"
+
+# smt_args <kernel>
+# The branch kernel generates its input bits (about as many instructions as
+# the kernel itself) before its ROI, so the other kernels run four times as
+# many iterations to still be in their ROI when it starts
+smt_args() {
+  if [ "$1" = "branch" ]; then
+    echo "--iterations=$SMT_ITERATIONS $1"
+  else
+    echo "--iterations=$((SMT_ITERATIONS * 4)) $1"
+  fi
+}
+
+# single_thread_ipc <kernel>
+single_thread_ipc() {
+  build/X86/gem5.opt \
+    $CONFIG \
+    --cmd=$BENCHMARK \
+    --args="$(smt_args $1)" \
+    --roi \
+    > ${OUTPUT_BASE}/$1_alone.log 2>&1
+  # The first dump is the kernel's ROI
+  awk '$1 == "system.cpu.ipc" {print $2; exit}' m5out/stats.txt
+}
+
 echo ""
-echo "Experiment 8: SMT with 4 threads"
-build/X86/gem5.opt \
-  $CONFIG \
-  --cmd=$BENCHMARK \
-  --threads=4 \
-  > ${OUTPUT_BASE}/smt_4threads.log 2>&1
-cp m5out/stats.txt ${OUTPUT_BASE}/smt_4threads_stats.txt
-echo "✓ SMT 4-threads complete"
+echo "SMT experiments"
+declare -A ALONE_IPC
+for KERNEL in $KERNELS; do
+  ALONE_IPC[$KERNEL]=$(single_thread_ipc $KERNEL)
+  echo "✓ $KERNEL alone: IPC ${ALONE_IPC[$KERNEL]}"
+done
+
+for PAIR in $SMT_PAIRS; do
+  K0=${PAIR%%:*}
+  K1=${PAIR##*:}
+  for POLICY in $SMT_POLICIES; do
+    NAME="smt_${K0}_${K1}_${POLICY}"
+    build/X86/gem5.opt \
+      $CONFIG \
+      --cmd="$BENCHMARK" \
+      --args="$(smt_args $K0);$(smt_args $K1)" \
+      --threads=2 \
+      --roi \
+      --smt-fetch-policy=RoundRobin \
+      --smt-iq-policy=$POLICY --smt-lsq-policy=$POLICY --smt-rob-policy=$POLICY \
+      --baseline-ipc="${ALONE_IPC[$K0]},${ALONE_IPC[$K1]}" \
+      > ${OUTPUT_BASE}/${NAME}.log 2>&1
+    cp m5out/stats.txt ${OUTPUT_BASE}/${NAME}_stats.txt
+    echo "✓ SMT $K0 + $K1 ($POLICY IQ/LSQ/ROB) complete"
+  done
+done
+
+# SMT fetch policies on the branch + fp pair (dynamic resource sharing)
+for FETCH in RoundRobin Branch IQCount LSQCount; do
+  NAME="smt_branch_fp_fetch_${FETCH}"
+  build/X86/gem5.opt \
+    $CONFIG \
+    --cmd="$BENCHMARK" \
+    --args="$(smt_args branch);$(smt_args fp)" \
+    --threads=2 \
+    --roi \
+    --smt-fetch-policy=$FETCH \
+    --smt-iq-policy=Dynamic --smt-lsq-policy=Dynamic --smt-rob-policy=Dynamic \
+    --baseline-ipc="${ALONE_IPC[branch]},${ALONE_IPC[fp]}" \
+    > ${OUTPUT_BASE}/${NAME}.log 2>&1
+  cp m5out/stats.txt ${OUTPUT_BASE}/${NAME}_stats.txt
+  echo "✓ SMT branch + fp ($FETCH fetch) complete"
+done
 
 echo ""
 echo "=========================================="
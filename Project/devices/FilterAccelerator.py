@@ -0,0 +1,26 @@
+from m5.params import *
+from m5.proxy import *
+from m5.objects.Device import DmaDevice
+
+
+class FilterAccelerator(DmaDevice):
+    """Fixed-function moving-average filter and anomaly detector.
+
+    The driver programs the registers at pio_addr (see
+    devices/filter_accelerator.hh) with a range of SensorReading indices
+    in the buffer at buffer_addr and starts the job. The accelerator DMAs
+    the readings in chunks, filters them (and flags anomalies) at
+    readings_per_cycle, and DMAs the results back.
+    """
+
+    type = 'FilterAccelerator'
+    cxx_header = 'devices/filter_accelerator.hh'
+    cxx_class = 'gem5::FilterAccelerator'
+
+    pio_addr = Param.Addr("Physical address of the registers")
+    pio_size = Param.Addr(0x1000, "Size of the register window")
+    pio_latency = Param.Latency('10ns', "Register access latency")
+
+    buffer_addr = Param.Addr("Physical address of reading 0")
+    chunk_size = Param.Unsigned(256, "Readings per DMA transfer")
+    readings_per_cycle = Param.Float(1.0, "Filter throughput")
@@ -0,0 +1,30 @@
+from m5.params import *
+from m5.proxy import *
+from m5.objects.ClockedObject import ClockedObject
+
+
+class SensorDevice(ClockedObject):
+    """Sensor front-end that DMAs batches of readings into a ring buffer.
+
+    The ring buffer starts with a 64-byte header whose first 8 bytes count
+    the readings written so far (the completion counter polled by the
+    workload), followed by ring_slots SensorReading slots. Readings are
+    generated with the PRNG of workloads/edge_kernels.h, so the workload
+    receives the same data it would generate itself.
+    """
+
+    type = 'SensorDevice'
+    cxx_header = 'devices/sensor_device.hh'
+    cxx_class = 'gem5::SensorDevice'
+
+    system = Param.System(Parent.any, "System the device belongs to")
+    dma = RequestPort("DMA port (to a coherent crossbar)")
+
+    ring_addr = Param.Addr("Physical address of the ring buffer header")
+    ring_slots = Param.Unsigned(4096, "Readings held by the ring buffer")
+    batch_size = Param.Unsigned(64, "Readings per DMA batch")
+    rate = Param.Float(1e6, "Sampling rate in readings/s")
+
+    num_sensors = Param.Unsigned(8, "Number of sensors")
+    samples_per_sensor = Param.Unsigned(1024, "Samples per sensor")
+    seed = Param.UInt32(12345, "PRNG seed of the readings")
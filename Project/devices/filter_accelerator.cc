@@ -0,0 +1,199 @@
+#include "devices/filter_accelerator.hh"
+
+#include <algorithm>
+#include <cmath>
+
+#include "base/logging.hh"
+#include "base/trace.hh"
+#include "debug/FilterAccelerator.hh"
+#include "enums/PwrState.hh"
+#include "mem/packet_access.hh"
+
+namespace gem5
+{
+
+FilterAccelerator::FilterAccelerator(const FilterAcceleratorParams &p)
+    : DmaDevice(p),
+      pioAddr(p.pio_addr),
+      pioSize(p.pio_size),
+      pioDelay(p.pio_latency),
+      bufferAddr(p.buffer_addr),
+      chunkSize(p.chunk_size),
+      readingsPerCycle(p.readings_per_cycle),
+      status(IDLE), count(0), begin(0), end(0), detect(false),
+      chunkBegin(0), chunkEnd(0), haloBegin(0), haloEnd(0), jobStart(0),
+      inBuf(p.chunk_size + filterWindow - 1),
+      outBuf(p.chunk_size),
+      readEvent([this]{ chunkRead(); }, name() + ".readEvent"),
+      computeEvent([this]{ chunkComputed(); }, name() + ".computeEvent"),
+      writeEvent([this]{ chunkWritten(); }, name() + ".writeEvent"),
+      stats(this)
+{
+    fatal_if(chunkSize == 0, "%s: chunk_size must be positive", name());
+    fatal_if(readingsPerCycle <= 0, "%s: readings_per_cycle must be positive",
+             name());
+    static_assert(sizeof(Reading) == 16, "Reading must match SensorReading");
+}
+
+AddrRangeList
+FilterAccelerator::getAddrRanges() const
+{
+    AddrRangeList ranges;
+    ranges.push_back(RangeSize(pioAddr, pioSize));
+    return ranges;
+}
+
+Tick
+FilterAccelerator::read(PacketPtr pkt)
+{
+    Addr offset = pkt->getAddr() - pioAddr;
+    uint64_t value = 0;
+
+    switch (offset) {
+      case CTRL: value = detect ? ctrlDetect : 0; break;
+      case STATUS: value = status; break;
+      case COUNT: value = count; break;
+      case BEGIN: value = begin; break;
+      case END: value = end; break;
+      default:
+        warn("%s: read of unknown register %#x\n", name(), offset);
+    }
+    pkt->setUintX(value, ByteOrder::little);
+    pkt->makeResponse();
+    return pioDelay;
+}
+
+Tick
+FilterAccelerator::write(PacketPtr pkt)
+{
+    Addr offset = pkt->getAddr() - pioAddr;
+    uint64_t value = pkt->getUintX(ByteOrder::little);
+
+    switch (offset) {
+      case CTRL:
+        if (value & ctrlStart)
+            startJob(value);
+        break;
+      case COUNT: count = value; break;
+      case BEGIN: begin = value; break;
+      case END: end = value; break;
+      default:
+        warn("%s: write of %#x to unknown register %#x\n", name(), value,
+             offset);
+    }
+    pkt->makeResponse();
+    return pioDelay;
+}
+
+void
+FilterAccelerator::startJob(uint64_t ctrl)
+{
+    if (status == BUSY) {
+        warn("%s: start while busy ignored\n", name());
+        return;
+    }
+    fatal_if(begin > end || end > count,
+             "%s: invalid job [%d, %d) of %d readings", name(), begin, end,
+             count);
+
+    DPRINTF(FilterAccelerator, "Job [%d, %d) of %d readings%s\n",
+            begin, end, count, (ctrl & ctrlDetect) ? " with detection" : "");
+    detect = ctrl & ctrlDetect;
+    status = BUSY;
+    jobStart = curTick();
+    chunkEnd = begin;
+    powerState->set(enums::PwrState::ON);
+    startChunk();
+}
+
+void
+FilterAccelerator::startChunk()
+{
+    if (chunkEnd >= end) {
+        // Job done (or empty)
+        status = DONE;
+        stats.jobs++;
+        stats.busyTicks += curTick() - jobStart;
+        powerState->set(enums::PwrState::CLK_GATED);
+        return;
+    }
+
+    const uint64_t half = filterWindow / 2;
+
+    chunkBegin = chunkEnd;
+    chunkEnd = std::min<uint64_t>(chunkBegin + chunkSize, end);
+    haloBegin = chunkBegin > half ? chunkBegin - half : 0;
+    haloEnd = std::min<uint64_t>(chunkEnd + half, count);
+
+    int size = (haloEnd - haloBegin) * sizeof(Reading);
+    stats.bytesRead += size;
+    dmaRead(bufferAddr + haloBegin * sizeof(Reading), size, &readEvent,
+            (uint8_t *)inBuf.data());
+}
+
+void
+FilterAccelerator::chunkRead()
+{
+    const int64_t half = filterWindow / 2;
+
+    for (uint64_t i = chunkBegin; i < chunkEnd; i++) {
+        float sum = 0.0f;
+        int n = 0;
+
+        for (int64_t j = -half; j <= half; j++) {
+            int64_t idx = (int64_t)i + j;
+            if (idx >= 0 && idx < (int64_t)count) {
+                sum += inBuf[idx - haloBegin].rawValue;
+                n++;
+            }
+        }
+
+        Reading &r = outBuf[i - chunkBegin];
+        r = inBuf[i - haloBegin];
+        r.filteredValue = sum / n;
+        if (detect && (std::fabs(r.filteredValue - r.rawValue) > threshold ||
+                       r.filteredValue > limit)) {
+            r.anomalyFlag = 1;
+        }
+    }
+
+    Cycles cycles((uint64_t)std::ceil((chunkEnd - chunkBegin) /
+                                      readingsPerCycle));
+    stats.computeCycles += cycles;
+    schedule(computeEvent, clockEdge(cycles));
+}
+
+void
+FilterAccelerator::chunkComputed()
+{
+    int size = (chunkEnd - chunkBegin) * sizeof(Reading);
+    stats.bytesWritten += size;
+    dmaWrite(bufferAddr + chunkBegin * sizeof(Reading), size, &writeEvent,
+             (uint8_t *)outBuf.data());
+}
+
+void
+FilterAccelerator::chunkWritten()
+{
+    stats.readings += chunkEnd - chunkBegin;
+    startChunk();
+}
+
+FilterAccelerator::FilterAcceleratorStats::FilterAcceleratorStats(
+        FilterAccelerator *accel)
+    : statistics::Group(accel),
+      ADD_STAT(jobs, statistics::units::Count::get(), "Jobs completed"),
+      ADD_STAT(readings, statistics::units::Count::get(),
+               "Readings filtered"),
+      ADD_STAT(bytesRead, statistics::units::Byte::get(),
+               "Bytes read by DMA (chunks and window halos)"),
+      ADD_STAT(bytesWritten, statistics::units::Byte::get(),
+               "Bytes written by DMA"),
+      ADD_STAT(busyTicks, statistics::units::Tick::get(),
+               "Ticks from job start to job done, summed"),
+      ADD_STAT(computeCycles, statistics::units::Cycle::get(),
+               "Cycles spent filtering")
+{
+}
+
+} // namespace gem5
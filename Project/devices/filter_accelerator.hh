@@ -0,0 +1,129 @@
+/*
+ * Fixed-function filter accelerator for the edge pre-processing workloads.
+ *
+ * Memory-mapped registers (64-bit, offsets from pio_addr):
+ *   0x00 CTRL     write: bit 0 starts a job, bit 1 also detects anomalies
+ *   0x08 STATUS   read: 0 idle, 1 busy, 2 done (cleared by the next start)
+ *   0x10 COUNT    readings in the array (bounds of the filter window)
+ *   0x18 BEGIN    first reading to filter
+ *   0x20 END      one past the last reading to filter
+ *
+ * A job filters readings [BEGIN, END) of the SensorReading array at
+ * buffer_addr exactly as apply_moving_average_filter_range() (and
+ * detect_anomalies_range()) of workloads/edge_kernels.h do. It runs chunk
+ * by chunk: DMA read of the chunk with its window halo, compute for
+ * chunk / readings_per_cycle cycles, DMA write of the chunk. The device is
+ * clock gated (power state CLK_GATED) while idle.
+ */
+
+#ifndef __DEVICES_FILTER_ACCELERATOR_HH__
+#define __DEVICES_FILTER_ACCELERATOR_HH__
+
+#include <cstdint>
+#include <vector>
+
+#include "base/statistics.hh"
+#include "dev/dma_device.hh"
+#include "params/FilterAccelerator.hh"
+#include "sim/eventq.hh"
+
+namespace gem5
+{
+
+class FilterAccelerator : public DmaDevice
+{
+  public:
+    // SensorReading of workloads/edge_kernels.h
+    struct Reading
+    {
+        int32_t sensorId;
+        float rawValue;
+        float filteredValue;
+        uint8_t anomalyFlag;
+        uint8_t pad[3];
+    };
+
+    enum Register : Addr
+    {
+        CTRL = 0x00,
+        STATUS = 0x08,
+        COUNT = 0x10,
+        BEGIN = 0x18,
+        END = 0x20,
+    };
+
+    enum Status : uint64_t
+    {
+        IDLE = 0,
+        BUSY = 1,
+        DONE = 2,
+    };
+
+    static constexpr uint64_t ctrlStart = 0x1;
+    static constexpr uint64_t ctrlDetect = 0x2;
+
+    // Constants of workloads/edge_kernels.h
+    static constexpr int filterWindow = 5;
+    static constexpr float threshold = 100.0f;
+    static constexpr float limit = 140.0f;
+
+    FilterAccelerator(const FilterAcceleratorParams &p);
+
+    AddrRangeList getAddrRanges() const override;
+    Tick read(PacketPtr pkt) override;
+    Tick write(PacketPtr pkt) override;
+
+  private:
+    const Addr pioAddr;
+    const Addr pioSize;
+    const Tick pioDelay;
+    const Addr bufferAddr;
+    const unsigned chunkSize;
+    const double readingsPerCycle;
+
+    uint64_t status;
+    uint64_t count;
+    uint64_t begin;
+    uint64_t end;
+    bool detect;
+
+    // Current chunk [chunkBegin, chunkEnd) and its halo [haloBegin, haloEnd)
+    uint64_t chunkBegin;
+    uint64_t chunkEnd;
+    uint64_t haloBegin;
+    uint64_t haloEnd;
+    Tick jobStart;
+
+    std::vector<Reading> inBuf;
+    std::vector<Reading> outBuf;
+
+    EventFunctionWrapper readEvent;
+    EventFunctionWrapper computeEvent;
+    EventFunctionWrapper writeEvent;
+
+    void startJob(uint64_t ctrl);
+    // Read the next chunk with its halo
+    void startChunk();
+    // Chunk read: filter it and wait for the compute time
+    void chunkRead();
+    // Compute done: write the chunk back
+    void chunkComputed();
+    // Chunk written: next chunk or job done
+    void chunkWritten();
+
+    struct FilterAcceleratorStats : public statistics::Group
+    {
+        FilterAcceleratorStats(FilterAccelerator *accel);
+
+        statistics::Scalar jobs;
+        statistics::Scalar readings;
+        statistics::Scalar bytesRead;
+        statistics::Scalar bytesWritten;
+        statistics::Scalar busyTicks;
+        statistics::Scalar computeCycles;
+    } stats;
+};
+
+} // namespace gem5
+
+#endif // __DEVICES_FILTER_ACCELERATOR_HH__
@@ -0,0 +1,146 @@
+#include "devices/sensor_device.hh"
+
+#include <algorithm>
+
+#include "base/logging.hh"
+#include "base/trace.hh"
+#include "debug/SensorDevice.hh"
+#include "sim/core.hh"
+
+namespace gem5
+{
+
+SensorDevice::SensorDevice(const SensorDeviceParams &p)
+    : ClockedObject(p),
+      dmaPort(this, p.system),
+      ringAddr(p.ring_addr),
+      ringSlots(p.ring_slots),
+      batchSize(p.batch_size),
+      period(sim_clock::as_int::s * p.batch_size / p.rate),
+      samplesPerSensor(p.samples_per_sensor),
+      totalReadings((uint64_t)p.num_sensors * p.samples_per_sensor),
+      seed(p.seed),
+      sampled(0),
+      completed(0),
+      dmaBusy(false),
+      batchData(p.batch_size),
+      counterData(0),
+      sampleEvent([this]{ sampleBatch(); }, name() + ".sampleEvent"),
+      dataEvent([this]{ dataWritten(); }, name() + ".dataEvent"),
+      counterEvent([this]{ counterWritten(); }, name() + ".counterEvent"),
+      stats(this)
+{
+    fatal_if(batchSize == 0 || ringSlots % batchSize,
+             "%s: ring_slots must be a multiple of batch_size", name());
+    fatal_if(p.rate <= 0, "%s: rate must be positive", name());
+    static_assert(sizeof(Reading) == 16, "Reading must match SensorReading");
+}
+
+Port &
+SensorDevice::getPort(const std::string &if_name, PortID idx)
+{
+    if (if_name == "dma")
+        return dmaPort;
+    return ClockedObject::getPort(if_name, idx);
+}
+
+void
+SensorDevice::startup()
+{
+    // The first batch is complete one period after the sensors start
+    if (totalReadings > 0)
+        schedule(sampleEvent, curTick() + period);
+}
+
+float
+SensorDevice::nextRawValue()
+{
+    // Same PRNG as next_raw_value() in workloads/edge_kernels.h
+    seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+    return (float)(seed % 200) - 50.0f;
+}
+
+void
+SensorDevice::sampleBatch()
+{
+    readyBatches.push_back(curTick());
+    sampled += std::min<uint64_t>(batchSize, totalReadings - sampled);
+    if (dmaBusy)
+        stats.queuedBatches++;
+    else
+        startDma();
+
+    if (sampled < totalReadings)
+        schedule(sampleEvent, curTick() + period);
+}
+
+void
+SensorDevice::startDma()
+{
+    uint64_t first = completed;
+    unsigned count = std::min<uint64_t>(batchSize, totalReadings - first);
+
+    for (unsigned i = 0; i < count; i++) {
+        Reading &r = batchData[i];
+        r = Reading{};
+        r.sensorId = (first + i) / samplesPerSensor;
+        r.rawValue = nextRawValue();
+    }
+
+    Addr slot = ringAddr + headerBytes +
+        (first % ringSlots) * sizeof(Reading);
+    DPRINTF(SensorDevice, "DMA readings %llu-%llu to %#x\n",
+            first, first + count - 1, slot);
+    dmaBusy = true;
+    dmaPort.dmaAction(MemCmd::WriteReq, slot, count * sizeof(Reading),
+                      &dataEvent, (uint8_t *)batchData.data(), 0);
+}
+
+void
+SensorDevice::dataWritten()
+{
+    counterData = completed +
+        std::min<uint64_t>(batchSize, totalReadings - completed);
+    dmaPort.dmaAction(MemCmd::WriteReq, ringAddr, sizeof(counterData),
+                      &counterEvent, (uint8_t *)&counterData, 0);
+}
+
+void
+SensorDevice::counterWritten()
+{
+    unsigned count = counterData - completed;
+
+    completed = counterData;
+    stats.batches++;
+    stats.readings += count;
+    stats.bytesWritten += count * sizeof(Reading) + sizeof(counterData);
+    stats.totalDmaLatency += curTick() - readyBatches.front();
+    readyBatches.pop_front();
+    DPRINTF(SensorDevice, "Batch complete, %llu readings written\n",
+            completed);
+
+    dmaBusy = false;
+    if (!readyBatches.empty())
+        startDma();
+}
+
+SensorDevice::SensorDeviceStats::SensorDeviceStats(SensorDevice *device)
+    : statistics::Group(device),
+      ADD_STAT(batches, statistics::units::Count::get(),
+               "Batches written (completion events)"),
+      ADD_STAT(readings, statistics::units::Count::get(),
+               "Readings written to the ring buffer"),
+      ADD_STAT(bytesWritten, statistics::units::Byte::get(),
+               "Bytes written by DMA (readings and completion counter)"),
+      ADD_STAT(queuedBatches, statistics::units::Count::get(),
+               "Batches that waited for the previous DMA"),
+      ADD_STAT(totalDmaLatency, statistics::units::Tick::get(),
+               "Ticks from batch ready to completion, summed"),
+      ADD_STAT(avgDmaLatency, statistics::units::Rate<
+                    statistics::units::Tick, statistics::units::Count>::get(),
+               "Average ticks from batch ready to completion")
+{
+    avgDmaLatency = totalDmaLatency / batches;
+}
+
+} // namespace gem5
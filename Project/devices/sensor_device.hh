@@ -0,0 +1,104 @@
+/*
+ * Sensor input device for the edge pre-processing workloads.
+ *
+ * Every batch_size / rate seconds a batch of readings has been sampled
+ * and is written by DMA into the next slots of a ring buffer in memory,
+ * followed by an update of the completion counter in the ring header. A
+ * batch that becomes ready while the previous one is still in flight
+ * waits for the DMA engine, so memory contention shows up as DMA latency
+ * and queued batches.
+ */
+
+#ifndef __DEVICES_SENSOR_DEVICE_HH__
+#define __DEVICES_SENSOR_DEVICE_HH__
+
+#include <cstdint>
+#include <deque>
+#include <vector>
+
+#include "base/statistics.hh"
+#include "dev/dma_device.hh"
+#include "params/SensorDevice.hh"
+#include "sim/clocked_object.hh"
+#include "sim/eventq.hh"
+
+namespace gem5
+{
+
+class SensorDevice : public ClockedObject
+{
+  public:
+    // SensorReading of workloads/edge_kernels.h
+    struct Reading
+    {
+        int32_t sensorId;
+        float rawValue;
+        float filteredValue;
+        uint8_t anomalyFlag;
+        uint8_t pad[3];
+    };
+
+    // Bytes before the first slot; the completion counter is at offset 0
+    static constexpr Addr headerBytes = 64;
+
+    SensorDevice(const SensorDeviceParams &p);
+
+    Port &getPort(const std::string &if_name,
+                  PortID idx=InvalidPortID) override;
+
+    void startup() override;
+
+  private:
+    DmaPort dmaPort;
+
+    const Addr ringAddr;
+    const unsigned ringSlots;
+    const unsigned batchSize;
+    const Tick period;
+    const unsigned samplesPerSensor;
+    const uint64_t totalReadings;
+
+    // PRNG state (next_raw_value)
+    uint32_t seed;
+    // Readings sampled so far
+    uint64_t sampled;
+    // Readings whose DMA completed (value of the completion counter)
+    uint64_t completed;
+    // Ready tick of every sampled batch not yet written
+    std::deque<Tick> readyBatches;
+    bool dmaBusy;
+
+    std::vector<Reading> batchData;
+    uint64_t counterData;
+
+    EventFunctionWrapper sampleEvent;
+    EventFunctionWrapper dataEvent;
+    EventFunctionWrapper counterEvent;
+
+    float nextRawValue();
+
+    // A batch has been sampled
+    void sampleBatch();
+    // Write the oldest ready batch into the ring
+    void startDma();
+    // Batch data written: publish it through the completion counter
+    void dataWritten();
+    // Completion counter written: the batch is visible to the workload
+    void counterWritten();
+
+    struct SensorDeviceStats : public statistics::Group
+    {
+        SensorDeviceStats(SensorDevice *device);
+
+        statistics::Scalar batches;
+        statistics::Scalar readings;
+        statistics::Scalar bytesWritten;
+        statistics::Scalar queuedBatches;
+        statistics::Scalar totalDmaLatency;
+        statistics::Formula avgDmaLatency;
+    } stats;
+};
+
+} // namespace gem5
+
+#endif // __DEVICES_SENSOR_DEVICE_HH__
@@ -0,0 +1,138 @@
+#!/bin/bash
+
+# Smoke test of the device models: builds gem5 with
+# EXTRAS=configs/practice/Project/devices, then runs a small --sensor-dma and
+# --accelerator configuration and checks them against the CPU-only runs of
+# the same workloads
+# Run from the gem5 root, like the experiment scripts
+
+set -e  # Exit on error
+
+BASE_DIR="configs/practice/Project"
+GEM5_BIN="./build/ARM/gem5.opt"
+CONFIG_SCRIPT="${BASE_DIR}/edge_power_config.py"
+SMOKE_DIR="${BASE_DIR}/results/smoke"
+INGEST_BINARY="${SMOKE_DIR}/edge_ingest_arm"
+ACCEL_BINARY="${SMOKE_DIR}/edge_preprocessing_accel_arm"
+# Small problem so that every run takes seconds
+SIZE_ARGS="--samples-per-sensor=1024"
+
+echo "======================================================================"
+echo "Device Model Smoke Test"
+echo "======================================================================"
+
+echo ""
+echo "Step 1: Building gem5 with the device models..."
+echo "----------------------------------------------------------------------"
+scons "${GEM5_BIN#./}" EXTRAS="${BASE_DIR}/devices" -j "$(nproc)"
+
+echo ""
+echo "Step 2: Compiling the device workloads..."
+echo "----------------------------------------------------------------------"
+mkdir -p "${SMOKE_DIR}"
+rm -f "${SMOKE_DIR}"/*_result.csv
+aarch64-linux-gnu-gcc -O2 -static "${BASE_DIR}/workloads/edge_ingest.c" \
+    -o "${INGEST_BINARY}" -lm
+aarch64-linux-gnu-gcc -O2 -static "${BASE_DIR}/workloads/edge_preprocessing_accel.c" \
+    -o "${ACCEL_BINARY}" -lm
+echo "✓ Compiled ${INGEST_BINARY} and ${ACCEL_BINARY}"
+
+echo ""
+echo "Step 3: Running the smoke tests..."
+echo "======================================================================"
+
+failures=0
+
+# Run one configuration: smoke_run <name> <binary> <config args...>
+smoke_run() {
+    local name="$1"
+    local binary="$2"
+    shift 2
+
+    echo ""
+    echo "Run: ${name} ($*)"
+    if ${GEM5_BIN} --outdir="${SMOKE_DIR}/m5out_${name}" "${CONFIG_SCRIPT}" \
+        --binary="${binary}" \
+        --power-models \
+        --config-name="${name}" \
+        --output-dir="${SMOKE_DIR}" \
+        ${SIZE_ARGS} "$@" > "${SMOKE_DIR}/${name}.log" 2>&1; then
+        echo "✓ ${name} completed"
+    else
+        echo "✗ ${name} failed (see ${SMOKE_DIR}/${name}.log)"
+        failures=$((failures + 1))
+    fi
+}
+
+# Value of a column of <name>_result.csv, looked up by header name
+result_field() {
+    local result_file="${SMOKE_DIR}/$1_result.csv"
+    [ -f "${result_file}" ] || return 0
+    awk -F, -v column="$2" '
+        NR == 1 { for (i = 1; i <= NF; i++) if ($i == column) c = i }
+        NR == 2 && c { print $c }' "${result_file}"
+}
+
+# Aggregate report printed by the workload (program.out for streaming runs,
+# otherwise the gem5 log)
+aggregate_report() {
+    local output="${SMOKE_DIR}/m5out_$1/program.out"
+    [ -f "${output}" ] || output="${SMOKE_DIR}/$1.log"
+    sed -n '/^Aggregate Statistics:/,/Anomalies detected/p' "${output}"
+}
+
+# check <description> <condition...>
+check() {
+    local description="$1"
+    shift
+    if "$@"; then
+        echo "  ✓ ${description}"
+    else
+        echo "  ✗ ${description}"
+        failures=$((failures + 1))
+    fi
+}
+
+positive() {
+    awk -v value="$1" 'BEGIN { exit !(value + 0 > 0) }'
+}
+
+same_report() {
+    local expected actual
+    expected=$(aggregate_report "$1")
+    actual=$(aggregate_report "$2")
+    [ -n "${expected}" ] && [ "${expected}" = "${actual}" ]
+}
+
+# DMA sensor ingest: readings generated by the CPU vs written by the device
+smoke_run ingest_cpu "${INGEST_BINARY}" --l2-cache
+smoke_run ingest_dma "${INGEST_BINARY}" --l2-cache --sensor-dma
+smoke_run ingest_dma_l2bus "${INGEST_BINARY}" --l2-cache --sensor-dma \
+    --sensor-dma-port=l2bus
+
+for name in ingest_dma ingest_dma_l2bus; do
+    echo ""
+    echo "${name}:"
+    check "DMA batches completed" positive "$(result_field ${name} dma_batches)"
+    check "no ring overruns" [ "$(result_field ${name} ring_overruns)" = "0" ]
+    check "aggregate report matches ingest_cpu" same_report ingest_cpu ${name}
+done
+
+# Filter accelerator: CPU-only vs offloaded filter
+smoke_run accel_cpu "${ACCEL_BINARY}" --l2-cache
+smoke_run accel_on "${ACCEL_BINARY}" --l2-cache --accelerator
+
+echo ""
+echo "accel_on:"
+check "accelerator filtered readings" positive "$(result_field accel_on accel_readings)"
+check "accelerator energy counted" positive "$(result_field accel_on accel_energy_j)"
+check "aggregate report matches accel_cpu" same_report accel_cpu accel_on
+
+echo ""
+echo "======================================================================"
+if [ ${failures} -eq 0 ]; then
+    echo "✓ Device smoke test passed"
+else
+    echo "✗ Device smoke test: ${failures} failure(s) (logs in ${SMOKE_DIR})"
+    exit 1
+fi
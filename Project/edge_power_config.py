@@ -7,19 +7,217 @@ This configuration implements the architectural specifications from Phase 1:
 - MinorCPU (in-order baseline) vs O3CPU (out-of-order comparison)
 - Explicit power modeling with multiple power states
 - ARM ISA (ARMv8-A 64-bit)
-- Configurable cache hierarchy (L1 only or L1+L2)
+- Configurable cache hierarchy (L1 only, L1+L2 or L1+L2+L3) with per-level
+  miss rate and AMAT
+- Compressed L2 option (BDI, C-Pack, FPC on compressed tags) with the
+  compression ratio, decompression cost and data + tag storage, to compare
+  against uncompressed L2s of equal and of larger area
+- Main memory technology (DDR3/DDR4/LPDDR3/LPDDR5/HBM), interleaved
+  channels, page and scheduling policy with DRAM bandwidth/latency/power
+- Multi-core option (private L1s, shared L2 through L2XBar)
+- Heterogeneous big.LITTLE option (MinorCPU + ArmO3CPU clusters in separate
+  clock/voltage domains) with phase-to-cluster task placement
+- Streaming mode: per-window latency percentiles and max sustainable rate
+- ROI mode: per-phase IPC, cache misses and energy from m5ops work items
+- Thermal mode: RC thermal network (die, case, ambient) whose domain
+  temperature drives the `temp` term of the leakage expressions, with a
+  temperature/leakage trajectory per stat epoch
+- Ruby memory system option (MESI two-level, MOESI directory, CHI) with
+  invalidations, sharing misses and directory occupancy
+- Parallel host simulation: every core (with its private caches) on its
+  own event queue, synchronized every --sim-quantum, with the host speedup
+  and the stat deviation against a single-queue run
+- Data layout option (AoS, SoA, Q15/Q31 fixed point) with the working set
+  of each layout and an output-equivalence check against the float AoS run
+- Scratchpad option: a low-latency SimpleMemory on its own address range,
+  next to or instead of the L1D, with the on-chip memory energy (L1D and
+  scratchpad accesses and leakage) against the cached configuration
+- DMA sensor input option: a SensorDevice (devices/) that DMAs batches of
+  readings into a ring buffer at the arrival rate and signals completion
+  through a counter, with the ingest bandwidth and DMA latency
+- Filter accelerator option: a memory-mapped FilterAccelerator (devices/)
+  with a DMA engine and configurable throughput/power that takes over the
+  moving-average filter and anomaly detection, against CPU-only runs
+- SVE vector length option (128-2048 bits) for the NEON/SVE kernel
+  variants of edge_preprocessing, with the energy per reading
 
 Usage:
     gem5 edge_power_config.py --cpu-type=minor --binary=workloads/edge_preprocessing_arm
     gem5 edge_power_config.py --cpu-type=o3 --binary=workloads/edge_preprocessing_arm --l2-cache
+    gem5 edge_power_config.py --cpu-type=o3 --binary=workloads/edge_preprocessing_arm \
+        --l3-cache --l3-size=4MB --l3-policy=exclusive
+    gem5 edge_power_config.py --cpu-type=minor --binary=workloads/edge_preprocessing_arm \
+        --l2-cache --l2-size=64kB --l2-compressor=bdi
+    gem5 edge_power_config.py --cpu-type=minor --binary=workloads/edge_preprocessing_arm \
+        --mem-type=lpddr5 --mem-channels=2 --page-policy=close
+    gem5 edge_power_config.py --cpu-type=minor --num-cores=4 \
+        --binary=workloads/edge_preprocessing_mt_arm --options=4
+    gem5 edge_power_config.py --cpu-type=biglittle --little-cores=2 --big-cores=2 \
+        --binary=workloads/edge_preprocessing_mt_arm --task-placement --power-models
+    gem5 edge_power_config.py --cpu-type=minor --streaming --arrival-rate=2000000 \
+        --binary=workloads/edge_streaming_arm
+    gem5 edge_power_config.py --cpu-type=o3 --roi --power-models \
+        --binary=workloads/edge_preprocessing_roi_arm
+    gem5 edge_power_config.py --cpu-type=o3 --thermal --ambient-temp=45 \
+        --binary=workloads/edge_preprocessing_arm
+    gem5 edge_power_config.py --cpu-type=minor --num-cores=4 --parallel-eventqs \
+        --sim-quantum=1us --baseline-result=results/minor_4_result.csv \
+        --binary=workloads/edge_preprocessing_mt_arm --options=4
+    gem5 edge_power_config.py --cpu-type=minor --num-cores=4 --ruby=mesi \
+        --binary=workloads/edge_preprocessing_mt_arm --options="4 0 shared"
+    gem5 edge_power_config.py --cpu-type=o3 --power-models --sve-vl=512 \
+        --binary=workloads/edge_preprocessing_sve_arm --options=sve
+    gem5 edge_power_config.py --cpu-type=minor --power-models --layout=q15 \
+        --binary=workloads/edge_preprocessing_layout_arm
+    gem5 edge_power_config.py --cpu-type=minor --power-models --l2-cache \
+        --scratchpad=replace --binary=workloads/edge_preprocessing_spm_arm
+    gem5 edge_power_config.py --cpu-type=o3 --l2-cache --sensor-dma \
+        --arrival-rate=4000000 --binary=workloads/edge_ingest_arm
+    gem5 edge_power_config.py --cpu-type=minor --l2-cache --power-models \
+        --accelerator --binary=workloads/edge_preprocessing_accel_arm
 """
 
 import argparse
+import math
 import sys
 import os
+import time
 
 import m5
+from m5.defines import buildEnv
 from m5.objects import *
+from m5.util import addToPath
+from m5.util.convert import toLatency, toMemorySize
+
+# configs/ (common, ruby) for the Ruby memory system
+addToPath('../../')
+
+from edge_stats import (read_stat_dumps, summarize_run, print_summary,
+                        read_window_timings, read_equivalence_check,
+                        summarize_latency, print_latency_summary,
+                        summarize_phase, summarize_roi,
+                        print_phase_table, flatten_phase_results,
+                        summarize_cache_levels, print_cache_levels,
+                        summarize_dram, print_dram_summary,
+                        summarize_onchip_memory, print_onchip_memory,
+                        summarize_sensor_dma, print_sensor_dma,
+                        summarize_accelerator, print_accelerator_summary,
+                        summarize_l2_compression, print_l2_compression,
+                        read_ring_overruns,
+                        summarize_thermal, print_thermal_summary,
+                        summarize_coherence, print_coherence_summary,
+                        load_result_csv, compare_with_baseline,
+                        print_parallel_summary,
+                        save_results_csv, save_trajectory_csv)
+
+
+# Default problem size of the edge workload
+# (must match the defaults in workloads/edge_kernels.h)
+DEFAULT_SENSORS = 8
+DEFAULT_SAMPLES_PER_SENSOR = 1024
+DEFAULT_SEED = 12345
+SENSOR_READING_BYTES = 16   # sizeof(SensorReading)
+
+# Bytes per reading of the edge_preprocessing_layout representations
+# (must match layout_bytes in workloads/edge_preprocessing_layout.c)
+LAYOUT_BYTES = {
+    'aos': SENSOR_READING_BYTES,
+    'soa': 13,
+    'q15': 9,
+    'q31': 13,
+}
+
+# File (inside the gem5 output directory) receiving the workload's stdout
+# in streaming mode, where the config parses the per-window timestamps
+PROGRAM_OUTPUT = 'program.out'
+
+# ROI phase names, indexed by the m5ops work id
+# (must match the ROI_* ids in workloads/edge_roi.h)
+ROI_PHASES = ['filter', 'anomaly_detection', 'aggregate', 'normalize',
+              'per_sensor_stats']
+
+# Main memory technologies (src/mem/DRAMInterface.py). gem5 has no LPDDR4
+# model; LPDDR3 is the closest low-power part before LPDDR5.
+DRAM_TYPES = {
+    'ddr3': DDR3_1600_8x8,
+    'ddr4': DDR4_2400_8x8,
+    'lpddr3': LPDDR3_1600_1x32,
+    'lpddr5': LPDDR5_6400_1x16_BG_BL32,
+    'hbm': HBM_1000_4H_1x128,
+}
+
+# L3 inclusion policies: name -> (L3 clusivity, L2 writeback_clean).
+# Classic gem5 caches do not back-invalidate upper levels, so "inclusive"
+# behaves like "nine" (allocate on fill); an exclusive L3 is a victim cache
+# filled by L2 evictions, clean ones included.
+L3_POLICIES = {
+    'inclusive': ('mostly_incl', False),
+    'nine': ('mostly_incl', False),
+    'exclusive': ('mostly_excl', True),
+}
+
+# L2 compressors (src/mem/cache/compressors/Compressors.py). A compressed
+# L2 uses CompressedTags: two tags per data block, so it holds up to twice
+# the lines when they compress to half a block or less.
+L2_COMPRESSORS = {
+    'none': None,
+    'bdi': BDI,
+    'cpack': CPack,
+    'fpc': FPC,
+}
+
+# Storage model of the L2 area comparison: 64-byte lines (gem5's default
+# cache_line_size), tags of a 48-bit physical address with 4 state bits,
+# and with compression a compressed-size field of log2(64) + 1 bits per tag
+CACHE_LINE_BYTES = 64
+PHYS_ADDR_BITS = 48
+TAG_STATE_BITS = 4
+
+# Private L1D size of every core
+L1D_SIZE = '32kB'
+
+# Scratchpad placement: physical range just above the 4GB of DRAM, mapped
+# (uncacheable) into the workload at a fixed virtual address that is passed
+# to edge_preprocessing_spm as its spm_base argument
+SCRATCHPAD_PADDR = 0x100000000
+SCRATCHPAD_VADDR = 0x2000000000
+
+
+# Sensor ring buffer: in DRAM (so DMA and cores contend for it), at the top
+# of the 4GB where SE mode's page allocator does not reach, mapped into the
+# workload at a fixed virtual address passed to edge_ingest as ring_base.
+# The 64-byte header holds the completion counter
+# (must match RING_HEADER_BYTES in workloads/edge_ingest.c)
+RING_PADDR = 0xF0000000
+RING_VADDR = 0x3000000000
+RING_HEADER_BYTES = 64
+
+# Filter accelerator: uncacheable register window above the scratchpad and
+# a DMA buffer in DRAM below the sensor ring (at most 256MB of readings),
+# both mapped into edge_preprocessing_accel at fixed virtual addresses
+ACCEL_PIO_PADDR = 0x110000000
+ACCEL_PIO_VADDR = 0x4000000000
+ACCEL_PIO_SIZE = 0x1000
+ACCEL_BUFFER_PADDR = 0xE0000000
+ACCEL_BUFFER_VADDR = 0x5000000000
+ACCEL_BUFFER_MAX = RING_PADDR - ACCEL_BUFFER_PADDR
+
+
+# Ruby coherence protocols: option -> gem5 protocol (built with
+# PROTOCOL=<name>, or RUBY_PROTOCOL_<NAME> in a multi-protocol build)
+RUBY_PROTOCOLS = {
+    'mesi': 'MESI_Two_Level',
+    'moesi': 'MOESI_CMP_directory',
+    'chi': 'CHI',
+}
+
+# L1D miss stat of core <i> for the CPU power models under Ruby (CHI names
+# its controllers per configuration, so its power models omit the term)
+RUBY_L1D_MISSES = {
+    'mesi': 'system.ruby.l1_cntrl{}.L1Dcache.m_demand_misses',
+    'moesi': 'system.ruby.l1_cntrl{}.L1Dcache.m_demand_misses',
+    'chi': None,
+}
 
 
 # ==============================================================================
@@ -28,14 +226,13 @@ from m5.objects import *
 
 class CpuPowerOn(MathExprPowerModel):
     """Power model for CPU in ON state (active processing)."""
-    def __init__(self, cpu_path, **kwargs):
+    def __init__(self, cpu_path, dcache_misses, **kwargs):
         super().__init__(**kwargs)
         # Dynamic power: IPC-dependent + cache miss penalty
         self.dyn = (
             "voltage * voltage * "
             "(2.0 * {}.ipc + "
-            "0.003 * {}.dcache.overallMisses / simSeconds)".format(
-                cpu_path, cpu_path)
+            "0.003 * {} / simSeconds)".format(cpu_path, dcache_misses)
         )
         # Static power: Temperature-dependent leakage
         self.st = "0.1 + (4.0 * 0.001 * temp)"
@@ -43,14 +240,13 @@ class CpuPowerOn(MathExprPowerModel):
 
 class CpuPowerClkGated(MathExprPowerModel):
     """Power model for CPU in CLK_GATED state (clock gating active)."""
-    def __init__(self, cpu_path, **kwargs):
+    def __init__(self, cpu_path, dcache_misses, **kwargs):
         super().__init__(**kwargs)
         # Reduced dynamic power (20% of ON state)
         self.dyn = (
             "voltage * voltage * "
             "(0.4 * {}.ipc + "
-            "0.0006 * {}.dcache.overallMisses / simSeconds)".format(
-                cpu_path, cpu_path)
+            "0.0006 * {} / simSeconds)".format(cpu_path, dcache_misses)
         )
         # Same leakage as ON state
         self.st = "0.1 + (4.0 * 0.001 * temp)"
@@ -73,17 +269,49 @@ class CpuPowerOff(MathExprPowerModel):
 
 
 class CpuPowerModel(PowerModel):
-    """Complete CPU power model combining all power states."""
-    def __init__(self, cpu_path, **kwargs):
+    """Complete CPU power model combining all power states.
+    
+    dcache_misses is the stat (or expression) counting the core's L1D
+    misses; by default the classic `<cpu>.dcache.overallMisses`.
+    """
+    def __init__(self, cpu_path, dcache_misses=None, **kwargs):
         super().__init__(**kwargs)
+        dcache_misses = dcache_misses or f'{cpu_path}.dcache.overallMisses'
         self.pm = [
-            CpuPowerOn(cpu_path),            # State 0: ON
-            CpuPowerClkGated(cpu_path),      # State 1: CLK_GATED
+            CpuPowerOn(cpu_path, dcache_misses),        # State 0: ON
+            CpuPowerClkGated(cpu_path, dcache_misses),  # State 1: CLK_GATED
             CpuPowerSRAMRetention(cpu_path), # State 2: SRAM_RETENTION
             CpuPowerOff(),                   # State 3: OFF
         ]
 
 
+class AcceleratorPowerLeakage(MathExprPowerModel):
+    """Leakage of the filter accelerator (running or clock gated).
+    
+    The dynamic energy (--accel-energy-pj per filtered reading) is not a
+    power state term: the PowerModel weights each state's power by its
+    residency, so an ON-state power of energy / simSeconds would be scaled
+    down by the busy fraction. edge_stats.summarize_accelerator adds it as
+    readings x energy per reading instead.
+    """
+    def __init__(self, static_mw, **kwargs):
+        super().__init__(**kwargs)
+        self.dyn = "0.0"
+        self.st = "{} * 0.001".format(static_mw)
+
+
+class AcceleratorPowerModel(PowerModel):
+    """Filter accelerator power model for all power states."""
+    def __init__(self, static_mw, **kwargs):
+        super().__init__(**kwargs)
+        self.pm = [
+            AcceleratorPowerLeakage(static_mw),  # ON
+            AcceleratorPowerLeakage(static_mw),  # CLK_GATED
+            AcceleratorPowerLeakage(static_mw),  # SRAM_RETENTION
+            CpuPowerOff(),                       # OFF
+        ]
+
+
 class CachePowerOn(MathExprPowerModel):
     """Power model for cache in ON state."""
     def __init__(self, cache_path, **kwargs):
@@ -184,10 +412,381 @@ class L2Cache(Cache):
         self.mem_side = bus.cpu_side_ports
 
 
+class L3Cache(Cache):
+    """L3 Shared Last-Level Cache"""
+    size = '2MB'
+    assoc = 16
+    tag_latency = 20
+    data_latency = 20
+    response_latency = 20
+    mshrs = 32
+    tgts_per_mshr = 12
+    writeback_clean = False
+    
+    def connectCPUSideBus(self, bus):
+        self.cpu_side = bus.mem_side_ports
+    
+    def connectMemSideBus(self, bus):
+        self.mem_side = bus.cpu_side_ports
+
+
 # ==============================================================================
 # System Configuration Functions
 # ==============================================================================
 
+def create_cpu(cpu_type, cpu_id=0, l1_caches=True, scratchpad=None):
+    """Create one core with its private L1 instruction and data caches.
+    
+    With l1_caches=False (Ruby) the L1s belong to the Ruby controllers.
+    With a scratchpad the data port is left for create_scratchpad, and
+    scratchpad='replace' omits the L1D.
+    """
+    
+    if cpu_type == 'minor':
+        cpu = MinorCPU(cpu_id=cpu_id)
+    elif cpu_type == 'o3':
+        cpu = ArmO3CPU(cpu_id=cpu_id)
+        # Configure O3 parameters (using gem5 parameter names)
+        cpu.numROBEntries = 128
+        cpu.numPhysIntRegs = 128
+        cpu.numPhysFloatRegs = 128
+        cpu.LQEntries = 32
+        cpu.SQEntries = 32
+        # Note: Issue queues configured via instQueues (using defaults)
+    else:
+        print(f"Error: Unknown CPU type '{cpu_type}'")
+        sys.exit(1)
+    
+    # Create interrupt controller for ARM
+    cpu.createInterruptController()
+    if not l1_caches:
+        return cpu
+    
+    # Create private L1 caches
+    cpu.icache = L1ICache()
+    cpu.icache.size = '16kB'
+    cpu.icache.assoc = 2
+    cpu.icache.connectCPU(cpu)
+    if scratchpad == 'replace':
+        return cpu
+    
+    cpu.dcache = L1DCache()
+    cpu.dcache.size = L1D_SIZE
+    cpu.dcache.assoc = 4
+    if not scratchpad:
+        cpu.dcache.connectCPU(cpu)
+    
+    return cpu
+
+
+def create_scratchpad(system, cpu, args):
+    """Scratchpad (SimpleMemory) on the core's data port.
+    
+    A zero-latency crossbar routes the data port by address: the scratchpad
+    range to system.scratchpad, everything else to the L1D ('alongside') or
+    straight to the L2/memory bus ('replace', connected by connect_data_side).
+    """
+    system.scratchpad = SimpleMemory(
+        range=AddrRange(SCRATCHPAD_PADDR, size=args.scratchpad_size),
+        latency=args.scratchpad_latency,
+        latency_var='0ns',
+        bandwidth=args.scratchpad_bandwidth,
+    )
+    system.spm_bus = NoncoherentXBar(width=16, frontend_latency=0,
+                                     forward_latency=0, response_latency=0)
+    system.spm_bus.cpu_side_ports = cpu.dcache_port
+    system.scratchpad.port = system.spm_bus.mem_side_ports
+    if args.scratchpad == 'alongside':
+        # The L1D only serves DRAM addresses
+        cpu.dcache.addr_ranges = system.mem_ranges
+        cpu.dcache.cpu_side = system.spm_bus.mem_side_ports
+
+
+def connect_data_side(system, cpu, bus, args):
+    """Connect the core's data path to bus: its L1D or, when the scratchpad
+    replaces the L1D, the scratchpad crossbar."""
+    if args.scratchpad == 'replace':
+        system.spm_bus.mem_side_ports = bus.cpu_side_ports
+    else:
+        cpu.dcache.connectBus(bus)
+
+
+def map_scratchpad(system, args):
+    """Map the scratchpad into the workload (after m5.instantiate)."""
+    process = system.cpu.workload[0]
+    process.map(SCRATCHPAD_VADDR, SCRATCHPAD_PADDR,
+                toMemorySize(args.scratchpad_size), False)
+
+
+def device_model_built(name):
+    """Whether gem5 was built with the device model name from devices/."""
+    return name in globals()
+
+
+def create_sensor_device(system, args):
+    """DMA sensor device writing the ring buffer through the membus (or the
+    L2 crossbar, so that ingest allocates in the L2)."""
+    system.sensor = SensorDevice(
+        ring_addr=RING_PADDR,
+        ring_slots=args.ring_slots,
+        batch_size=args.dma_batch,
+        rate=args.arrival_rate,
+        num_sensors=args.sensors or DEFAULT_SENSORS,
+        samples_per_sensor=args.samples_per_sensor or DEFAULT_SAMPLES_PER_SENSOR,
+        seed=args.seed if args.seed is not None else DEFAULT_SEED,
+    )
+    if args.sensor_dma_port == 'l2bus':
+        system.sensor.dma = system.l2bus.cpu_side_ports
+    else:
+        system.sensor.dma = system.membus.cpu_side_ports
+
+
+def map_sensor_ring(system, args):
+    """Map the ring buffer (cacheable) into the workload (after
+    m5.instantiate)."""
+    # system.cpu is a vector on multi-core systems (a SimObject's index 0
+    # is the object itself); all cores share one process
+    process = system.cpu[0].workload[0]
+    ring_bytes = RING_HEADER_BYTES + args.ring_slots * SENSOR_READING_BYTES
+    page = 4096
+    process.map(RING_VADDR, RING_PADDR,
+                (ring_bytes + page - 1) // page * page, True)
+
+
+def accel_buffer_bytes(args):
+    """Size of the accelerator's DMA buffer (whole pages of readings)."""
+    page = 4096
+    return (edge_readings(args) * SENSOR_READING_BYTES + page - 1) // page * page
+
+
+def create_accelerator(system, args):
+    """Filter accelerator in its own clock domain: registers and DMA on the
+    membus, so its DMA is coherent with the CPU caches."""
+    system.accel_clk_domain = SrcClockDomain(
+        clock=args.accel_clock,
+        voltage_domain=system.voltage_domain
+    )
+    system.accel = FilterAccelerator(
+        pio_addr=ACCEL_PIO_PADDR,
+        pio_size=ACCEL_PIO_SIZE,
+        buffer_addr=ACCEL_BUFFER_PADDR,
+        chunk_size=args.accel_chunk,
+        readings_per_cycle=args.accel_throughput,
+        clk_domain=system.accel_clk_domain,
+    )
+    system.accel.pio = system.membus.mem_side_ports
+    system.accel.dma = system.membus.cpu_side_ports
+
+
+def map_accelerator(system, args):
+    """Map the registers (uncacheable) and the DMA buffer (cacheable) into
+    the workload (after m5.instantiate)."""
+    process = system.cpu[0].workload[0]
+    process.map(ACCEL_PIO_VADDR, ACCEL_PIO_PADDR, ACCEL_PIO_SIZE, False)
+    process.map(ACCEL_BUFFER_VADDR, ACCEL_BUFFER_PADDR,
+                accel_buffer_bytes(args), True)
+
+
+def create_big_little_cpus(system, args):
+    """Create little (MinorCPU) and big (ArmO3CPU) clusters.
+    
+    Each cluster has its own voltage and clock domain so that the power
+    models evaluate `voltage` per cluster. Little cores come first: SE mode
+    hands threads to cores in order, so workload thread t runs on core t.
+    """
+    
+    system.little_voltage_domain = VoltageDomain(voltage=args.little_voltage)
+    system.little_clk_domain = SrcClockDomain(
+        clock=args.little_clock,
+        voltage_domain=system.little_voltage_domain
+    )
+    system.big_voltage_domain = VoltageDomain(voltage=args.big_voltage)
+    system.big_clk_domain = SrcClockDomain(
+        clock=args.big_clock,
+        voltage_domain=system.big_voltage_domain
+    )
+    
+    cpus = []
+    for _ in range(args.little_cores):
+        cpu = create_cpu('minor', len(cpus), not args.ruby)
+        cpu.clk_domain = system.little_clk_domain
+        cpus.append(cpu)
+    for _ in range(args.big_cores):
+        cpu = create_cpu('o3', len(cpus), not args.ruby)
+        cpu.clk_domain = system.big_clk_domain
+        cpus.append(cpu)
+    
+    return cpus
+
+
+def workload_args(args):
+    """Problem-size arguments for the edge workload, followed by --options."""
+    size_args = []
+    if args.sensors:
+        size_args.append(f'--sensors={args.sensors}')
+    if args.samples_per_sensor:
+        size_args.append(f'--samples={args.samples_per_sensor}')
+    if args.seed is not None:
+        size_args.append(f'--seed={args.seed}')
+    return size_args + args.options.split()
+
+
+def edge_readings(args):
+    """Number of readings the workload processes."""
+    return ((args.sensors or DEFAULT_SENSORS) *
+            (args.samples_per_sensor or DEFAULT_SAMPLES_PER_SENSOR))
+
+
+def working_set_bytes(args):
+    """Bytes of all readings in the workload's data layout."""
+    return edge_readings(args) * LAYOUT_BYTES[args.layout or 'aos']
+
+
+def cpu_stat_paths(args):
+    """Stat path prefix of every core, e.g. ['system.cpu0', 'system.cpu1']."""
+    if args.num_cores == 1:
+        return ['system.cpu']
+    return [f'system.cpu{i}' for i in range(args.num_cores)]
+
+
+def mem_ctrl_paths(system):
+    """Stat path of every memory controller (one per channel), e.g.
+    system.mem_ctrl, or system.mem_ctrl0, ... (Ruby: under system.ruby)."""
+    return [obj.path() for obj in system.descendants()
+            if isinstance(obj, MemCtrl)]
+
+
+def create_memory(system, args):
+    """One MemCtrl per channel; channels interleave at --mem-intlv-size."""
+    intlv_bits = int(math.log2(args.mem_channels))
+    intlv_low_bit = int(math.log2(args.mem_intlv_size))
+    mem_range = system.mem_ranges[0]
+    
+    ctrls = []
+    for i in range(args.mem_channels):
+        ctrl = MemCtrl(mem_sched_policy=args.mem_sched)
+        ctrl.dram = DRAM_TYPES[args.mem_type](page_policy=args.page_policy)
+        if args.mem_channels > 1:
+            ctrl.dram.range = AddrRange(mem_range.start, size=mem_range.size(),
+                                        intlvHighBit=intlv_low_bit + intlv_bits - 1,
+                                        intlvBits=intlv_bits, intlvMatch=i)
+        else:
+            ctrl.dram.range = mem_range
+        ctrls.append(ctrl)
+    
+    # A single channel keeps the historical `system.mem_ctrl` stat names
+    system.mem_ctrl = ctrls
+    for ctrl in ctrls:
+        ctrl.port = system.membus.mem_side_ports
+
+
+def ruby_protocol_built(protocol):
+    """Whether this gem5 binary contains the Ruby protocol."""
+    return (buildEnv.get('PROTOCOL') == protocol or
+            bool(buildEnv.get(f'RUBY_PROTOCOL_{protocol.upper()}', False)))
+
+
+def create_ruby_system(system, cpus, args):
+    """Ruby memory system with the --ruby coherence protocol.
+    
+    Built by configs/ruby/Ruby.py: private L1s per core, one shared L2 bank
+    (MESI/MOESI; for CHI the home node) and one directory per memory
+    channel. Ruby creates the memory controllers itself; the DRAM type,
+    page and scheduling policy options are applied to them afterwards.
+    """
+    from common import Options
+    from ruby import Ruby
+    
+    parser = argparse.ArgumentParser()
+    Options.addCommonOptions(parser)
+    Ruby.define_options(parser)
+    ruby_args = parser.parse_args([])
+    ruby_args.num_cpus = len(cpus)
+    ruby_args.num_dirs = args.mem_channels
+    ruby_args.num_l2caches = 1
+    ruby_args.l1i_size = '16kB'
+    ruby_args.l1i_assoc = 2
+    ruby_args.l1d_size = '32kB'
+    ruby_args.l1d_assoc = 4
+    ruby_args.l2_size = args.l2_size
+    ruby_args.l2_assoc = args.l2_assoc
+    ruby_args.mem_type = DRAM_TYPES[args.mem_type].__name__
+    ruby_args.mem_channels = args.mem_channels
+    ruby_args.ruby_clock = '2GHz'
+    
+    Ruby.create_system(ruby_args, False, system, cpus=cpus)
+    system.ruby.clk_domain = SrcClockDomain(
+        clock=ruby_args.ruby_clock,
+        voltage_domain=system.voltage_domain
+    )
+    for i, cpu in enumerate(cpus):
+        system.ruby._cpu_ports[i].connectCpuPort(cpu)
+    
+    for ctrl in system.descendants():
+        if isinstance(ctrl, MemCtrl):
+            ctrl.mem_sched_policy = args.mem_sched
+            ctrl.dram.page_policy = args.page_policy
+
+
+def cache_hierarchy(args):
+    """(level, stats path, hit latency in cycles, clock domain) of every cache.
+    
+    A hit costs the larger of the tag and data latency (parallel lookup).
+    The L1s run in their core's clock domain, the L2/L3 in the system's.
+    Ruby caches are reported through the coherence summary instead.
+    """
+    caches = []
+    if args.ruby:
+        return caches
+    for i, path in enumerate(cpu_stat_paths(args)):
+        if args.cpu_type == 'biglittle':
+            domain = ('system.little_clk_domain' if i < args.little_cores
+                      else 'system.big_clk_domain')
+        else:
+            domain = 'system.clk_domain'
+        caches.append(('l1i', f'{path}.icache', L1ICache.tag_latency, domain))
+        if args.scratchpad != 'replace':
+            caches.append(('l1d', f'{path}.dcache', L1DCache.tag_latency, domain))
+    if args.l2_cache:
+        caches.append(('l2', 'system.l2cache', L2Cache.tag_latency,
+                       'system.clk_domain'))
+    if args.l3_cache:
+        caches.append(('l3', 'system.l3cache', args.l3_latency,
+                       'system.clk_domain'))
+    return caches
+
+
+def decompression_latency(compressor):
+    """Upper bound of the cycles gem5 charges to decompress a line: its
+    chunks at decomp_chunks_per_cycle plus decomp_extra_latency. BDI charges
+    the sub-compressor whose encoding a line uses plus its own extra; without
+    per-encoding stats the slowest sub-compressor is assumed (exact for
+    C-Pack and FPC)."""
+    subs = getattr(compressor, 'compressors', None)
+    if subs:
+        return int(compressor.decomp_extra_latency) + max(
+            decompression_latency(sub) for sub in subs)
+    chunks = CACHE_LINE_BYTES * 8 / int(compressor.chunk_size_bits)
+    return (math.ceil(chunks / int(compressor.decomp_chunks_per_cycle)) +
+            int(compressor.decomp_extra_latency))
+
+
+def l2_storage_kib(args):
+    """Data + tag storage of the classic L2 in KiB (0 without one)."""
+    if args.ruby or not args.l2_cache:
+        return 0.0
+    size = toMemorySize(args.l2_size)
+    lines = size // CACHE_LINE_BYTES
+    offset_bits = int(math.log2(CACHE_LINE_BYTES))
+    tag_bits = (PHYS_ADDR_BITS - int(math.log2(lines // args.l2_assoc)) -
+                offset_bits + TAG_STATE_BITS)
+    tags_per_line = 1
+    if args.l2_compressor != 'none':
+        tag_bits += offset_bits + 1
+        tags_per_line = 2
+    return (size * 8 + lines * tags_per_line * tag_bits) / 8 / 1024
+
+
 def create_system(args):
     """Create the system based on command-line arguments."""
     
@@ -205,76 +804,116 @@ def create_system(args):
     system.mem_mode = 'timing'
     system.mem_ranges = [AddrRange('4GB')]
     
-    # Create CPU
-    if args.cpu_type == 'minor':
-        system.cpu = MinorCPU()
-    elif args.cpu_type == 'o3':
-        system.cpu = ArmO3CPU()
-        # Configure O3 parameters (using gem5 parameter names)
-        system.cpu.numROBEntries = 128
-        system.cpu.numPhysIntRegs = 128
-        system.cpu.numPhysFloatRegs = 128
-        system.cpu.LQEntries = 32
-        system.cpu.SQEntries = 32
-        # Note: Issue queues configured via instQueues (using defaults)
+    # Create CPU(s). A single core keeps the historical `system.cpu` stat
+    # names; multi-core systems become `system.cpu0`, `system.cpu1`, ...
+    if args.cpu_type == 'biglittle':
+        cpus = create_big_little_cpus(system, args)
+        system.cpu = cpus
+    elif args.num_cores == 1:
+        system.cpu = create_cpu(args.cpu_type, 0, not args.ruby, args.scratchpad)
+        cpus = [system.cpu]
+        if args.scratchpad:
+            create_scratchpad(system, system.cpu, args)
     else:
-        print(f"Error: Unknown CPU type '{args.cpu_type}'")
-        sys.exit(1)
+        system.cpu = [create_cpu(args.cpu_type, i, not args.ruby)
+                      for i in range(args.num_cores)]
+        cpus = system.cpu
     
-    # Create interrupt controller for ARM
-    system.cpu.createInterruptController()
-    
-    # Create caches
-    
-    system.cpu.icache = L1ICache()
-    system.cpu.icache.size = '16kB'
-    system.cpu.icache.assoc = 2
-    system.cpu.dcache = L1DCache()
-    system.cpu.dcache.size = '32kB'
-    system.cpu.dcache.assoc = 4
+    # Parallel host simulation: each core and its children (L1 caches,
+    # MMU, interrupt controller) on event queue 1..N; the shared L2, buses
+    # and memory stay on queue 0. Queues synchronize every sim_quantum.
+    if args.parallel_eventqs:
+        for i, cpu in enumerate(cpus):
+            cpu.eventq_index = i + 1
     
-    # Connect caches and create memory bus
-    system.cpu.icache.connectCPU(system.cpu)
-    system.cpu.dcache.connectCPU(system.cpu)
-    
-    # Optional L2 cache
-    if args.l2_cache:
+    # Ruby: coherent caches, directories and memory controllers (the system
+    # port is connected by Ruby). Classic: optional L2/L3 over crossbars.
+    if args.ruby:
+        create_ruby_system(system, cpus, args)
+    # Optional L2 cache (always present, and shared, with multiple cores)
+    elif args.l2_cache:
         system.l2bus = L2XBar()
-        system.cpu.icache.connectBus(system.l2bus)
-        system.cpu.dcache.connectBus(system.l2bus)
+        for cpu in cpus:
+            cpu.icache.connectBus(system.l2bus)
+            connect_data_side(system, cpu, system.l2bus, args)
         
         system.l2cache = L2Cache()
+        system.l2cache.size = args.l2_size
+        system.l2cache.assoc = args.l2_assoc
+        if L2_COMPRESSORS[args.l2_compressor]:
+            system.l2cache.tags = CompressedTags()
+            system.l2cache.compressor = L2_COMPRESSORS[args.l2_compressor]()
         system.l2cache.connectCPUSideBus(system.l2bus)
         
         system.membus = SystemXBar()
-        system.l2cache.connectMemSideBus(system.membus)
+        if args.l3_cache:
+            # Shared LLC behind the L2
+            clusivity, writeback_clean = L3_POLICIES[args.l3_policy]
+            system.l3bus = L2XBar()
+            system.l2cache.writeback_clean = writeback_clean
+            system.l2cache.connectMemSideBus(system.l3bus)
+            
+            system.l3cache = L3Cache()
+            system.l3cache.size = args.l3_size
+            system.l3cache.assoc = args.l3_assoc
+            system.l3cache.tag_latency = args.l3_latency
+            system.l3cache.data_latency = args.l3_latency
+            system.l3cache.response_latency = args.l3_latency
+            system.l3cache.clusivity = clusivity
+            system.l3cache.connectCPUSideBus(system.l3bus)
+            system.l3cache.connectMemSideBus(system.membus)
+        else:
+            system.l2cache.connectMemSideBus(system.membus)
     else:
         system.membus = SystemXBar()
-        system.cpu.icache.connectBus(system.membus)
-        system.cpu.dcache.connectBus(system.membus)
+        for cpu in cpus:
+            cpu.icache.connectBus(system.membus)
+            connect_data_side(system, cpu, system.membus, args)
     
-    # Create memory controller
-    system.mem_ctrl = MemCtrl()
-    system.mem_ctrl.dram = DDR4_2400_8x8()
-    system.mem_ctrl.dram.range = system.mem_ranges[0]
-    system.mem_ctrl.port = system.membus.mem_side_ports
+    if not args.ruby:
+        # Create memory controller(s)
+        create_memory(system, args)
+        
+        # Connect system port
+        system.system_port = system.membus.cpu_side_ports
+        
+        if args.sensor_dma:
+            create_sensor_device(system, args)
+        if args.accelerator:
+            create_accelerator(system, args)
     
-    # Connect system port
-    system.system_port = system.membus.cpu_side_ports
+    # ROI mode: m5_work_begin/m5_work_end in the workload exit the
+    # simulation loop so that the stats can be reset/dumped per phase
+    if args.roi:
+        system.exit_on_work_items = True
     
-    # Set up workload
+    # Set up workload. All cores share one process: extra threads created
+    # by the workload (pthread_create -> clone) land on the idle cores.
     system.workload = SEWorkload.init_compatible(args.binary)
     
     process = Process()
-    process.cmd = [args.binary]
-    system.cpu.workload = process
-    system.cpu.createThreads()
+    process.cmd = [args.binary] + workload_args(args)
+    if args.streaming or args.layout or args.sensor_dma:
+        process.output = PROGRAM_OUTPUT
+    for cpu in cpus:
+        cpu.workload = process
+        cpu.createThreads()
+        # SE-mode SVE vector length, in 128-bit quadwords (ISAs are created
+        # by createThreads)
+        if args.sve_vl:
+            for isa in cpu.isa:
+                isa.sve_vl_se = args.sve_vl // 128
     
     return system
 
 
-def apply_power_models(root):
-    """Apply power models to CPU after system is built."""
+def apply_power_models(root, args):
+    """Apply power models to CPU after system is built.
+    
+    Without the thermal model, leakage is evaluated at --ambient-temp. With
+    it, the power models belong to the subsystem of the thermal domain: their
+    power heats the die node and the die temperature becomes their `temp`.
+    """
     
     print("Applying power models...")
     
@@ -284,8 +923,107 @@ def apply_power_models(root):
         if not isinstance(cpu, BaseCPU):
             continue
         cpu.power_state.default_state = "ON"
-        cpu.power_model = CpuPowerModel(cpu.path())
+        dcache_misses = None
+        if args.ruby:
+            # No classic dcache: use the core's Ruby L1D controller
+            misses = RUBY_L1D_MISSES[args.ruby]
+            dcache_misses = misses.format(cpu.cpu_id) if misses else '0'
+        elif args.scratchpad == 'replace':
+            dcache_misses = '0'
+        cpu.power_model = CpuPowerModel(cpu.path(), dcache_misses)
+        cpu.power_model.ambient_temp = f'{args.ambient_temp}C'
+        if args.thermal:
+            cpu.power_model.subsystem = root.system.thermal_subsystem
         print(f"  Applied CPU power model to: {cpu.path()}")
+    
+    if args.accelerator:
+        accel = root.system.accel
+        # Clock gated until the first job (the device sets ON while busy)
+        accel.power_state.default_state = "CLK_GATED"
+        accel.power_model = AcceleratorPowerModel(args.accel_static_mw)
+        if args.thermal:
+            accel.power_model.subsystem = root.system.thermal_subsystem
+        print(f"  Applied accelerator power model to: {accel.path()}")
+
+
+def create_thermal_model(system, args):
+    """RC thermal network of the die in a fanless enclosure.
+    
+        die --die_to_case--> case --case_to_ambient--> ambient (reference)
+    
+    Each node stores heat in a capacitor towards ambient. The die node is
+    the ThermalDomain of the power subsystem, so the power of every core
+    heats it and its temperature is fed back into the leakage expressions.
+    """
+    initial_temp = (args.initial_temp if args.initial_temp is not None
+                    else args.ambient_temp)
+    system.thermal_domain = ThermalDomain(initial_temperature=f'{initial_temp}C')
+    system.thermal_subsystem = SubSystem(thermal_domain=system.thermal_domain)
+    
+    model = ThermalModel(step=args.thermal_step)
+    model.die_node = ThermalNode()
+    model.case_node = ThermalNode()
+    model.ambient_node = ThermalNode()
+    model.ambient = ThermalReference(temperature=f'{args.ambient_temp}C')
+    model.die_to_case = ThermalResistor(resistance=args.die_resistance)
+    model.case_to_ambient = ThermalResistor(resistance=args.case_resistance)
+    model.die_heat = ThermalCapacitor(capacitance=args.die_capacitance)
+    model.case_heat = ThermalCapacitor(capacitance=args.case_capacitance)
+    system.thermal_model = model
+
+
+def connect_thermal_model(system):
+    """Link the nodes of the thermal network.
+    
+    The links are C++ calls (setNode/setNodes/add*), so this must run after
+    m5.instantiate() and before the first m5.simulate() starts the model.
+    """
+    model = system.thermal_model
+    die = model.die_node.getCCObject()
+    case = model.case_node.getCCObject()
+    ambient = model.ambient_node.getCCObject()
+    
+    system.thermal_domain.getCCObject().setNode(die)
+    model.ambient.getCCObject().setNode(ambient)
+    model.die_to_case.getCCObject().setNodes(die, case)
+    model.case_to_ambient.getCCObject().setNodes(case, ambient)
+    model.die_heat.getCCObject().setNodes(die, ambient)
+    model.case_heat.getCCObject().setNodes(case, ambient)
+    
+    cc_model = model.getCCObject()
+    for node in (die, case, ambient):
+        cc_model.addNode(node)
+    cc_model.addDomain(system.thermal_domain.getCCObject())
+    cc_model.addReference(model.ambient.getCCObject())
+    for resistor in (model.die_to_case, model.case_to_ambient):
+        cc_model.addResistor(resistor.getCCObject())
+    for capacitor in (model.die_heat, model.case_heat):
+        cc_model.addCapacitor(capacitor.getCCObject())
+
+
+def event_queue_count(args):
+    """Number of host event queues (and simulation threads) of a run."""
+    return args.num_cores + 1 if args.parallel_eventqs else 1
+
+
+def run_roi_simulation():
+    """Simulate, resetting stats at every ROI begin and dumping at every end.
+    
+    Returns the final exit event and the phase name of every stats dump.
+    """
+    phases = []
+    while True:
+        exit_event = m5.simulate()
+        cause = exit_event.getCause()
+        if cause == 'workbegin':
+            m5.stats.reset()
+        elif cause == 'workend':
+            m5.stats.dump()
+            code = exit_event.getCode()
+            phases.append(ROI_PHASES[code] if 0 <= code < len(ROI_PHASES)
+                          else f'phase{code}')
+        else:
+            return exit_event, phases
 
 
 # ==============================================================================
@@ -300,22 +1038,211 @@ def parse_arguments():
     )
     
     parser.add_argument('--cpu-type', type=str, default='minor',
-                       choices=['minor', 'o3'],
-                       help='CPU type: minor (in-order) or o3 (out-of-order)')
+                       choices=['minor', 'o3', 'biglittle'],
+                       help='CPU type: minor (in-order), o3 (out-of-order) '
+                            'or biglittle (heterogeneous minor + o3 clusters)')
     
     parser.add_argument('--l2-cache', action='store_true',
-                       help='Enable L2 cache (256 KB, 8-way)')
+                       help='Enable L2 cache')
+    parser.add_argument('--l2-size', type=str, default='256kB',
+                       help='L2 cache size')
+    parser.add_argument('--l2-assoc', type=int, default=L2Cache.assoc,
+                       help='L2 cache associativity')
+    parser.add_argument('--l2-compressor', type=str, default='none',
+                       choices=sorted(L2_COMPRESSORS),
+                       help='L2 compressor on compressed tags (implies '
+                            '--l2-cache; classic memory system only)')
+    
+    # Optional shared last-level cache behind the L2
+    parser.add_argument('--l3-cache', action='store_true',
+                       help='Enable an L3 cache (implies --l2-cache)')
+    parser.add_argument('--l3-size', type=str, default='2MB',
+                       help='L3 cache size')
+    parser.add_argument('--l3-assoc', type=int, default=16,
+                       help='L3 cache associativity')
+    parser.add_argument('--l3-latency', type=int, default=20,
+                       help='L3 tag/data/response latency in cycles')
+    parser.add_argument('--l3-policy', type=str, default='nine',
+                       choices=sorted(L3_POLICIES),
+                       help='L3 inclusion policy (inclusive behaves as nine '
+                            'in classic gem5 caches)')
+    
+    # Ruby coherent memory system (instead of the classic caches)
+    parser.add_argument('--ruby', type=str, default=None,
+                       choices=sorted(RUBY_PROTOCOLS),
+                       help='Ruby memory system: mesi (MESI_Two_Level), '
+                            'moesi (MOESI_CMP_directory) or chi; gem5 must '
+                            'be built with the protocol')
+    
+    # Main memory
+    parser.add_argument('--mem-type', type=str, default='ddr4',
+                       choices=sorted(DRAM_TYPES),
+                       help='DRAM technology')
+    parser.add_argument('--mem-channels', type=int, default=1,
+                       help='Number of memory channels (power of two)')
+    parser.add_argument('--mem-intlv-size', type=int, default=64,
+                       help='Channel interleaving granularity in bytes')
+    parser.add_argument('--page-policy', type=str, default='open_adaptive',
+                       choices=['open', 'open_adaptive', 'close',
+                                'close_adaptive'],
+                       help='DRAM row-buffer (page) policy')
+    parser.add_argument('--mem-sched', type=str, default='frfcfs',
+                       choices=['frfcfs', 'fcfs'],
+                       help='Memory controller scheduling policy')
     
     parser.add_argument('--binary', type=str, 
                        default='workloads/edge_preprocessing_arm',
                        help='Path to ARM binary to execute')
     
+    parser.add_argument('--sve-vl', type=int, default=None,
+                       help='SVE vector length in bits (multiple of 128, up '
+                            'to 2048; default: the ISA default of 128)')
+    parser.add_argument('--options', type=str, default='',
+                       help='Space-separated arguments passed to the binary')
+    
+    # Problem size (passed to the workload as --sensors/--samples/--seed)
+    parser.add_argument('--sensors', type=int, default=None,
+                       help=f'Number of sensors (workload default: {DEFAULT_SENSORS})')
+    parser.add_argument('--samples-per-sensor', type=int, default=None,
+                       help='Samples per sensor (workload default: '
+                            f'{DEFAULT_SAMPLES_PER_SENSOR})')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='PRNG seed of the generated readings')
+    
+    parser.add_argument('--num-cores', type=int, default=1,
+                       help='Number of cores (private L1s; more than one '
+                            'core implies a shared L2 through L2XBar)')
+    
+    # Heterogeneous big.LITTLE options (--cpu-type=biglittle)
+    parser.add_argument('--little-cores', type=int, default=2,
+                       help='Number of in-order (MinorCPU) little cores')
+    parser.add_argument('--big-cores', type=int, default=2,
+                       help='Number of out-of-order (ArmO3CPU) big cores')
+    parser.add_argument('--little-clock', type=str, default='1GHz',
+                       help='Clock of the little cluster')
+    parser.add_argument('--little-voltage', type=str, default='0.8V',
+                       help='Voltage of the little cluster')
+    parser.add_argument('--big-clock', type=str, default='2GHz',
+                       help='Clock of the big cluster')
+    parser.add_argument('--big-voltage', type=str, default='1.2V',
+                       help='Voltage of the big cluster')
+    parser.add_argument('--task-placement', action='store_true',
+                       help='Run filter/normalize on the little cores and '
+                            'aggregation on the big cores (passes '
+                            '"<cores> <little-cores>" to the MT workload)')
+    
     parser.add_argument('--power-models', action='store_true', default=False,
                        help='Enable power modeling (requires full-system mode)')
     
+    # Thermal model (die -> case -> ambient RC network)
+    parser.add_argument('--thermal', action='store_true',
+                       help='Enable the thermal model (implies --power-models)')
+    parser.add_argument('--ambient-temp', type=float, default=25.0,
+                       help='Ambient temperature in C (leakage temperature '
+                            'without --thermal)')
+    parser.add_argument('--initial-temp', type=float, default=None,
+                       help='Initial die temperature in C (default: ambient)')
+    parser.add_argument('--thermal-step', type=float, default=0.0001,
+                       help='Thermal model time step in seconds')
+    parser.add_argument('--die-resistance', type=float, default=2.0,
+                       help='Die-to-case thermal resistance in K/W')
+    parser.add_argument('--die-capacitance', type=float, default=0.02,
+                       help='Die heat capacity in J/K')
+    parser.add_argument('--case-resistance', type=float, default=20.0,
+                       help='Case-to-ambient thermal resistance in K/W '
+                            '(fanless enclosure)')
+    parser.add_argument('--case-capacitance', type=float, default=5.0,
+                       help='Case heat capacity in J/K')
+    
+    # Data layout / number format (workloads/edge_preprocessing_layout.c)
+    parser.add_argument('--layout', type=str, default=None,
+                       choices=list(LAYOUT_BYTES),
+                       help='Data layout / number format of '
+                            'edge_preprocessing_layout (with --roi also its '
+                            'equivalence check, outside the ROIs)')
+
+    # Scratchpad memory (workloads/edge_preprocessing_spm.c)
+    parser.add_argument('--scratchpad', type=str, default=None,
+                       choices=['alongside', 'replace'],
+                       help='Scratchpad next to the L1D or instead of it '
+                            '(single core, classic memory system)')
+    parser.add_argument('--scratchpad-size', type=str, default='32kB',
+                       help='Scratchpad size')
+    parser.add_argument('--scratchpad-latency', type=str, default='1ns',
+                       help='Scratchpad access latency')
+    parser.add_argument('--scratchpad-bandwidth', type=str, default='32GiB/s',
+                       help='Scratchpad bandwidth')
+
+    # Streaming workload options (workloads/edge_streaming.c)
+    parser.add_argument('--streaming', action='store_true',
+                       help='Streaming workload: capture its output and '
+                            'report per-window latency percentiles')
+    parser.add_argument('--window-size', type=int, default=256,
+                       help='Readings per window (streaming and sensor DMA modes)')
+    parser.add_argument('--arrival-rate', type=float, default=1e6,
+                       help='Reading arrival rate in readings/s (streaming '
+                            'and sensor DMA modes)')
+    
+    # DMA sensor input (devices/SensorDevice, workloads/edge_ingest.c);
+    # the device samples at --arrival-rate
+    parser.add_argument('--sensor-dma', action='store_true',
+                       help='Feed the workload from a DMA sensor device '
+                            '(gem5 built with EXTRAS=<Project>/devices)')
+    parser.add_argument('--dma-batch', type=int, default=64,
+                       help='Readings per DMA batch (completion event)')
+    parser.add_argument('--ring-slots', type=int, default=4096,
+                       help='Readings held by the ring buffer (multiple of '
+                            '--dma-batch)')
+    parser.add_argument('--sensor-dma-port', type=str, default='membus',
+                       choices=['membus', 'l2bus'],
+                       help='Crossbar the device writes through: memory '
+                            '(snoop-invalidates cached copies) or the L2 '
+                            '(ingest allocates in the L2)')
+    
+    # Filter accelerator (devices/FilterAccelerator,
+    # workloads/edge_preprocessing_accel.c)
+    parser.add_argument('--accelerator', action='store_true',
+                       help='Offload the filter and anomaly detection to a '
+                            'FilterAccelerator (gem5 built with '
+                            'EXTRAS=<Project>/devices)')
+    parser.add_argument('--accel-clock', type=str, default='1GHz',
+                       help='Accelerator clock')
+    parser.add_argument('--accel-throughput', type=float, default=1.0,
+                       help='Accelerator throughput in readings/cycle')
+    parser.add_argument('--accel-chunk', type=int, default=256,
+                       help='Readings per accelerator DMA transfer')
+    parser.add_argument('--accel-energy-pj', type=float, default=2.0,
+                       help='Accelerator dynamic energy per reading in pJ')
+    parser.add_argument('--accel-static-mw', type=float, default=1.0,
+                       help='Accelerator leakage in mW')
+    
+    parser.add_argument('--roi', action='store_true',
+                       help='Collect one stats dump per pipeline phase from '
+                            'the m5ops markers (binary built with -DEDGE_M5OPS); '
+                            'disables periodic stat dumps')
+    
+    # Parallel host simulation (multi-core systems)
+    parser.add_argument('--parallel-eventqs', action='store_true',
+                       help='Put every core and its private caches on its own '
+                            'event queue (host thread); the classic memory '
+                            'system is not thread-safe, so check the stat '
+                            'deviation with --baseline-result')
+    parser.add_argument('--sim-quantum', type=str, default='1us',
+                       help='Synchronization quantum of the event queues')
+    parser.add_argument('--baseline-result', type=str, default=None,
+                       help='Result CSV of the same configuration on a single '
+                            'event queue; reports speedup and stat deviation')
+    
     parser.add_argument('--stat-freq', type=float, default=0.001,
                        help='Frequency (in seconds) to dump stats')
     
+    parser.add_argument('--config-name', type=str, default=None,
+                       help='Experiment name; saves <output-dir>/<name>_result.csv')
+    
+    parser.add_argument('--output-dir', type=str,
+                       default='configs/practice/Project/results',
+                       help='Output directory for individual result files')
+    
     return parser.parse_args()
 
 
@@ -323,6 +1250,108 @@ def main():
     """Main simulation entry point."""
     args = parse_arguments()
     
+    if args.cpu_type == 'biglittle':
+        if args.little_cores < 1 or args.big_cores < 1:
+            print("Error: biglittle needs at least one little and one big core")
+            sys.exit(1)
+        args.num_cores = args.little_cores + args.big_cores
+        if args.task_placement and not args.options:
+            args.options = f"{args.num_cores} {args.little_cores}"
+    elif args.task_placement:
+        print("Error: --task-placement requires --cpu-type=biglittle")
+        sys.exit(1)
+    if args.num_cores < 1:
+        print(f"Error: --num-cores must be at least 1 (got {args.num_cores})")
+        sys.exit(1)
+    if args.streaming and not args.options:
+        args.options = f"{args.window_size} {args.arrival_rate:.0f}"
+    if args.layout and not args.options:
+        # The check reruns the float AoS pipeline, so only outside the ROIs
+        args.options = f"{args.layout} check" if args.roi else args.layout
+    if args.num_cores > 1 and not args.l2_cache:
+        print("Note: multi-core systems share an L2; enabling --l2-cache")
+        args.l2_cache = True
+    if args.mem_channels < 1 or args.mem_channels & (args.mem_channels - 1):
+        print(f"Error: --mem-channels must be a power of two "
+              f"(got {args.mem_channels})")
+        sys.exit(1)
+    if args.l3_cache and not args.l2_cache:
+        print("Note: the L3 sits behind the L2; enabling --l2-cache")
+        args.l2_cache = True
+    if args.l2_compressor != 'none':
+        if args.ruby:
+            print("Error: --l2-compressor is a classic cache option")
+            sys.exit(1)
+        if not args.l2_cache:
+            print("Note: --l2-compressor compresses the L2; enabling --l2-cache")
+            args.l2_cache = True
+    if args.ruby:
+        if args.l3_cache:
+            print("Error: --l3-cache is a classic cache option; Ruby "
+                  "provides its own hierarchy")
+            sys.exit(1)
+        if not ruby_protocol_built(RUBY_PROTOCOLS[args.ruby]):
+            print(f"Error: this gem5 binary was not built with the "
+                  f"{RUBY_PROTOCOLS[args.ruby]} protocol")
+            sys.exit(1)
+    if args.parallel_eventqs and args.num_cores < 2:
+        print("Error: --parallel-eventqs needs a multi-core system")
+        sys.exit(1)
+    if args.sve_vl is not None and (args.sve_vl % 128 or
+                                    not 128 <= args.sve_vl <= 2048):
+        print(f"Error: --sve-vl must be a multiple of 128 between 128 and "
+              f"2048 (got {args.sve_vl})")
+        sys.exit(1)
+    if args.scratchpad:
+        if args.num_cores > 1 or args.ruby:
+            print("Error: --scratchpad needs a single core on the classic "
+                  "memory system")
+            sys.exit(1)
+        if not args.options:
+            # Default window, mapped scratchpad base and size
+            args.options = (f"256 {hex(SCRATCHPAD_VADDR)} "
+                            f"{toMemorySize(args.scratchpad_size)}")
+    if args.sensor_dma:
+        if args.ruby:
+            print("Error: --sensor-dma needs the classic memory system")
+            sys.exit(1)
+        if not device_model_built('SensorDevice'):
+            print("Error: this gem5 binary was not built with the device "
+                  "models (EXTRAS=configs/practice/Project/devices)")
+            sys.exit(1)
+        if args.dma_batch < 1 or args.ring_slots % args.dma_batch:
+            print(f"Error: --ring-slots must be a multiple of --dma-batch "
+                  f"(got {args.ring_slots} and {args.dma_batch})")
+            sys.exit(1)
+        if args.sensor_dma_port == 'l2bus' and not args.l2_cache:
+            print("Note: --sensor-dma-port=l2bus needs an L2; enabling --l2-cache")
+            args.l2_cache = True
+        if not args.options:
+            args.options = (f"{args.window_size} {hex(RING_VADDR)} "
+                            f"{args.ring_slots} {args.dma_batch}")
+    if args.accelerator:
+        if args.ruby:
+            print("Error: --accelerator needs the classic memory system")
+            sys.exit(1)
+        if not device_model_built('FilterAccelerator'):
+            print("Error: this gem5 binary was not built with the device "
+                  "models (EXTRAS=configs/practice/Project/devices)")
+            sys.exit(1)
+        if accel_buffer_bytes(args) > ACCEL_BUFFER_MAX:
+            print(f"Error: the accelerator buffer holds at most "
+                  f"{ACCEL_BUFFER_MAX // SENSOR_READING_BYTES} readings")
+            sys.exit(1)
+        if args.accel_throughput <= 0 or args.accel_chunk < 1:
+            print("Error: --accel-throughput and --accel-chunk must be positive")
+            sys.exit(1)
+        if not args.options:
+            args.options = (f"accel {hex(ACCEL_PIO_VADDR)} "
+                            f"{hex(ACCEL_BUFFER_VADDR)}")
+    if args.thermal and not args.power_models:
+        print("Note: the thermal model is driven by the power models; "
+              "enabling --power-models")
+        args.power_models = True
+    
     # Validate binary exists
     if not os.path.exists(args.binary):
         print(f"Error: Binary '{args.binary}' not found!")
@@ -335,32 +1364,105 @@ def main():
     print("Phase 2: ARM with Power Modeling")
     print("="*80)
     print(f"CPU Type: {args.cpu_type.upper()}")
-    print(f"L2 Cache: {'Enabled' if args.l2_cache else 'Disabled'}")
-    print(f"Binary: {args.binary}")
+    print(f"Cores: {args.num_cores}")
+    if args.cpu_type == 'biglittle':
+        print(f"  Little: {args.little_cores} x MINOR @ "
+              f"{args.little_clock}, {args.little_voltage}")
+        print(f"  Big: {args.big_cores} x O3 @ {args.big_clock}, {args.big_voltage}")
+        print(f"  Task placement: {'Enabled' if args.task_placement else 'Disabled'}")
+    if args.ruby:
+        print(f"Memory System: Ruby {RUBY_PROTOCOLS[args.ruby]} "
+              f"(L2 {args.l2_size})")
+    elif args.l2_cache:
+        print(f"L2 Cache: {args.l2_size}, {args.l2_assoc}-way, compressor "
+              f"{args.l2_compressor} ({l2_storage_kib(args):.1f} KiB "
+              f"data + tags)")
+    else:
+        print("L2 Cache: Disabled")
+    if args.scratchpad:
+        print(f"Scratchpad: {args.scratchpad_size} {args.scratchpad} L1D, "
+              f"{args.scratchpad_latency}, {args.scratchpad_bandwidth}")
+    if args.l3_cache:
+        print(f"L3 Cache: {args.l3_size}, {args.l3_assoc}-way, "
+              f"{args.l3_latency} cycles, {args.l3_policy}")
+    else:
+        print("L3 Cache: Disabled")
+    print(f"Memory: {args.mem_type.upper()} x {args.mem_channels} channel(s), "
+          f"{args.page_policy} pages, {args.mem_sched}")
+    print(f"Binary: {' '.join([args.binary] + workload_args(args))}")
+    print(f"Readings: {edge_readings(args)} "
+          f"({working_set_bytes(args)} bytes working set)")
+    print(f"SVE Vector Length: {args.sve_vl or 128} bits")
     print(f"Power Models: {'Enabled' if args.power_models else 'Disabled'}")
-    print(f"Stat Dump Frequency: {args.stat_freq} seconds")
+    if args.thermal:
+        print(f"Thermal Model: ambient {args.ambient_temp} C, die "
+              f"{args.die_resistance} K/W / {args.die_capacitance} J/K, case "
+              f"{args.case_resistance} K/W / {args.case_capacitance} J/K, "
+              f"step {args.thermal_step} s")
+    else:
+        print("Thermal Model: Disabled")
+    if args.streaming:
+        print(f"Streaming: {args.window_size} readings/window @ "
+              f"{args.arrival_rate:,.0f} readings/s")
+    if args.accelerator:
+        print(f"Filter Accelerator: {args.accel_throughput} readings/cycle @ "
+              f"{args.accel_clock}, {args.accel_chunk}-reading DMA chunks, "
+              f"{args.accel_energy_pj} pJ/reading, {args.accel_static_mw} mW")
+    if args.sensor_dma:
+        print(f"Sensor DMA: {args.arrival_rate:,.0f} readings/s in batches of "
+              f"{args.dma_batch}, {args.ring_slots}-reading ring via "
+              f"{args.sensor_dma_port}")
+    if args.parallel_eventqs:
+        print(f"Event Queues: {event_queue_count(args)} (one per core), "
+              f"quantum {args.sim_quantum}")
+    else:
+        print("Event Queues: 1")
+    if args.roi:
+        print("Stat Dumps: one per ROI phase")
+    else:
+        print(f"Stat Dump Frequency: {args.stat_freq} seconds")
     print("="*80)
     
     # Create system
     system = create_system(args)
     
+    if args.thermal:
+        create_thermal_model(system, args)
+    
     # Create root object
     root = Root(full_system=False, system=system)
+    if args.parallel_eventqs:
+        m5.ticks.fixGlobalFrequency()
+        root.sim_quantum = m5.ticks.fromSeconds(toLatency(args.sim_quantum))
     
     # Apply power models if enabled
     if args.power_models:
-        apply_power_models(root)
+        apply_power_models(root, args)
     
     # Instantiate simulation
     m5.instantiate()
+    if args.scratchpad:
+        map_scratchpad(system, args)
+    if args.sensor_dma:
+        map_sensor_ring(system, args)
+    if args.accelerator:
+        map_accelerator(system, args)
+    if args.thermal:
+        connect_thermal_model(system)
     
-    # Set up periodic stat dumps
+    # Set up periodic stat dumps (per-phase dumps replace them in ROI mode)
     m5.stats.reset()
-    m5.stats.periodicStatDump(m5.ticks.fromSeconds(args.stat_freq))
+    if not args.roi:
+        m5.stats.periodicStatDump(m5.ticks.fromSeconds(args.stat_freq))
     
     # Run simulation
     print("\nStarting simulation...")
-    exit_event = m5.simulate()
+    host_start = time.time()
+    if args.roi:
+        exit_event, phases = run_roi_simulation()
+    else:
+        exit_event = m5.simulate()
+    host_seconds = time.time() - host_start
     
     # Print results
     print("\n" + "="*80)
@@ -368,7 +1470,129 @@ def main():
     print("="*80)
     print(f"Simulated time: {m5.curTick() / 1e12:.6f} seconds")
     print(f"Exit reason: {exit_event.getCause()}")
+    print(f"Host time: {host_seconds:.2f} seconds "
+          f"({event_queue_count(args)} event queue(s))")
     print("="*80)
+    
+    # Final dump of the last epoch; periodic dumps reset the stats, so the
+    # whole-run summaries add up every dump
+    m5.stats.dump()
+    stats_file = os.path.join(m5.options.outdir, 'stats.txt')
+    dumps = read_stat_dumps(stats_file)
+    if not dumps:
+        print(f"Warning: no statistics found in {stats_file}")
+        return
+    
+    if args.roi and phases:
+        phase_results = [summarize_phase(stats, phase, cpu_stat_paths(args))
+                         for phase, stats in zip(phases, dumps)]
+        print_phase_table(phase_results)
+        results = summarize_roi(phase_results, edge_readings(args))
+        print_summary(results)
+        results.update(flatten_phase_results(phase_results))
+    else:
+        if args.roi:
+            print("Warning: no ROI work items seen (binary built without "
+                  "-DEDGE_M5OPS?); reporting the whole run")
+        results = summarize_run(dumps, cpu_stat_paths(args),
+                                edge_readings(args))
+        print_summary(results)
+    results['working_set_bytes'] = working_set_bytes(args)
+    results['layout'] = args.layout or 'aos'
+    results['sve_vl'] = args.sve_vl or 128
+    
+    # Per-level miss rate and AMAT over the whole run (or all ROI phases)
+    measured = dumps[:len(phases)] if args.roi and phases else dumps
+    levels = summarize_cache_levels(measured, cache_hierarchy(args))
+    print_cache_levels(levels)
+    results.update(levels)
+    dram = summarize_dram(measured, mem_ctrl_paths(system))
+    print_dram_summary(dram)
+    results.update(dram)
+    if args.ruby:
+        coherence = summarize_coherence(measured, args.ruby, edge_readings(args))
+        print_coherence_summary(coherence, RUBY_PROTOCOLS[args.ruby])
+        results.update(coherence)
+    else:
+        # L1D vs scratchpad energy on top of the CPU and DRAM energy
+        dcaches = ([] if args.scratchpad == 'replace' else
+                   [f'{path}.dcache' for path in cpu_stat_paths(args)])
+        spm_kb = (toMemorySize(args.scratchpad_size) / 1024
+                  if args.scratchpad else 0)
+        onchip = summarize_onchip_memory(
+            measured, dcaches, 'system.scratchpad' if args.scratchpad else None,
+            len(dcaches) * toMemorySize(L1D_SIZE) / 1024, spm_kb,
+            results['energy_j'], dram['dram_energy_j'], edge_readings(args))
+        print_onchip_memory(onchip)
+        results.update(onchip)
+        # Accelerator figures (zeros for CPU-only runs, so that CPU-only
+        # and accelerated result CSVs line up)
+        accel = summarize_accelerator(
+            measured, 'system.accel',
+            args.accel_energy_pj if args.power_models else 0.0,
+            results['energy_j'], edge_readings(args))
+        if args.accelerator:
+            print_accelerator_summary(accel)
+        results.update(accel)
+        # L2 compression figures (zeros for an uncompressed or absent L2)
+        decomp_latency = (decompression_latency(system.l2cache.compressor)
+                          if args.l2_compressor != 'none' else 0)
+        compression = summarize_l2_compression(
+            measured, 'system.l2cache', CACHE_LINE_BYTES, decomp_latency,
+            l2_storage_kib(args))
+        if args.l2_compressor != 'none':
+            print_l2_compression(compression, args.l2_compressor)
+        results.update(compression)
+    results['l2_compressor'] = args.l2_compressor
+    results['scratchpad'] = args.scratchpad or 'none'
+
+    if args.streaming or args.sensor_dma:
+        program_output = os.path.join(m5.options.outdir, PROGRAM_OUTPUT)
+        timings = read_window_timings(program_output)
+        if timings:
+            latency = summarize_latency(timings, args.window_size)
+            print_latency_summary(latency)
+            results.update(latency)
+        else:
+            print(f"Warning: no WINDOW timestamps found in {program_output}")
+    if args.sensor_dma:
+        ingest = summarize_sensor_dma(measured, 'system.sensor',
+                                      read_ring_overruns(program_output))
+        print_sensor_dma(ingest)
+        results.update(ingest)
+    if args.layout:
+        program_output = os.path.join(m5.options.outdir, PROGRAM_OUTPUT)
+        results['equivalence_check'] = read_equivalence_check(program_output)
+        if results['equivalence_check']:
+            print(f"Equivalence check ({args.layout} vs aos): "
+                  f"{results['equivalence_check']}")
+    
+    # Temperature and leakage of every stat epoch
+    trajectory = []
+    if args.thermal:
+        thermal, trajectory = summarize_thermal(dumps, 'system.thermal_domain',
+                                                cpu_stat_paths(args))
+        if trajectory:
+            print_thermal_summary(thermal, trajectory)
+            results.update(thermal)
+        else:
+            print("Warning: no thermal domain temperature in the stats")
+    
+    # Host cost of the run and, against a single-queue baseline, the speedup
+    # and deviation of the parallel simulation
+    results['event_queues'] = event_queue_count(args)
+    results['sim_quantum'] = args.sim_quantum if args.parallel_eventqs else ''
+    results['host_seconds'] = host_seconds
+    if args.baseline_result:
+        baseline = load_result_csv(args.baseline_result)
+        parallel = compare_with_baseline(results, baseline)
+        print_parallel_summary(parallel, baseline.get('config', args.baseline_result))
+        results.update(parallel)
+    
+    if args.config_name:
+        save_results_csv(results, args.config_name, args.output_dir)
+        if trajectory:
+            save_trajectory_csv(trajectory, args.config_name, args.output_dir)
 
 
 if __name__ == '__m5_main__':
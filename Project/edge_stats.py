@@ -0,0 +1,748 @@
+"""
+Statistics helpers for the edge pre-processing experiments.
+
+Parses gem5's stats.txt (which may contain several dumps when periodic stat
+dumps are enabled), derives the throughput and power figures used to
+compare edge processor designs, and saves one CSV row per experiment.
+For the streaming workload it also parses the per-window timestamps the
+program prints and turns them into latency percentiles, and for ROI runs
+(one stats dump per pipeline phase) it derives per-phase metrics. Cache
+statistics are rolled up per hierarchy level into miss rate and AMAT, and
+the memory controllers into DRAM bandwidth, latency, row hits and power.
+With the thermal model, every dump (stat epoch) contributes one point to
+the temperature and leakage trajectory. Ruby runs report coherence traffic,
+classic runs the on-chip (L1D/scratchpad) memory energy, the filter
+accelerator's utilization and energy and the L2 compression ratio, and runs
+with the DMA sensor device its ingest bandwidth, latency and ring overruns.
+"""
+
+import csv
+import os
+
+
+BEGIN_MARKER = '---------- Begin Simulation Statistics ----------'
+
+
+def read_stat_dumps(stats_file):
+    """Return a list with one {stat name: value} dict per dump in stats_file."""
+    dumps = []
+    current = None
+
+    with open(stats_file, 'r') as f:
+        for line in f:
+            if line.startswith(BEGIN_MARKER):
+                current = {}
+                dumps.append(current)
+                continue
+            if current is None:
+                continue
+            parts = line.split()
+            if len(parts) < 2 or parts[0].startswith('-'):
+                continue
+            try:
+                current[parts[0]] = float(parts[1])
+            except ValueError:
+                pass
+
+    return dumps
+
+
+def cpu_power(stats, cpu_path):
+    """Total (dynamic + static) power of one CPU in Watts, 0 if not modeled."""
+    return (stats.get(f'{cpu_path}.power_model.dynamicPower', 0.0) +
+            stats.get(f'{cpu_path}.power_model.staticPower', 0.0))
+
+
+def summarize_run(dumps, cpu_paths, num_readings):
+    """Derive throughput and power metrics of the whole run.
+    
+    Periodic stat dumps reset the stats, so every dump covers one epoch:
+    simulated time and energy (each epoch's power times its length) are
+    summed over all dumps, and the power is their ratio.
+    """
+    sim_seconds = energy = 0.0
+    for stats in dumps:
+        seconds = stats.get('simSeconds', 0.0)
+        sim_seconds += seconds
+        energy += seconds * sum(cpu_power(stats, path) for path in cpu_paths)
+    total_power = energy / sim_seconds if sim_seconds > 0 else 0.0
+    throughput = num_readings / sim_seconds if sim_seconds > 0 else 0.0
+
+    return {
+        'sim_seconds': sim_seconds,
+        'readings': num_readings,
+        'throughput_rps': throughput,
+        'cpu_power_w': total_power,
+        'energy_j': energy,
+        'energy_per_reading_j': energy / num_readings if num_readings > 0 else 0.0,
+        'throughput_per_watt': throughput / total_power if total_power > 0 else 0.0,
+    }
+
+
+def summarize_phase(stats, phase, cpu_paths):
+    """IPC, cache misses and energy of one ROI phase (one stats dump)."""
+    sim_seconds = stats.get('simSeconds', 0.0)
+    power = sum(cpu_power(stats, path) for path in cpu_paths)
+
+    return {
+        'phase': phase,
+        'sim_seconds': sim_seconds,
+        'ipc': sum(stats.get(f'{path}.ipc', 0.0) for path in cpu_paths),
+        'l1i_misses': sum(stats.get(f'{path}.icache.overallMisses::total', 0.0)
+                          for path in cpu_paths),
+        'l1d_misses': sum(stats.get(f'{path}.dcache.overallMisses::total', 0.0)
+                          for path in cpu_paths),
+        'l2_misses': stats.get('system.l2cache.overallMisses::total', 0.0),
+        'cpu_power_w': power,
+        'energy_j': power * sim_seconds,
+    }
+
+
+def summarize_roi(phase_results, num_readings):
+    """Whole-pipeline metrics (as in summarize_run) from per-phase results."""
+    sim_seconds = sum(p['sim_seconds'] for p in phase_results)
+    energy = sum(p['energy_j'] for p in phase_results)
+    power = energy / sim_seconds if sim_seconds > 0 else 0.0
+    throughput = num_readings / sim_seconds if sim_seconds > 0 else 0.0
+
+    return {
+        'sim_seconds': sim_seconds,
+        'readings': num_readings,
+        'throughput_rps': throughput,
+        'cpu_power_w': power,
+        'energy_j': energy,
+        'energy_per_reading_j': energy / num_readings if num_readings > 0 else 0.0,
+        'throughput_per_watt': throughput / power if power > 0 else 0.0,
+    }
+
+
+def print_phase_table(phase_results):
+    """Print per-phase metrics and the phase dominating time and energy."""
+    total_time = sum(p['sim_seconds'] for p in phase_results) or 1.0
+    total_energy = sum(p['energy_j'] for p in phase_results) or 1.0
+
+    print("\n" + "="*80)
+    print("Per-phase Statistics (ROI)")
+    print("="*80)
+    print(f"  {'Phase':<18}{'Time(us)':>10}{'Time%':>7}{'IPC':>7}"
+          f"{'L1D miss':>10}{'L2 miss':>9}{'Energy(uJ)':>12}{'Energy%':>9}")
+    for p in phase_results:
+        print(f"  {p['phase']:<18}{p['sim_seconds'] * 1e6:>10.2f}"
+              f"{100 * p['sim_seconds'] / total_time:>6.1f}%"
+              f"{p['ipc']:>7.3f}{p['l1d_misses']:>10.0f}{p['l2_misses']:>9.0f}"
+              f"{p['energy_j'] * 1e6:>12.3f}"
+              f"{100 * p['energy_j'] / total_energy:>8.1f}%")
+    slowest = max(phase_results, key=lambda p: p['sim_seconds'])
+    hungriest = max(phase_results, key=lambda p: p['energy_j'])
+    print(f"  Dominant phase (time): {slowest['phase']}")
+    if hungriest['energy_j'] > 0:
+        print(f"  Dominant phase (energy): {hungriest['phase']}")
+    print("="*80)
+
+
+def flatten_phase_results(phase_results):
+    """Turn per-phase results into `<phase>_<metric>` CSV columns."""
+    flat = {}
+    for p in phase_results:
+        for key, value in p.items():
+            if key != 'phase':
+                flat[f"{p['phase']}_{key}"] = value
+    return flat
+
+
+# Cache hierarchy levels reported by summarize_cache_levels; levels missing
+# from a configuration report zeros so that result CSVs stay aligned
+CACHE_LEVELS = ['l1i', 'l1d', 'l2', 'l3']
+
+
+def summarize_cache_levels(dumps, caches):
+    """Miss rate and AMAT of every cache level, summed over the given dumps.
+    
+    caches lists (level, stats path, hit latency in cycles, clock domain
+    path) for every cache; private caches of several cores share a level.
+    AMAT = (hit time of every access + measured miss latency) / accesses,
+    in ns; the measured miss latency already covers the levels below.
+    """
+    totals = {level: [0.0, 0.0, 0.0, 0.0] for level in CACHE_LEVELS}
+    for stats in dumps:
+        ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+        for level, path, hit_cycles, domain in caches:
+            accesses = stats.get(f'{path}.overallAccesses::total', 0.0)
+            clock = stats.get(f'{domain}.clock', 0.0)
+            total = totals[level]
+            total[0] += accesses
+            total[1] += stats.get(f'{path}.overallMisses::total', 0.0)
+            total[2] += stats.get(f'{path}.overallMissLatency::total', 0.0) / ticks_per_ns
+            total[3] += accesses * int(hit_cycles) * clock / ticks_per_ns
+
+    results = {}
+    for level in CACHE_LEVELS:
+        accesses, misses, miss_ns, hit_ns = totals[level]
+        results[f'{level}_accesses'] = accesses
+        results[f'{level}_miss_rate'] = (100.0 * misses / accesses
+                                         if accesses > 0 else 0.0)
+        results[f'{level}_amat_ns'] = ((hit_ns + miss_ns) / accesses
+                                       if accesses > 0 else 0.0)
+    return results
+
+
+def print_cache_levels(results):
+    """Print the miss rate and AMAT of every cache level that was accessed."""
+    print("\n" + "="*80)
+    print("Cache Hierarchy")
+    print("="*80)
+    print(f"  {'Level':<7}{'Accesses':>12}{'Miss rate':>11}{'AMAT(ns)':>10}")
+    for level in CACHE_LEVELS:
+        if results[f'{level}_accesses'] == 0:
+            continue
+        print(f"  {level.upper():<7}{results[f'{level}_accesses']:>12,.0f}"
+              f"{results[f'{level}_miss_rate']:>10.2f}%"
+              f"{results[f'{level}_amat_ns']:>10.2f}")
+    print("="*80)
+
+
+def summarize_dram(dumps, ctrl_paths):
+    """DRAM bandwidth, read latency, row-buffer hit rate and power.
+    
+    Summed over the given dumps and all channels in ctrl_paths. The read
+    latency is the average per read burst including queueing; power is the
+    energy of every rank (DRAMPower model) over the simulated time.
+    """
+    sim_seconds = num_bytes = read_bursts = bursts = 0.0
+    row_hits = access_ns = energy_pj = 0.0
+
+    for stats in dumps:
+        ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+        sim_seconds += stats.get('simSeconds', 0.0)
+        for path in ctrl_paths:
+            dram = f'{path}.dram'
+            num_bytes += (stats.get(f'{dram}.bytesRead::total', 0.0) +
+                          stats.get(f'{dram}.bytesWritten::total', 0.0))
+            read_bursts += stats.get(f'{dram}.readBursts', 0.0)
+            bursts += (stats.get(f'{dram}.readBursts', 0.0) +
+                       stats.get(f'{dram}.writeBursts', 0.0))
+            row_hits += (stats.get(f'{dram}.readRowHits', 0.0) +
+                         stats.get(f'{dram}.writeRowHits', 0.0))
+            access_ns += stats.get(f'{dram}.totMemAccLat', 0.0) / ticks_per_ns
+            energy_pj += sum(value for name, value in stats.items()
+                             if name.startswith(f'{dram}.rank') and
+                             name.endswith('.totalEnergy'))
+
+    energy = energy_pj * 1e-12
+    return {
+        'dram_bandwidth_gbps': num_bytes / sim_seconds / 1e9 if sim_seconds > 0 else 0.0,
+        'dram_read_latency_ns': access_ns / read_bursts if read_bursts > 0 else 0.0,
+        'dram_row_hit_rate': 100.0 * row_hits / bursts if bursts > 0 else 0.0,
+        'dram_energy_j': energy,
+        'dram_power_w': energy / sim_seconds if sim_seconds > 0 else 0.0,
+    }
+
+
+def print_dram_summary(results):
+    """Print the DRAM figures of one run."""
+    print("\n" + "="*80)
+    print("Main Memory (DRAM)")
+    print("="*80)
+    print(f"  Bandwidth: {results['dram_bandwidth_gbps']:.3f} GB/s")
+    print(f"  Read latency: {results['dram_read_latency_ns']:.2f} ns")
+    print(f"  Row-buffer hit rate: {results['dram_row_hit_rate']:.2f}%")
+    print(f"  DRAM power: {results['dram_power_w'] * 1e3:.2f} mW "
+          f"({results['dram_energy_j'] * 1e6:.2f} uJ)")
+    print("="*80)
+
+
+# Analytic on-chip SRAM energy (CACTI-style figures for a 32kB array in a
+# 28nm edge SoC). A cache access reads the tags and all ways of the set; a
+# scratchpad access reads one word line with no tag compare.
+L1D_ACCESS_PJ = 20.0
+SCRATCHPAD_ACCESS_PJ = 6.0
+SRAM_LEAKAGE_MW_PER_KB = 0.04
+
+
+def summarize_onchip_memory(dumps, dcache_paths, scratchpad_path, l1d_kb,
+                            scratchpad_kb, cpu_energy_j, dram_energy_j,
+                            num_readings):
+    """Energy of the L1D and scratchpad accesses and leakage.
+
+    Summed over the given dumps. l1d_kb / scratchpad_kb are the total sizes
+    (0 if absent) and set the leakage. The total adds the CPU and DRAM
+    energy, so cached and scratchpad runs compare on one figure.
+    """
+    sim_seconds = l1d_accesses = spm_accesses = 0.0
+    for stats in dumps:
+        sim_seconds += stats.get('simSeconds', 0.0)
+        for path in dcache_paths:
+            l1d_accesses += stats.get(f'{path}.overallAccesses::total', 0.0)
+        if scratchpad_path:
+            spm_accesses += (stats.get(f'{scratchpad_path}.numReads::total', 0.0) +
+                             stats.get(f'{scratchpad_path}.numWrites::total', 0.0))
+
+    leakage_w = SRAM_LEAKAGE_MW_PER_KB * 1e-3 * sim_seconds
+    l1d_energy = l1d_accesses * L1D_ACCESS_PJ * 1e-12 + l1d_kb * leakage_w
+    spm_energy = (spm_accesses * SCRATCHPAD_ACCESS_PJ * 1e-12 +
+                  scratchpad_kb * leakage_w)
+    total = cpu_energy_j + dram_energy_j + l1d_energy + spm_energy
+    return {
+        'l1d_data_accesses': l1d_accesses,
+        'scratchpad_accesses': spm_accesses,
+        'l1d_energy_j': l1d_energy,
+        'scratchpad_energy_j': spm_energy,
+        'onchip_mem_energy_j': l1d_energy + spm_energy,
+        'total_energy_j': total,
+        'total_energy_per_reading_j': total / num_readings if num_readings > 0 else 0.0,
+    }
+
+
+def print_onchip_memory(results):
+    """Print the on-chip memory energy and the CPU + memory total."""
+    print("\n" + "="*80)
+    print("On-chip Memory Energy")
+    print("="*80)
+    print(f"  L1D: {results['l1d_data_accesses']:,.0f} accesses, "
+          f"{results['l1d_energy_j'] * 1e6:.2f} uJ")
+    print(f"  Scratchpad: {results['scratchpad_accesses']:,.0f} accesses, "
+          f"{results['scratchpad_energy_j'] * 1e6:.2f} uJ")
+    print(f"  CPU + DRAM + on-chip energy: {results['total_energy_j'] * 1e6:.2f} uJ "
+          f"({results['total_energy_per_reading_j'] * 1e9:.3f} nJ/reading)")
+    print("="*80)
+
+
+def summarize_accelerator(dumps, accel_path, energy_pj, cpu_energy_j,
+                          num_readings):
+    """Utilization and energy of the filter accelerator, summed over the
+    given dumps, and the CPU + accelerator energy per reading.
+    
+    The energy is the power model's leakage over the run plus energy_pj per
+    filtered reading (0 without power models).
+    """
+    sim_seconds = busy_ticks = readings = energy = 0.0
+    ticks_per_second = 1e12
+
+    for stats in dumps:
+        ticks_per_second = stats.get('simFreq', 1e12)
+        seconds = stats.get('simSeconds', 0.0)
+        sim_seconds += seconds
+        busy_ticks += stats.get(f'{accel_path}.busyTicks', 0.0)
+        readings += stats.get(f'{accel_path}.readings', 0.0)
+        energy += seconds * cpu_power(stats, accel_path)
+
+    energy += readings * energy_pj * 1e-12
+    busy_seconds = busy_ticks / ticks_per_second
+    total = cpu_energy_j + energy
+    return {
+        'accel_readings': readings,
+        'accel_busy_seconds': busy_seconds,
+        'accel_utilization': (100.0 * busy_seconds / sim_seconds
+                              if sim_seconds > 0 else 0.0),
+        'accel_energy_j': energy,
+        'cpu_accel_energy_j': total,
+        'cpu_accel_energy_per_reading_j': (total / num_readings
+                                           if num_readings > 0 else 0.0),
+    }
+
+
+def print_accelerator_summary(results):
+    """Print the filter accelerator figures of one run."""
+    print("\n" + "="*80)
+    print("Filter Accelerator")
+    print("="*80)
+    print(f"  Readings filtered: {results['accel_readings']:,.0f}")
+    print(f"  Busy: {results['accel_busy_seconds'] * 1e6:.2f} us "
+          f"({results['accel_utilization']:.2f}% of the run)")
+    print(f"  Accelerator energy: {results['accel_energy_j'] * 1e6:.3f} uJ")
+    print(f"  CPU + accelerator energy: {results['cpu_accel_energy_j'] * 1e6:.2f} uJ "
+          f"({results['cpu_accel_energy_per_reading_j'] * 1e9:.3f} nJ/reading)")
+    print("="*80)
+
+
+def summarize_l2_compression(dumps, cache_path, line_bytes, decomp_latency,
+                             storage_kib):
+    """Compression ratio and decompression cost of the L2, summed over the
+    given dumps.
+    
+    The ratio is the line size over the average compressed size. Lines that
+    stay above the compressor's size threshold are stored uncompressed;
+    each read hit on a compressed line adds at most decomp_latency cycles,
+    so the decompression cycles are an upper bound.
+    """
+    compressor = f'{cache_path}.compressor'
+    compressions = size_bits = failed = decompressions = 0.0
+
+    for stats in dumps:
+        compressions += stats.get(f'{compressor}.compressions', 0.0)
+        size_bits += stats.get(f'{compressor}.compressionSizeBits', 0.0)
+        failed += stats.get(f'{compressor}.failedCompressions', 0.0)
+        decompressions += stats.get(f'{compressor}.decompressions', 0.0)
+
+    return {
+        'l2_storage_kib': storage_kib,
+        'l2_compressions': compressions,
+        'l2_compression_ratio': (compressions * line_bytes * 8 / size_bits
+                                 if size_bits > 0 else 0.0),
+        'l2_uncompressed_pct': (100.0 * failed / compressions
+                                if compressions > 0 else 0.0),
+        'l2_decompressions': decompressions,
+        'l2_decomp_latency_max_cycles': decomp_latency,
+        'l2_decomp_cycles_max': decompressions * decomp_latency,
+    }
+
+
+def print_l2_compression(results, compressor):
+    """Print the L2 compression figures of one run."""
+    print("\n" + "="*80)
+    print(f"L2 Compression ({compressor})")
+    print("="*80)
+    print(f"  Storage (data + tags): {results['l2_storage_kib']:.1f} KiB")
+    print(f"  Compressions: {results['l2_compressions']:,.0f} "
+          f"(ratio {results['l2_compression_ratio']:.3f}, "
+          f"{results['l2_uncompressed_pct']:.2f}% stored uncompressed)")
+    print(f"  Decompressions: {results['l2_decompressions']:,.0f} x "
+          f"<= {results['l2_decomp_latency_max_cycles']} cycles = "
+          f"<= {results['l2_decomp_cycles_max']:,.0f} cycles")
+    print("="*80)
+
+
+def summarize_sensor_dma(dumps, device_path, overruns):
+    """Ingest traffic of the DMA sensor device, summed over the given dumps.
+    
+    The DMA latency runs from the moment a batch has been sampled to its
+    completion (counter written), so it includes waiting for the previous
+    batch and the memory contention with the cores.
+    """
+    sim_seconds = batches = num_bytes = latency_ticks = queued = 0.0
+    ticks_per_ns = 1e3
+
+    for stats in dumps:
+        ticks_per_ns = stats.get('simFreq', 1e12) / 1e9
+        sim_seconds += stats.get('simSeconds', 0.0)
+        batches += stats.get(f'{device_path}.batches', 0.0)
+        num_bytes += stats.get(f'{device_path}.bytesWritten', 0.0)
+        latency_ticks += stats.get(f'{device_path}.totalDmaLatency', 0.0)
+        queued += stats.get(f'{device_path}.queuedBatches', 0.0)
+
+    return {
+        'dma_batches': batches,
+        'dma_bandwidth_gbps': num_bytes / sim_seconds / 1e9 if sim_seconds > 0 else 0.0,
+        'dma_latency_ns': (latency_ticks / ticks_per_ns / batches
+                           if batches > 0 else 0.0),
+        'dma_queued_batches': queued,
+        'ring_overruns': overruns,
+    }
+
+
+def print_sensor_dma(results):
+    """Print the ingest figures of the DMA sensor device."""
+    print("\n" + "="*80)
+    print("Sensor DMA Ingest")
+    print("="*80)
+    print(f"  Batches (completion events): {results['dma_batches']:,.0f}")
+    print(f"  Ingest bandwidth: {results['dma_bandwidth_gbps']:.3f} GB/s")
+    print(f"  DMA latency: {results['dma_latency_ns']:.2f} ns "
+          f"({results['dma_queued_batches']:,.0f} batches queued)")
+    print(f"  Ring overruns: {results['ring_overruns']} window(s)")
+    print("="*80)
+
+
+# Ruby coherence events per protocol: metric -> (controller machine, events).
+# Invalidations are invalidating requests/snoops received by the L1s;
+# sharing misses are L1 misses served by (forwarded to) another core's L1.
+COHERENCE_EVENTS = {
+    'mesi': {
+        'invalidations': ('L1Cache', ['Inv']),
+        'sharing_misses': ('L1Cache', ['Fwd_GETS', 'Fwd_GETX', 'Fwd_GET_INSTR']),
+    },
+    'moesi': {
+        'invalidations': ('L1Cache', ['Inv']),
+        'sharing_misses': ('L1Cache', ['Fwd_GETS', 'Fwd_GETX']),
+    },
+    'chi': {
+        'invalidations': ('Cache', ['SnpUnique', 'SnpUniqueFwd',
+                                    'SnpCleanInvalid']),
+        'sharing_misses': ('Cache', ['SnpShared', 'SnpSharedFwd',
+                                     'SnpNotSharedDirty',
+                                     'SnpNotSharedDirtyFwd',
+                                     'SnpOnce', 'SnpOnceFwd']),
+    },
+}
+
+# Controllers acting as the directory (CHI: the home nodes)
+DIRECTORY_CONTROLLERS = {'mesi': 'dir_cntrl', 'moesi': 'dir_cntrl', 'chi': 'hnf'}
+
+
+def summarize_coherence(dumps, protocol, num_readings):
+    """Invalidations, sharing misses and directory occupancy of a Ruby run.
+    
+    Event counts are summed over the given dumps. Directory occupancy is
+    the average number of messages queued in the directory controllers'
+    buffers, weighted by the simulated time of every dump.
+    """
+    totals = dict.fromkeys(COHERENCE_EVENTS[protocol], 0.0)
+    queued = sim_seconds = 0.0
+    directory = DIRECTORY_CONTROLLERS[protocol]
+
+    for stats in dumps:
+        for metric, (machine, events) in COHERENCE_EVENTS[protocol].items():
+            totals[metric] += sum(
+                stats.get(f'system.ruby.{machine}_Controller.{event}', 0.0)
+                for event in events)
+        seconds = stats.get('simSeconds', 0.0)
+        queued += seconds * sum(value for name, value in stats.items()
+                                if f'.{directory}' in name and
+                                name.endswith('.m_buf_msgs'))
+        sim_seconds += seconds
+
+    return {
+        'coherence_invalidations': totals['invalidations'],
+        'coherence_sharing_misses': totals['sharing_misses'],
+        'coherence_events_per_1k_readings': (
+            1000.0 * (totals['invalidations'] + totals['sharing_misses']) /
+            num_readings if num_readings > 0 else 0.0),
+        'directory_avg_queued_msgs': queued / sim_seconds if sim_seconds > 0 else 0.0,
+    }
+
+
+def print_coherence_summary(results, protocol):
+    """Print the coherence traffic of a Ruby run."""
+    print("\n" + "="*80)
+    print(f"Coherence ({protocol})")
+    print("="*80)
+    print(f"  Invalidations: {results['coherence_invalidations']:,.0f}")
+    print(f"  Sharing misses: {results['coherence_sharing_misses']:,.0f}")
+    print(f"  Coherence events per 1k readings: "
+          f"{results['coherence_events_per_1k_readings']:.2f}")
+    print(f"  Directory occupancy: {results['directory_avg_queued_msgs']:.3f} "
+          f"queued messages")
+    print("="*80)
+
+
+def domain_temperature(stats, domain_path):
+    """Temperature (C) of a ThermalDomain in one dump, None if not present."""
+    for name in (f'{domain_path}.temp', f'{domain_path}.currentTemp'):
+        if name in stats:
+            return stats[name]
+    return None
+
+
+def summarize_thermal(dumps, domain_path, cpu_paths):
+    """Temperature and leakage trajectory, one point per stats dump.
+    
+    Each dump covers one epoch (periodic dumps reset the stats), so the
+    time of a point is the simulated time up to the end of its epoch.
+    Returns the summary (initial/final/peak temperature and the growth of
+    the static power caused by the temperature rise) and the trajectory.
+    """
+    trajectory = []
+    elapsed = 0.0
+    for epoch, stats in enumerate(dumps):
+        elapsed += stats.get('simSeconds', 0.0)
+        temp = domain_temperature(stats, domain_path)
+        if temp is None:
+            continue
+        trajectory.append({
+            'epoch': epoch,
+            'sim_seconds': elapsed,
+            'temp_c': temp,
+            'static_power_w': sum(
+                stats.get(f'{path}.power_model.staticPower', 0.0)
+                for path in cpu_paths),
+            'dynamic_power_w': sum(
+                stats.get(f'{path}.power_model.dynamicPower', 0.0)
+                for path in cpu_paths),
+        })
+    if not trajectory:
+        return {}, trajectory
+
+    first, last = trajectory[0], trajectory[-1]
+    return {
+        'temp_initial_c': first['temp_c'],
+        'temp_final_c': last['temp_c'],
+        'temp_peak_c': max(p['temp_c'] for p in trajectory),
+        'static_power_initial_w': first['static_power_w'],
+        'static_power_final_w': last['static_power_w'],
+        'leakage_increase_pct': (
+            100.0 * (last['static_power_w'] - first['static_power_w']) /
+            first['static_power_w'] if first['static_power_w'] > 0 else 0.0),
+    }, trajectory
+
+
+def print_thermal_summary(results, trajectory):
+    """Print the temperature and leakage trajectory of one run."""
+    print("\n" + "="*80)
+    print("Thermal")
+    print("="*80)
+    print(f"  {'Epoch':<7}{'Time(ms)':>10}{'Temp(C)':>10}"
+          f"{'Leakage(W)':>12}{'Dynamic(W)':>12}")
+    for p in trajectory:
+        print(f"  {p['epoch']:<7}{p['sim_seconds'] * 1e3:>10.3f}"
+              f"{p['temp_c']:>10.3f}{p['static_power_w']:>12.4f}"
+              f"{p['dynamic_power_w']:>12.4f}")
+    print(f"  Temperature: {results['temp_initial_c']:.2f} C -> "
+          f"{results['temp_final_c']:.2f} C (peak {results['temp_peak_c']:.2f} C)")
+    print(f"  Leakage: {results['static_power_initial_w']:.4f} W -> "
+          f"{results['static_power_final_w']:.4f} W "
+          f"({results['leakage_increase_pct']:+.2f}%)")
+    print("="*80)
+
+
+def print_summary(results):
+    """Print the derived metrics of one run."""
+    print("\n" + "="*80)
+    print("Edge Throughput and Power")
+    print("="*80)
+    print(f"  Readings processed: {results['readings']:,}")
+    print(f"  Simulated time: {results['sim_seconds']:.6f} s")
+    print(f"  Throughput: {results['throughput_rps']:,.0f} readings/s")
+    if results['cpu_power_w'] > 0:
+        print(f"  CPU power: {results['cpu_power_w']:.4f} W")
+        print(f"  CPU energy: {results['energy_j'] * 1e6:.2f} uJ")
+        print(f"  Energy per reading: "
+              f"{results['energy_per_reading_j'] * 1e9:.3f} nJ")
+        print(f"  Throughput per watt: "
+              f"{results['throughput_per_watt']:,.0f} readings/s/W")
+    else:
+        print("  CPU power: n/a (run with --power-models)")
+    print("="*80)
+
+
+def read_window_timings(program_output):
+    """Parse `WINDOW <idx> <arrival_ns> <start_ns> <done_ns>` lines."""
+    timings = []
+
+    with open(program_output, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 5 and parts[0] == 'WINDOW':
+                timings.append(tuple(int(p) for p in parts[2:]))
+
+    return timings
+
+
+def read_equivalence_check(program_output):
+    """Result ('PASS'/'FAIL') of the layout workload's equivalence check."""
+    with open(program_output, 'r') as f:
+        for line in f:
+            if line.startswith('Equivalence check'):
+                return line.split(':', 1)[1].split()[0]
+    return ''
+
+
+def read_ring_overruns(program_output):
+    """Windows of the DMA ingest workload overwritten before they were read."""
+    with open(program_output, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == 'RING_OVERRUNS':
+                return int(parts[1])
+    return 0
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize_latency(timings, window_size):
+    """Per-window latency percentiles and maximum sustainable input rate.
+    
+    Latency is measured from the arrival of a window's last reading to the
+    end of its processing, so it includes queueing behind earlier windows.
+    The sustainable rate is the rate at which the mean per-window service
+    time exactly matches the window inter-arrival time.
+    """
+    latencies = [done - arrival for arrival, _, done in timings]
+    service = [done - start for _, start, done in timings]
+    mean_service_ns = sum(service) / len(service)
+
+    return {
+        'window_size': window_size,
+        'windows': len(timings),
+        'latency_p50_us': percentile(latencies, 50) / 1e3,
+        'latency_p99_us': percentile(latencies, 99) / 1e3,
+        'latency_max_us': max(latencies) / 1e3,
+        'service_mean_us': mean_service_ns / 1e3,
+        'max_sustainable_rate_rps': (window_size * 1e9 / mean_service_ns
+                                     if mean_service_ns > 0 else 0.0),
+    }
+
+
+def print_latency_summary(results):
+    """Print the per-window latency figures of a streaming run."""
+    print("\n" + "="*80)
+    print("Streaming Latency")
+    print("="*80)
+    print(f"  Windows: {results['windows']} x {results['window_size']} readings")
+    print(f"  Latency p50: {results['latency_p50_us']:.2f} us")
+    print(f"  Latency p99: {results['latency_p99_us']:.2f} us")
+    print(f"  Latency max: {results['latency_max_us']:.2f} us")
+    print(f"  Mean service time: {results['service_mean_us']:.2f} us/window")
+    print(f"  Max sustainable input rate: "
+          f"{results['max_sustainable_rate_rps']:,.0f} readings/s")
+    print("="*80)
+
+
+# Metrics compared between a parallel (multi-queue) run and its baseline
+DEVIATION_METRICS = ['sim_seconds', 'throughput_rps', 'cpu_power_w',
+                     'l1d_miss_rate', 'l2_miss_rate', 'l1d_amat_ns',
+                     'dram_bandwidth_gbps']
+
+
+def load_result_csv(result_file):
+    """Read the (single) row of a result CSV written by save_results_csv."""
+    with open(result_file, 'r', newline='') as f:
+        return next(csv.DictReader(f), {})
+
+
+def compare_with_baseline(results, baseline):
+    """Host speedup and per-metric deviation (%) against a baseline row."""
+    compared = {}
+    base_host = float(baseline.get('host_seconds') or 0.0)
+    compared['host_speedup'] = (base_host / results['host_seconds']
+                                if results['host_seconds'] > 0 else 0.0)
+    for metric in DEVIATION_METRICS:
+        base = float(baseline.get(metric) or 0.0)
+        value = results.get(metric, 0.0)
+        compared[f'{metric}_deviation_pct'] = (
+            100.0 * (value - base) / base if base != 0 else 0.0)
+    return compared
+
+
+def print_parallel_summary(compared, baseline_name):
+    """Print the speedup and stat deviation of a parallel run."""
+    print("\n" + "="*80)
+    print(f"Parallel Simulation vs {baseline_name}")
+    print("="*80)
+    print(f"  Host speedup: {compared['host_speedup']:.2f}x")
+    for metric in DEVIATION_METRICS:
+        print(f"  {metric:<22}{compared[f'{metric}_deviation_pct']:>+10.4f}%")
+    print("="*80)
+
+
+def save_results_csv(results, config_name, output_dir):
+    """Save one result row to <output_dir>/<config_name>_result.csv."""
+    os.makedirs(output_dir, exist_ok=True)
+    result_file = os.path.join(output_dir, f'{config_name}_result.csv')
+
+    row = {'config': config_name}
+    row.update(results)
+
+    with open(result_file, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(row.keys()))
+        writer.writeheader()
+        writer.writerow(row)
+
+    print(f"Results saved to {result_file}")
+
+
+def save_trajectory_csv(trajectory, config_name, output_dir):
+    """Save the thermal trajectory to <output_dir>/<config_name>_thermal.csv."""
+    os.makedirs(output_dir, exist_ok=True)
+    trajectory_file = os.path.join(output_dir, f'{config_name}_thermal.csv')
+
+    with open(trajectory_file, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(trajectory[0].keys()))
+        writer.writeheader()
+        writer.writerows(trajectory)
+
+    print(f"Thermal trajectory saved to {trajectory_file}")
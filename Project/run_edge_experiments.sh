@@ -0,0 +1,467 @@
+#!/bin/bash
+
+# Script to compare homogeneous and heterogeneous (big.LITTLE) edge designs
+# the streaming latency of each CPU/cache configuration and the throughput
+# across working-set sizes
+# Each configuration runs in a separate gem5 process with power models enabled
+
+set -e  # Exit on error
+
+BASE_DIR="configs/practice/Project"
+GEM5_BIN="./build/ARM/gem5.opt"
+CONFIG_SCRIPT="${BASE_DIR}/edge_power_config.py"
+BINARY="${BASE_DIR}/workloads/edge_preprocessing_mt_arm"
+STREAMING_BINARY="${BASE_DIR}/workloads/edge_streaming_arm"
+RESULTS_DIR="${BASE_DIR}/results"
+RESULTS_FILE="${RESULTS_DIR}/all_edge_experiments.csv"
+STREAMING_RESULTS_DIR="${RESULTS_DIR}/streaming"
+STREAMING_RESULTS_FILE="${STREAMING_RESULTS_DIR}/all_streaming_experiments.csv"
+SCALING_BINARY="${BASE_DIR}/workloads/edge_preprocessing_arm"
+SCALING_RESULTS_DIR="${RESULTS_DIR}/working_set"
+SCALING_RESULTS_FILE="${SCALING_RESULTS_DIR}/all_working_set_experiments.csv"
+LLC_RESULTS_DIR="${RESULTS_DIR}/llc"
+LLC_RESULTS_FILE="${LLC_RESULTS_DIR}/all_llc_experiments.csv"
+MEM_RESULTS_DIR="${RESULTS_DIR}/memory"
+MEM_RESULTS_FILE="${MEM_RESULTS_DIR}/all_memory_experiments.csv"
+THERMAL_RESULTS_DIR="${RESULTS_DIR}/thermal"
+THERMAL_RESULTS_FILE="${THERMAL_RESULTS_DIR}/all_thermal_experiments.csv"
+PARALLEL_RESULTS_DIR="${RESULTS_DIR}/parallel"
+PARALLEL_RESULTS_FILE="${PARALLEL_RESULTS_DIR}/all_parallel_experiments.csv"
+COHERENCE_RESULTS_DIR="${RESULTS_DIR}/coherence"
+COHERENCE_RESULTS_FILE="${COHERENCE_RESULTS_DIR}/all_coherence_experiments.csv"
+SIMD_BINARY="${BASE_DIR}/workloads/edge_preprocessing_sve_arm"
+SIMD_RESULTS_DIR="${RESULTS_DIR}/simd"
+SIMD_RESULTS_FILE="${SIMD_RESULTS_DIR}/all_simd_experiments.csv"
+LAYOUT_BINARY="${BASE_DIR}/workloads/edge_preprocessing_layout_arm"
+LAYOUT_RESULTS_DIR="${RESULTS_DIR}/layout"
+LAYOUT_RESULTS_FILE="${LAYOUT_RESULTS_DIR}/all_layout_experiments.csv"
+SPM_BINARY="${BASE_DIR}/workloads/edge_preprocessing_spm_arm"
+SPM_RESULTS_DIR="${RESULTS_DIR}/scratchpad"
+SPM_RESULTS_FILE="${SPM_RESULTS_DIR}/all_scratchpad_experiments.csv"
+INGEST_BINARY="${BASE_DIR}/workloads/edge_ingest_arm"
+INGEST_RESULTS_DIR="${RESULTS_DIR}/ingest"
+INGEST_RESULTS_FILE="${INGEST_RESULTS_DIR}/all_ingest_experiments.csv"
+ACCEL_BINARY="${BASE_DIR}/workloads/edge_preprocessing_accel_arm"
+ACCEL_RESULTS_DIR="${RESULTS_DIR}/accelerator"
+ACCEL_RESULTS_FILE="${ACCEL_RESULTS_DIR}/all_accelerator_experiments.csv"
+COMPRESSION_RESULTS_DIR="${RESULTS_DIR}/compression"
+COMPRESSION_RESULTS_FILE="${COMPRESSION_RESULTS_DIR}/all_compression_experiments.csv"
+ROI_BINARY="${BASE_DIR}/workloads/edge_preprocessing_roi_arm"
+ROI_RESULTS_DIR="${RESULTS_DIR}/roi"
+ROI_RESULTS_FILE="${ROI_RESULTS_DIR}/all_roi_experiments.csv"
+# libm5 (m5ops) for the ROI binary
+M5_LIB_DIR="util/m5/build/arm64/out"
+# Ruby protocols compiled into GEM5_BIN (SET 9), e.g. "mesi" for a build
+# with PROTOCOL=MESI_Two_Level
+RUBY_PROTOCOLS="${RUBY_PROTOCOLS:-}"
+
+echo "======================================================================"
+echo "Edge Processor Experiments"
+echo "Homogeneous vs heterogeneous (big.LITTLE) designs, streaming latency"
+echo "======================================================================"
+
+# Step 1: Compile the workloads that are missing or older than their sources
+echo ""
+echo "Step 1: Checking/compiling edge workloads..."
+echo "----------------------------------------------------------------------"
+
+# Compile workloads/<source> into <binary> (extra gcc flags after the
+# source) unless the binary is newer than the source and the shared headers
+build_workload() {
+    local binary="$1"
+    local source="${BASE_DIR}/workloads/$2"
+    shift 2
+
+    local stale=0
+    if [ ! -f "${binary}" ]; then
+        stale=1
+    else
+        for dep in "${source}" "${BASE_DIR}"/workloads/*.h; do
+            if [ "${dep}" -nt "${binary}" ]; then
+                stale=1
+            fi
+        done
+    fi
+    if [ ${stale} -eq 1 ]; then
+        echo "Compiling $(basename "${source}")..."
+        aarch64-linux-gnu-gcc -O2 -static "${source}" -o "${binary}" "$@" -lm
+        echo "✓ Compiled successfully: ${binary}"
+    else
+        echo "✓ Binary up to date: ${binary}"
+    fi
+}
+
+build_workload "${BINARY}" edge_preprocessing_mt.c -pthread
+build_workload "${STREAMING_BINARY}" edge_streaming.c
+build_workload "${SCALING_BINARY}" edge_preprocessing.c
+# SVE kernels need the +sve target; no auto-vectorization so that the
+# scalar variant stays scalar
+build_workload "${SIMD_BINARY}" edge_preprocessing.c \
+    -march=armv8-a+sve -fno-tree-vectorize
+build_workload "${LAYOUT_BINARY}" edge_preprocessing_layout.c
+build_workload "${SPM_BINARY}" edge_preprocessing_spm.c
+build_workload "${INGEST_BINARY}" edge_ingest.c
+build_workload "${ACCEL_BINARY}" edge_preprocessing_accel.c
+# ROI markers as m5ops work items (one stats dump per pipeline phase)
+if [ ! -f "${M5_LIB_DIR}/libm5.a" ]; then
+    echo "Building libm5..."
+    (cd util/m5 && scons build/arm64/out/m5)
+fi
+build_workload "${ROI_BINARY}" edge_preprocessing.c -DEDGE_M5OPS -Iinclude \
+    -L"${M5_LIB_DIR}" -lm5
+
+# Step 2: Create results directory
+echo ""
+echo "Step 2: Setting up results directory..."
+echo "----------------------------------------------------------------------"
+mkdir -p "${RESULTS_DIR}" "${STREAMING_RESULTS_DIR}" "${SCALING_RESULTS_DIR}" \
+    "${LLC_RESULTS_DIR}" "${MEM_RESULTS_DIR}" "${THERMAL_RESULTS_DIR}" \
+    "${PARALLEL_RESULTS_DIR}" "${COHERENCE_RESULTS_DIR}" "${SIMD_RESULTS_DIR}" \
+    "${LAYOUT_RESULTS_DIR}" "${SPM_RESULTS_DIR}" "${INGEST_RESULTS_DIR}" \
+    "${ACCEL_RESULTS_DIR}" "${COMPRESSION_RESULTS_DIR}" "${ROI_RESULTS_DIR}"
+rm -f "${RESULTS_DIR}"/*_result.csv "${STREAMING_RESULTS_DIR}"/*_result.csv \
+    "${SCALING_RESULTS_DIR}"/*_result.csv "${LLC_RESULTS_DIR}"/*_result.csv \
+    "${MEM_RESULTS_DIR}"/*_result.csv "${THERMAL_RESULTS_DIR}"/*_result.csv \
+    "${THERMAL_RESULTS_DIR}"/*_thermal.csv "${PARALLEL_RESULTS_DIR}"/*_result.csv \
+    "${COHERENCE_RESULTS_DIR}"/*_result.csv "${SIMD_RESULTS_DIR}"/*_result.csv \
+    "${LAYOUT_RESULTS_DIR}"/*_result.csv "${SPM_RESULTS_DIR}"/*_result.csv \
+    "${INGEST_RESULTS_DIR}"/*_result.csv "${ACCEL_RESULTS_DIR}"/*_result.csv \
+    "${COMPRESSION_RESULTS_DIR}"/*_result.csv "${ROI_RESULTS_DIR}"/*_result.csv
+echo "✓ Cleaned up old result files"
+echo "✓ Results will be saved to: ${RESULTS_DIR}"
+
+# Step 3: Run experiments
+echo ""
+echo "Step 3: Running edge experiments..."
+echo "======================================================================"
+
+total_experiments=0
+completed_experiments=0
+
+# Function to run an experiment:
+#   run_edge_experiment <name> <binary> <results dir> <config args...>
+run_edge_experiment() {
+    local name="$1"
+    local binary="$2"
+    local results_dir="$3"
+    shift 3
+
+    total_experiments=$((total_experiments + 1))
+
+    echo ""
+    echo "Experiment ${total_experiments}: ${name}"
+    echo "----------------------------------------------------------------------"
+    echo "  Options: $*"
+
+    if ${GEM5_BIN} --outdir="${BASE_DIR}/m5out_${name}" "${CONFIG_SCRIPT}" \
+        --binary="${binary}" \
+        --power-models \
+        --config-name="${name}" \
+        --output-dir="${results_dir}" \
+        "$@" > "${results_dir}/${name}.log" 2>&1; then
+        completed_experiments=$((completed_experiments + 1))
+        echo "✓ ${name} completed successfully"
+    else
+        echo "✗ ${name} failed (see ${results_dir}/${name}.log)"
+    fi
+}
+
+# Function to combine individual results: combine_results <dir> <combined file>
+combine_results() {
+    local results_dir="$1"
+    local combined_file="$2"
+    local first_result
+
+    first_result=$(find "${results_dir}" -maxdepth 1 -name "*_result.csv" -type f | head -n 1)
+
+    if [ -n "$first_result" ]; then
+        head -1 "$first_result" > "${combined_file}"
+        for result_file in "${results_dir}"/*_result.csv; do
+            if [ -f "$result_file" ]; then
+                tail -n +2 "$result_file" >> "${combined_file}"
+            fi
+        done
+        echo "✓ Combined results saved to: ${combined_file}"
+    else
+        echo "✗ No result files found in ${results_dir}"
+    fi
+}
+
+# ======================================================================
+# EXPERIMENT SET 1: HOMOGENEOUS DESIGNS (4 cores)
+# ======================================================================
+run_edge_experiment "homog_minor_4" "${BINARY}" "${RESULTS_DIR}" \
+    --cpu-type=minor --num-cores=4 --options=4
+run_edge_experiment "homog_o3_4" "${BINARY}" "${RESULTS_DIR}" \
+    --cpu-type=o3 --num-cores=4 --options=4
+
+# ======================================================================
+# EXPERIMENT SET 2: HETEROGENEOUS big.LITTLE DESIGNS (2 little + 2 big)
+# ======================================================================
+run_edge_experiment "biglittle_2_2" "${BINARY}" "${RESULTS_DIR}" \
+    --cpu-type=biglittle --options="4"
+run_edge_experiment "biglittle_2_2_placement" "${BINARY}" "${RESULTS_DIR}" \
+    --cpu-type=biglittle --task-placement
+
+# ======================================================================
+# EXPERIMENT SET 3: STREAMING LATENCY PER CPU/CACHE CONFIGURATION
+# ======================================================================
+for cpu in minor o3; do
+    run_edge_experiment "stream_${cpu}_l1" "${STREAMING_BINARY}" "${STREAMING_RESULTS_DIR}" \
+        --cpu-type=${cpu} --streaming
+    run_edge_experiment "stream_${cpu}_l2" "${STREAMING_BINARY}" "${STREAMING_RESULTS_DIR}" \
+        --cpu-type=${cpu} --streaming --l2-cache
+done
+
+# ======================================================================
+# EXPERIMENT SET 4: WORKING-SET SIZE SWEEP (8 sensors x N samples)
+# 16 bytes per reading: 16KiB .. 2MiB against 32KiB L1D / 256KiB L2
+# ======================================================================
+for samples in 128 256 512 1024 2048 4096 8192 16384; do
+    run_edge_experiment "ws_minor_l2_${samples}" "${SCALING_BINARY}" "${SCALING_RESULTS_DIR}" \
+        --cpu-type=minor --l2-cache --samples-per-sensor=${samples}
+done
+
+# ======================================================================
+# EXPERIMENT SET 5: L2 SIZE WITH AND WITHOUT A SHARED L3
+# ======================================================================
+for l2 in 64kB 128kB 256kB 512kB; do
+    run_edge_experiment "llc_minor_l2_${l2}" "${SCALING_BINARY}" "${LLC_RESULTS_DIR}" \
+        --cpu-type=minor --l2-cache --l2-size=${l2} --samples-per-sensor=8192
+    for policy in nine exclusive; do
+        run_edge_experiment "llc_minor_l2_${l2}_l3_${policy}" "${SCALING_BINARY}" "${LLC_RESULTS_DIR}" \
+            --cpu-type=minor --l2-size=${l2} --l3-cache --l3-policy=${policy} \
+            --samples-per-sensor=8192
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 6: DRAM TECHNOLOGY, CHANNELS AND POLICIES
+# ======================================================================
+for mem in ddr3 ddr4 lpddr3 lpddr5 hbm; do
+    run_edge_experiment "mem_minor_${mem}" "${SCALING_BINARY}" "${MEM_RESULTS_DIR}" \
+        --cpu-type=minor --l2-cache --mem-type=${mem} --samples-per-sensor=8192
+done
+for channels in 2 4; do
+    run_edge_experiment "mem_minor_lpddr5_${channels}ch" "${SCALING_BINARY}" "${MEM_RESULTS_DIR}" \
+        --cpu-type=minor --l2-cache --mem-type=lpddr5 --mem-channels=${channels} \
+        --samples-per-sensor=8192
+done
+for policy in open close; do
+    run_edge_experiment "mem_minor_lpddr5_${policy}" "${SCALING_BINARY}" "${MEM_RESULTS_DIR}" \
+        --cpu-type=minor --l2-cache --mem-type=lpddr5 --page-policy=${policy} \
+        --samples-per-sensor=8192
+done
+
+# ======================================================================
+# EXPERIMENT SET 7: LEAKAGE-TEMPERATURE FEEDBACK (fanless enclosure)
+# ======================================================================
+for cpu in minor o3; do
+    for ambient in 25 45; do
+        run_edge_experiment "thermal_${cpu}_${ambient}C" "${SCALING_BINARY}" "${THERMAL_RESULTS_DIR}" \
+            --cpu-type=${cpu} --l2-cache --thermal --ambient-temp=${ambient} \
+            --samples-per-sensor=8192 --stat-freq=0.0001
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 8: PARALLEL HOST SIMULATION (one event queue per core)
+# ======================================================================
+run_edge_experiment "parallel_minor_4_1q" "${BINARY}" "${PARALLEL_RESULTS_DIR}" \
+    --cpu-type=minor --num-cores=4 --options=4
+for quantum in 100ns 1us 10us; do
+    run_edge_experiment "parallel_minor_4_q${quantum}" "${BINARY}" "${PARALLEL_RESULTS_DIR}" \
+        --cpu-type=minor --num-cores=4 --options=4 \
+        --parallel-eventqs --sim-quantum=${quantum} \
+        --baseline-result="${PARALLEL_RESULTS_DIR}/parallel_minor_4_1q_result.csv"
+done
+
+# ======================================================================
+# EXPERIMENT SET 9: RUBY COHERENCE AND THE COST OF SHARING THE AGGREGATES
+# ======================================================================
+for protocol in ${RUBY_PROTOCOLS}; do
+    for sharing in padded packed shared; do
+        run_edge_experiment "coherence_${protocol}_${sharing}" "${BINARY}" "${COHERENCE_RESULTS_DIR}" \
+            --cpu-type=minor --num-cores=4 --ruby=${protocol} \
+            --options="4 0 ${sharing}"
+    done
+done
+if [ -z "${RUBY_PROTOCOLS}" ]; then
+    echo "Skipped SET 9: set RUBY_PROTOCOLS (mesi, moesi and/or chi) to the"
+    echo "protocols gem5 was built with"
+fi
+
+# ======================================================================
+# EXPERIMENT SET 10: SCALAR VS NEON VS SVE (128/256/512-bit) KERNELS
+# ======================================================================
+for cpu in minor o3; do
+    for variant in scalar neon; do
+        run_edge_experiment "simd_${cpu}_${variant}" "${SIMD_BINARY}" "${SIMD_RESULTS_DIR}" \
+            --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192 --options=${variant}
+    done
+    for vl in 128 256 512; do
+        run_edge_experiment "simd_${cpu}_sve${vl}" "${SIMD_BINARY}" "${SIMD_RESULTS_DIR}" \
+            --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192 --options=sve \
+            --sve-vl=${vl}
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 11: DATA LAYOUT AND NUMBER FORMAT (AoS/SoA, Q15/Q31)
+# ======================================================================
+for cpu in minor o3; do
+    for layout in aos soa q15 q31; do
+        run_edge_experiment "layout_${cpu}_${layout}" "${LAYOUT_BINARY}" "${LAYOUT_RESULTS_DIR}" \
+            --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192 --layout=${layout}
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 12: CACHED VS SCRATCHPAD (ALONGSIDE / REPLACING THE L1D)
+# The cached run stages the same windows into heap buffers
+# ======================================================================
+for cpu in minor o3; do
+    run_edge_experiment "spm_${cpu}_cached" "${SPM_BINARY}" "${SPM_RESULTS_DIR}" \
+        --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192
+    for placement in alongside replace; do
+        run_edge_experiment "spm_${cpu}_${placement}" "${SPM_BINARY}" "${SPM_RESULTS_DIR}" \
+            --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192 \
+            --scratchpad=${placement}
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 13: DMA SENSOR INGEST (needs gem5 built with
+# EXTRAS=configs/practice/Project/devices)
+# Ingest into memory vs into the L2, at two sampling rates
+# ======================================================================
+for cpu in minor o3; do
+    for rate in 1000000 4000000; do
+        for port in membus l2bus; do
+            run_edge_experiment "ingest_${cpu}_${port}_${rate}" "${INGEST_BINARY}" \
+                "${INGEST_RESULTS_DIR}" --cpu-type=${cpu} --l2-cache \
+                --samples-per-sensor=8192 --sensor-dma --sensor-dma-port=${port} \
+                --arrival-rate=${rate}
+        done
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 14: CPU-ONLY VS FILTER ACCELERATOR (needs gem5 built with
+# EXTRAS=configs/practice/Project/devices)
+# ======================================================================
+for cpu in minor o3; do
+    run_edge_experiment "accel_${cpu}_cpu" "${ACCEL_BINARY}" "${ACCEL_RESULTS_DIR}" \
+        --cpu-type=${cpu} --l2-cache --samples-per-sensor=8192
+    for throughput in 1 4; do
+        run_edge_experiment "accel_${cpu}_accel${throughput}" "${ACCEL_BINARY}" \
+            "${ACCEL_RESULTS_DIR}" --cpu-type=${cpu} --l2-cache \
+            --samples-per-sensor=8192 --accelerator --accel-throughput=${throughput}
+    done
+done
+
+# ======================================================================
+# EXPERIMENT SET 15: COMPRESSED L2 VS LARGER UNCOMPRESSED L2s
+# ======================================================================
+# 256kB of readings against a 128kB L2: compressed (up to 2x the lines),
+# uncompressed 144kB 9-way (about the same data + tag storage) and
+# uncompressed 256kB (twice the data array)
+for compressor in none bdi cpack fpc; do
+    run_edge_experiment "l2c_minor_128kB_${compressor}" "${SCALING_BINARY}" \
+        "${COMPRESSION_RESULTS_DIR}" --cpu-type=minor --l2-cache --l2-size=128kB \
+        --l2-compressor=${compressor} --samples-per-sensor=2048
+done
+run_edge_experiment "l2c_minor_144kB_9way" "${SCALING_BINARY}" "${COMPRESSION_RESULTS_DIR}" \
+    --cpu-type=minor --l2-cache --l2-size=144kB --l2-assoc=9 --samples-per-sensor=2048
+run_edge_experiment "l2c_minor_256kB" "${SCALING_BINARY}" "${COMPRESSION_RESULTS_DIR}" \
+    --cpu-type=minor --l2-cache --l2-size=256kB --samples-per-sensor=2048
+
+# ======================================================================
+# EXPERIMENT SET 16: PER-PHASE (ROI) STATS
+# One stats dump per pipeline phase; data generation and printf excluded
+# ======================================================================
+for cpu in minor o3; do
+    run_edge_experiment "roi_${cpu}" "${ROI_BINARY}" "${ROI_RESULTS_DIR}" \
+        --cpu-type=${cpu} --l2-cache --roi
+done
+
+# ======================================================================
+# SUMMARY
+# ======================================================================
+echo ""
+echo "======================================================================"
+echo "Experiments Completed!"
+echo "======================================================================"
+echo "  Total experiments: ${total_experiments}"
+echo "  Completed: ${completed_experiments}"
+echo "  Failed: $((total_experiments - completed_experiments))"
+
+# ======================================================================
+# COMBINE RESULTS
+# ======================================================================
+echo ""
+echo "Combining individual results..."
+echo "----------------------------------------------------------------------"
+
+combine_results "${RESULTS_DIR}" "${RESULTS_FILE}"
+combine_results "${STREAMING_RESULTS_DIR}" "${STREAMING_RESULTS_FILE}"
+combine_results "${SCALING_RESULTS_DIR}" "${SCALING_RESULTS_FILE}"
+combine_results "${LLC_RESULTS_DIR}" "${LLC_RESULTS_FILE}"
+combine_results "${MEM_RESULTS_DIR}" "${MEM_RESULTS_FILE}"
+combine_results "${THERMAL_RESULTS_DIR}" "${THERMAL_RESULTS_FILE}"
+combine_results "${PARALLEL_RESULTS_DIR}" "${PARALLEL_RESULTS_FILE}"
+combine_results "${COHERENCE_RESULTS_DIR}" "${COHERENCE_RESULTS_FILE}"
+combine_results "${SIMD_RESULTS_DIR}" "${SIMD_RESULTS_FILE}"
+combine_results "${LAYOUT_RESULTS_DIR}" "${LAYOUT_RESULTS_FILE}"
+combine_results "${SPM_RESULTS_DIR}" "${SPM_RESULTS_FILE}"
+combine_results "${INGEST_RESULTS_DIR}" "${INGEST_RESULTS_FILE}"
+combine_results "${ACCEL_RESULTS_DIR}" "${ACCEL_RESULTS_FILE}"
+combine_results "${COMPRESSION_RESULTS_DIR}" "${COMPRESSION_RESULTS_FILE}"
+combine_results "${ROI_RESULTS_DIR}" "${ROI_RESULTS_FILE}"
+
+echo ""
+echo "To compare throughput per watt:"
+echo "  column -t -s, ${RESULTS_FILE}"
+echo ""
+echo "To compare streaming latency and max sustainable rate:"
+echo "  column -t -s, ${STREAMING_RESULTS_FILE}"
+echo ""
+echo "To see throughput against working set size:"
+echo "  column -t -s, ${SCALING_RESULTS_FILE}"
+echo ""
+echo "To compare L2 sizes with and without an L3 (per-level miss rate/AMAT):"
+echo "  column -t -s, ${LLC_RESULTS_FILE}"
+echo ""
+echo "To compare DRAM bandwidth, latency and power per memory technology:"
+echo "  column -t -s, ${MEM_RESULTS_FILE}"
+echo ""
+echo "To compare temperature rise and leakage growth (trajectories in *_thermal.csv):"
+echo "  column -t -s, ${THERMAL_RESULTS_FILE}"
+echo ""
+echo "To compare host speedup and stat deviation of the parallel runs:"
+echo "  column -t -s, ${PARALLEL_RESULTS_FILE}"
+echo ""
+echo "To compare coherence traffic per protocol and aggregate sharing:"
+echo "  column -t -s, ${COHERENCE_RESULTS_FILE}"
+echo ""
+echo "To compare energy per reading of the scalar, NEON and SVE kernels:"
+echo "  column -t -s, ${SIMD_RESULTS_FILE}"
+echo ""
+echo "To compare L1D misses and energy per reading of each data layout:"
+echo "  column -t -s, ${LAYOUT_RESULTS_FILE}"
+echo ""
+echo "To compare on-chip memory and total energy, cached vs scratchpad:"
+echo "  column -t -s, ${SPM_RESULTS_FILE}"
+echo ""
+echo "To compare ingest bandwidth, DMA latency and window latency per DMA target:"
+echo "  column -t -s, ${INGEST_RESULTS_FILE}"
+echo ""
+echo "To compare latency and CPU + accelerator energy, CPU-only vs offloaded:"
+echo "  column -t -s, ${ACCEL_RESULTS_FILE}"
+echo ""
+echo "To compare compressed and larger uncompressed L2s (ratio, AMAT, storage):"
+echo "  column -t -s, ${COMPRESSION_RESULTS_FILE}"
+echo ""
+echo "To compare IPC, misses and energy per pipeline phase (ROI runs):"
+echo "  column -t -s, ${ROI_RESULTS_FILE}"
+echo ""
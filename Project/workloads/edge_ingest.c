@@ -0,0 +1,186 @@
+/*
+ * Edge Pre-processing Workload (DMA sensor input)
+ *
+ * The streaming pipeline of edge_streaming.c, fed by the SensorDevice
+ * model (devices/sensor_device.cc) instead of readings generated by the
+ * CPU. The device DMAs batches of readings into a ring buffer and then
+ * advances the completion counter in the ring header:
+ *
+ *   ring_base + 0   uint64_t completed (readings written so far)
+ *   ring_base + 64  ring_slots SensorReading slots, reading i in slot
+ *                   i % ring_slots
+ *
+ * For every window the workload polls the counter until the window has
+ * arrived, copies it out of the ring and processes it as edge_streaming
+ * does. The device writes a batch of batch_size readings before it advances
+ * the counter, so a batch may be in flight beyond the completed readings. A
+ * window whose slots were overwritten, or may be overwritten by that batch,
+ * before the copy finished (the device got more than ring_slots readings
+ * ahead) counts as an overrun.
+ * Timestamps are printed as in edge_streaming:
+ *     WINDOW <index> <arrival_ns> <start_ns> <done_ns>
+ * where arrival is the moment the completion was observed.
+ *
+ * edge_power_config.py (--sensor-dma) maps the ring at a fixed virtual
+ * address and passes it as ring_base. Without it (ring_base 0, e.g. a
+ * native run) the CPU generates every window itself.
+ *
+ * Usage: edge_ingest [--sensors=N] [--samples=N] [--seed=N]
+ *                    [window_size] [ring_base] [ring_slots] [batch_size]
+ *        window_size: readings per window (default: 256)
+ *        ring_base:   virtual address of the ring buffer (default: 0)
+ *        ring_slots:  readings held by the ring (default: 4096)
+ *        batch_size:  readings the device writes per DMA (default: 1)
+ */
+
+#include <time.h>
+
+#include "edge_kernels.h"
+
+#define DEFAULT_WINDOW_SIZE 256
+#define DEFAULT_RING_SLOTS 4096
+#define DEFAULT_BATCH_SIZE 1
+#define RING_HEADER_BYTES 64
+
+typedef struct {
+    uint64_t arrival_ns;
+    uint64_t start_ns;
+    uint64_t done_ns;
+} WindowTiming;
+
+static uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ull + (uint64_t)ts.tv_nsec;
+}
+
+// Readings written by the device so far (completion counter)
+static uint64_t ring_completed(const uint64_t *counter) {
+    // Acquire: the readings are read only after the counter covers them
+    return __atomic_load_n(counter, __ATOMIC_ACQUIRE);
+}
+
+int main(int argc, char **argv) {
+    int window_size = DEFAULT_WINDOW_SIZE;
+    unsigned long ring_base = 0;
+    int ring_slots = DEFAULT_RING_SLOTS;
+    int batch_size = DEFAULT_BATCH_SIZE;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        window_size = atoi(argv[arg]);
+    }
+    if (argc > arg + 1) {
+        ring_base = strtoul(argv[arg + 1], NULL, 0);
+    }
+    if (argc > arg + 2) {
+        ring_slots = atoi(argv[arg + 2]);
+    }
+    if (argc > arg + 3) {
+        batch_size = atoi(argv[arg + 3]);
+    }
+    if (window_size < 1 || window_size > edge_size.total_samples ||
+        window_size > ring_slots) {
+        printf("ERROR: window_size must be 1..%d and fit the %d-slot ring\n",
+               edge_size.total_samples, ring_slots);
+        return 1;
+    }
+    if (batch_size < 1 || batch_size > ring_slots) {
+        printf("ERROR: batch_size must be 1..%d\n", ring_slots);
+        return 1;
+    }
+
+    int num_windows = (edge_size.total_samples + window_size - 1) / window_size;
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (DMA sensor input)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    printf("  Readings per window: %d\n", window_size);
+    printf("  Windows: %d\n", num_windows);
+    if (ring_base) {
+        printf("  Ring buffer: %d readings at 0x%lx\n", ring_slots, ring_base);
+        printf("  DMA batch: %d readings\n", batch_size);
+    } else {
+        printf("  Ring buffer: none (readings generated by the CPU)\n");
+    }
+    printf("========================================\n\n");
+
+    SensorReading *readings = (SensorReading *)malloc(
+        edge_size.total_samples * sizeof(SensorReading));
+    WindowTiming *timing = (WindowTiming *)malloc(
+        num_windows * sizeof(WindowTiming));
+
+    if (!readings || !timing) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+
+    const uint64_t *counter = (const uint64_t *)ring_base;
+    const SensorReading *slots =
+        (const SensorReading *)(ring_base + RING_HEADER_BYTES);
+    AggregateStats stats = {1e9, -1e9, 0.0f, 0, 0};
+    AggregateStats window_stats;
+    uint32_t seed = edge_size.seed;
+    int overruns = 0;
+
+    for (int w = 0; w < num_windows; w++) {
+        int begin = w * window_size;
+        int end = (begin + window_size < edge_size.total_samples) ?
+                  begin + window_size : edge_size.total_samples;
+
+        if (ring_base) {
+            // Wait for the completion covering the window's last reading
+            while (ring_completed(counter) < (uint64_t)end) {
+                // Poll the completion counter
+            }
+            timing[w].arrival_ns = now_ns();
+            timing[w].start_ns = timing[w].arrival_ns;
+
+            for (int i = begin; i < end; i++) {
+                readings[i] = slots[i % ring_slots];
+            }
+            // The batch after the completed readings may already be
+            // overwriting the oldest slots of the window
+            if (ring_completed(counter) + batch_size >
+                (uint64_t)begin + ring_slots) {
+                overruns++;
+            }
+        } else {
+            timing[w].arrival_ns = now_ns();
+            timing[w].start_ns = timing[w].arrival_ns;
+            generate_sensor_data_range(readings, begin, end, &seed);
+        }
+
+        // Only readings that have arrived can be used by the filter
+        apply_moving_average_filter_range(readings, end, begin, end);
+        detect_anomalies_range(readings, begin, end);
+        compute_aggregate_stats_range(readings, begin, end, &window_stats);
+        merge_aggregate_stats(&stats, &window_stats);
+        normalize_data_range(readings, begin, end,
+                             stats.min_value, stats.max_value);
+
+        timing[w].done_ns = now_ns();
+    }
+
+    // Report timestamps after the run so printing does not perturb latency
+    for (int w = 0; w < num_windows; w++) {
+        printf("WINDOW %d %llu %llu %llu\n", w,
+               (unsigned long long)timing[w].arrival_ns,
+               (unsigned long long)timing[w].start_ns,
+               (unsigned long long)timing[w].done_ns);
+    }
+    printf("RING_OVERRUNS %d\n", overruns);
+
+    print_aggregate_report(&stats);
+    printf("Edge preprocessing completed successfully!\n");
+
+    free(timing);
+    free(readings);
+    return 0;
+}
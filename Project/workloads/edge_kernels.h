@@ -0,0 +1,269 @@
+/*
+ * Edge Pre-processing Kernels
+ *
+ * Shared data structures and pipeline stages used by every variant of the
+ * edge pre-processing workload (single-threaded, pthreads and streaming).
+ *
+ * Every stage takes a [begin, end) range over the full readings array so
+ * that a multithreaded variant can partition the work without changing the
+ * result: the moving-average window still reads neighbours across partition
+ * boundaries (raw values are read-only during filtering).
+ *
+ * The problem size (sensors, samples per sensor) and the PRNG seed are
+ * runtime parameters in `edge_size`, set from the command line by
+ * parse_edge_options() so that scaling studies need no recompilation:
+ *   --sensors=N   number of sensors            (default: 8)
+ *   --samples=N   samples per sensor           (default: 1024)
+ *   --seed=N      PRNG seed for the readings   (default: 12345)
+ */
+
+#ifndef EDGE_KERNELS_H
+#define EDGE_KERNELS_H
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <math.h>
+#include <getopt.h>
+
+#define DEFAULT_NUM_SENSORS 8
+#define DEFAULT_SAMPLES_PER_SENSOR 1024
+#define DEFAULT_SENSOR_SEED 12345
+#define MAX_SENSORS 256
+#define FILTER_WINDOW 5
+#define THRESHOLD 100
+
+// Sensor data structure
+typedef struct {
+    int32_t sensor_id;
+    float raw_value;
+    float filtered_value;
+    uint8_t anomaly_flag;
+} SensorReading;
+
+// Global statistics
+typedef struct {
+    float min_value;
+    float max_value;
+    float sum;
+    uint32_t anomaly_count;
+    uint32_t total_samples;
+} AggregateStats;
+
+// Problem size and seed of the current run
+typedef struct {
+    int num_sensors;
+    int samples_per_sensor;
+    int total_samples;
+    uint32_t seed;
+} EdgeSize;
+
+static EdgeSize edge_size = {
+    DEFAULT_NUM_SENSORS,
+    DEFAULT_SAMPLES_PER_SENSOR,
+    DEFAULT_NUM_SENSORS * DEFAULT_SAMPLES_PER_SENSOR,
+    DEFAULT_SENSOR_SEED,
+};
+
+// Parse --sensors/--samples/--seed into edge_size.
+// Returns the index of the first positional argument, or -1 on error.
+static inline int parse_edge_options(int argc, char **argv) {
+    static const struct option options[] = {
+        {"sensors", required_argument, NULL, 'n'},
+        {"samples", required_argument, NULL, 's'},
+        {"seed",    required_argument, NULL, 'r'},
+        {NULL, 0, NULL, 0},
+    };
+    int c;
+
+    while ((c = getopt_long(argc, argv, "", options, NULL)) != -1) {
+        switch (c) {
+          case 'n': edge_size.num_sensors = atoi(optarg); break;
+          case 's': edge_size.samples_per_sensor = atoi(optarg); break;
+          case 'r': edge_size.seed = (uint32_t)strtoul(optarg, NULL, 0); break;
+          default: return -1;
+        }
+    }
+
+    if (edge_size.num_sensors < 1 || edge_size.num_sensors > MAX_SENSORS ||
+        edge_size.samples_per_sensor < 1) {
+        printf("ERROR: --sensors must be 1..%d and --samples at least 1\n",
+               MAX_SENSORS);
+        return -1;
+    }
+    edge_size.total_samples = edge_size.num_sensors * edge_size.samples_per_sensor;
+    return optind;
+}
+
+// Print the problem size part of the configuration banner
+static inline void print_edge_size(void) {
+    printf("  Sensors: %d\n", edge_size.num_sensors);
+    printf("  Samples per sensor: %d\n", edge_size.samples_per_sensor);
+    printf("  Total samples: %d\n", edge_size.total_samples);
+    printf("  Seed: %u\n", edge_size.seed);
+    printf("  Working set: %zu bytes\n",
+           (size_t)edge_size.total_samples * sizeof(SensorReading));
+}
+
+// Next pseudo-random raw value (-50 to 149). The PRNG state is carried in
+// *seed so that a batch can be produced in consecutive chunks.
+static inline float next_raw_value(uint32_t *seed) {
+    // Simple PRNG for reproducible results
+    *seed = (*seed * 1103515245 + 12345) & 0x7fffffff;
+    return (float)(*seed % 200) - 50.0f;  // Range: -50 to 150
+}
+
+// Generate readings[begin, end) with pseudo-random values
+static inline void generate_sensor_data_range(SensorReading *readings,
+                                              int begin, int end,
+                                              uint32_t *seed) {
+    for (int i = begin; i < end; i++) {
+        readings[i].sensor_id = i / edge_size.samples_per_sensor;
+        readings[i].raw_value = next_raw_value(seed);
+        readings[i].filtered_value = 0.0f;
+        readings[i].anomaly_flag = 0;
+    }
+}
+
+// Initialize sensor data with pseudo-random values
+static inline void generate_sensor_data(SensorReading *readings) {
+    uint32_t seed = edge_size.seed;
+    generate_sensor_data_range(readings, 0, edge_size.total_samples, &seed);
+}
+
+// Moving average filter over readings[begin, end)
+static inline void apply_moving_average_filter_range(SensorReading *readings,
+                                                     int num_readings,
+                                                     int begin, int end) {
+    for (int i = begin; i < end; i++) {
+        float sum = 0.0f;
+        int count = 0;
+
+        // Compute average over window
+        for (int j = -FILTER_WINDOW/2; j <= FILTER_WINDOW/2; j++) {
+            int idx = i + j;
+            if (idx >= 0 && idx < num_readings) {
+                sum += readings[idx].raw_value;
+                count++;
+            }
+        }
+
+        readings[i].filtered_value = sum / count;
+    }
+}
+
+// Detect anomalies (threshold-based) over readings[begin, end)
+static inline void detect_anomalies_range(SensorReading *readings,
+                                          int begin, int end) {
+    for (int i = begin; i < end; i++) {
+        float deviation = fabs(readings[i].filtered_value - readings[i].raw_value);
+
+        if (deviation > THRESHOLD || readings[i].filtered_value > 140.0f) {
+            readings[i].anomaly_flag = 1;
+        }
+    }
+}
+
+// Normalize readings[begin, end) for transmission
+static inline void normalize_data_range(SensorReading *readings, int begin, int end,
+                                        float min_val, float max_val) {
+    float range = max_val - min_val;
+
+    if (range < 0.001f) return;  // Avoid division by zero
+
+    for (int i = begin; i < end; i++) {
+        readings[i].filtered_value =
+            (readings[i].filtered_value - min_val) / range;
+    }
+}
+
+// Aggregate statistics over readings[begin, end)
+static inline void compute_aggregate_stats_range(SensorReading *readings,
+                                                 int begin, int end,
+                                                 AggregateStats *stats) {
+    stats->min_value = 1e9;
+    stats->max_value = -1e9;
+    stats->sum = 0.0f;
+    stats->anomaly_count = 0;
+    stats->total_samples = end - begin;
+
+    for (int i = begin; i < end; i++) {
+        float val = readings[i].filtered_value;
+
+        if (val < stats->min_value) stats->min_value = val;
+        if (val > stats->max_value) stats->max_value = val;
+
+        stats->sum += val;
+        stats->anomaly_count += readings[i].anomaly_flag;
+    }
+}
+
+// Fold partial statistics into an accumulated total
+static inline void merge_aggregate_stats(AggregateStats *total,
+                                         const AggregateStats *partial) {
+    if (partial->min_value < total->min_value) total->min_value = partial->min_value;
+    if (partial->max_value > total->max_value) total->max_value = partial->max_value;
+    total->sum += partial->sum;
+    total->anomaly_count += partial->anomaly_count;
+    total->total_samples += partial->total_samples;
+}
+
+// Whole-array wrappers (single-threaded pipeline)
+static inline void apply_moving_average_filter(SensorReading *readings, int num_readings) {
+    apply_moving_average_filter_range(readings, num_readings, 0, num_readings);
+}
+
+static inline void detect_anomalies(SensorReading *readings, int num_readings) {
+    detect_anomalies_range(readings, 0, num_readings);
+}
+
+static inline void normalize_data(SensorReading *readings, int num_readings,
+                                  float min_val, float max_val) {
+    normalize_data_range(readings, 0, num_readings, min_val, max_val);
+}
+
+static inline void compute_aggregate_stats(SensorReading *readings, int num_readings,
+                                           AggregateStats *stats) {
+    compute_aggregate_stats_range(readings, 0, num_readings, stats);
+}
+
+// Per-sensor statistics: average filtered value of every sensor
+static inline void compute_per_sensor_stats(SensorReading *readings, int num_readings,
+                                            float sensor_avg[MAX_SENSORS]) {
+    int samples = edge_size.samples_per_sensor;
+
+    (void)num_readings;
+    for (int sensor = 0; sensor < edge_size.num_sensors; sensor++) {
+        float sensor_sum = 0.0f;
+        int sensor_samples = 0;
+
+        for (int i = sensor * samples; i < (sensor + 1) * samples; i++) {
+            sensor_sum += readings[i].filtered_value;
+            sensor_samples++;
+        }
+
+        sensor_avg[sensor] = sensor_sum / sensor_samples;
+    }
+}
+
+static inline void print_per_sensor_stats(const float sensor_avg[MAX_SENSORS]) {
+    for (int sensor = 0; sensor < edge_size.num_sensors; sensor++) {
+        printf("Sensor %d: Avg = %.4f\n", sensor, sensor_avg[sensor]);
+    }
+}
+
+// Print the final aggregate report
+static inline void print_aggregate_report(const AggregateStats *stats) {
+    printf("\n========================================\n");
+    printf("Aggregate Statistics:\n");
+    printf("========================================\n");
+    printf("  Min value: %.4f\n", stats->min_value);
+    printf("  Max value: %.4f\n", stats->max_value);
+    printf("  Average: %.4f\n", stats->sum / stats->total_samples);
+    printf("  Anomalies detected: %u (%.2f%%)\n",
+           stats->anomaly_count,
+           100.0f * stats->anomaly_count / stats->total_samples);
+    printf("========================================\n");
+}
+
+#endif // EDGE_KERNELS_H
@@ -0,0 +1,280 @@
+/*
+ * Struct-of-Arrays and Fixed-Point Edge Pre-processing Kernels
+ *
+ * The pipeline of edge_kernels.h on two other data representations:
+ *
+ *   soa  One array per SensorReading field (float). The filter streams
+ *        only the raw values, normalization only the filtered values, so
+ *        no cache line carries fields a stage does not use.
+ *   q15  SoA with int16 Q15 raw/filtered values
+ *   q31  SoA with int32 Q31 raw/filtered values
+ *
+ * Fixed-point readings are scaled by 1/256 (FIXED_RAW_SHIFT) so that the
+ * raw range -50..149 fits [-1, 1): a raw value r is stored as
+ * r * 2^(frac_bits - 8). Normalized values are plain Q15/Q31 fractions
+ * (1.0 saturates to the largest fraction). All arithmetic is integer:
+ * 64-bit window sums and divisions rounded to nearest.
+ *
+ * The soa kernels perform the same float operations in the same order as
+ * the AoS kernels, so their results are bit-identical; the fixed-point
+ * kernels differ by their rounding (see edge_preprocessing_layout.c for the
+ * equivalence check).
+ */
+
+#ifndef EDGE_LAYOUT_H
+#define EDGE_LAYOUT_H
+
+#include "edge_kernels.h"
+
+// Readings are stored as raw / 2^FIXED_RAW_SHIFT in the fixed-point formats
+#define FIXED_RAW_SHIFT 8
+
+// Struct-of-arrays float readings
+typedef struct {
+    int32_t *sensor_id;
+    float *raw_value;
+    float *filtered_value;
+    uint8_t *anomaly_flag;
+} SensorArrays;
+
+// Allocate the arrays of num_readings readings; returns 0 on failure
+static inline int alloc_sensor_arrays(SensorArrays *a, int num_readings) {
+    a->sensor_id = (int32_t *)malloc(num_readings * sizeof(int32_t));
+    a->raw_value = (float *)malloc(num_readings * sizeof(float));
+    a->filtered_value = (float *)malloc(num_readings * sizeof(float));
+    a->anomaly_flag = (uint8_t *)malloc(num_readings * sizeof(uint8_t));
+    return a->sensor_id && a->raw_value && a->filtered_value && a->anomaly_flag;
+}
+
+static inline void free_sensor_arrays(SensorArrays *a) {
+    free(a->sensor_id);
+    free(a->raw_value);
+    free(a->filtered_value);
+    free(a->anomaly_flag);
+}
+
+static inline void generate_sensor_arrays(SensorArrays *a) {
+    uint32_t seed = edge_size.seed;
+
+    for (int i = 0; i < edge_size.total_samples; i++) {
+        a->sensor_id[i] = i / edge_size.samples_per_sensor;
+        a->raw_value[i] = next_raw_value(&seed);
+        a->filtered_value[i] = 0.0f;
+        a->anomaly_flag[i] = 0;
+    }
+}
+
+static inline void filter_arrays(SensorArrays *a, int num_readings) {
+    for (int i = 0; i < num_readings; i++) {
+        float sum = 0.0f;
+        int count = 0;
+
+        for (int j = -FILTER_WINDOW/2; j <= FILTER_WINDOW/2; j++) {
+            int idx = i + j;
+            if (idx >= 0 && idx < num_readings) {
+                sum += a->raw_value[idx];
+                count++;
+            }
+        }
+
+        a->filtered_value[i] = sum / count;
+    }
+}
+
+static inline void detect_anomalies_arrays(SensorArrays *a, int num_readings) {
+    for (int i = 0; i < num_readings; i++) {
+        float deviation = fabs(a->filtered_value[i] - a->raw_value[i]);
+
+        if (deviation > THRESHOLD || a->filtered_value[i] > 140.0f) {
+            a->anomaly_flag[i] = 1;
+        }
+    }
+}
+
+static inline void aggregate_arrays(const SensorArrays *a, int num_readings,
+                                    AggregateStats *stats) {
+    stats->min_value = 1e9;
+    stats->max_value = -1e9;
+    stats->sum = 0.0f;
+    stats->anomaly_count = 0;
+    stats->total_samples = num_readings;
+
+    for (int i = 0; i < num_readings; i++) {
+        float val = a->filtered_value[i];
+
+        if (val < stats->min_value) stats->min_value = val;
+        if (val > stats->max_value) stats->max_value = val;
+
+        stats->sum += val;
+        stats->anomaly_count += a->anomaly_flag[i];
+    }
+}
+
+static inline void normalize_arrays(SensorArrays *a, int num_readings,
+                                    float min_val, float max_val) {
+    float range = max_val - min_val;
+
+    if (range < 0.001f) return;  // Avoid division by zero
+
+    for (int i = 0; i < num_readings; i++) {
+        a->filtered_value[i] = (a->filtered_value[i] - min_val) / range;
+    }
+}
+
+static inline void per_sensor_stats_arrays(const SensorArrays *a,
+                                           float sensor_avg[MAX_SENSORS]) {
+    int samples = edge_size.samples_per_sensor;
+
+    for (int sensor = 0; sensor < edge_size.num_sensors; sensor++) {
+        float sensor_sum = 0.0f;
+
+        for (int i = sensor * samples; i < (sensor + 1) * samples; i++) {
+            sensor_sum += a->filtered_value[i];
+        }
+
+        sensor_avg[sensor] = sensor_sum / samples;
+    }
+}
+
+// Signed division rounded to nearest (ties away from zero)
+static inline int64_t round_div(int64_t num, int64_t den) {
+    return (num >= 0 ? num + den / 2 : num - den / 2) / den;
+}
+
+/*
+ * Fixed-point kernels for one format: <q>_arrays with elem_t raw/filtered
+ * values and frac_bits fractional bits. Window sums, aggregates and the
+ * normalization run on int64_t.
+ */
+#define DEFINE_FIXED_KERNELS(q, elem_t, frac_bits)                             \
+                                                                               \
+typedef struct {                                                               \
+    int32_t *sensor_id;                                                        \
+    elem_t *raw_value;                                                         \
+    elem_t *filtered_value;                                                    \
+    uint8_t *anomaly_flag;                                                     \
+} SensorArrays_##q;                                                            \
+                                                                               \
+/* Scale of a raw value and of 1.0 */                                          \
+static const int64_t q##_raw_scale = (int64_t)1 << ((frac_bits) - FIXED_RAW_SHIFT); \
+static const int64_t q##_one = (int64_t)1 << (frac_bits);                      \
+                                                                               \
+static inline int alloc_arrays_##q(SensorArrays_##q *a, int num_readings) {    \
+    a->sensor_id = (int32_t *)malloc(num_readings * sizeof(int32_t));          \
+    a->raw_value = (elem_t *)malloc(num_readings * sizeof(elem_t));            \
+    a->filtered_value = (elem_t *)malloc(num_readings * sizeof(elem_t));       \
+    a->anomaly_flag = (uint8_t *)malloc(num_readings * sizeof(uint8_t));       \
+    return a->sensor_id && a->raw_value && a->filtered_value &&                \
+           a->anomaly_flag;                                                    \
+}                                                                              \
+                                                                               \
+static inline void free_arrays_##q(SensorArrays_##q *a) {                      \
+    free(a->sensor_id);                                                        \
+    free(a->raw_value);                                                        \
+    free(a->filtered_value);                                                   \
+    free(a->anomaly_flag);                                                     \
+}                                                                              \
+                                                                               \
+static inline void generate_arrays_##q(SensorArrays_##q *a) {                  \
+    uint32_t seed = edge_size.seed;                                            \
+                                                                               \
+    for (int i = 0; i < edge_size.total_samples; i++) {                        \
+        a->sensor_id[i] = i / edge_size.samples_per_sensor;                    \
+        a->raw_value[i] = (elem_t)((int64_t)next_raw_value(&seed) *            \
+                                   q##_raw_scale);                             \
+        a->filtered_value[i] = 0;                                              \
+        a->anomaly_flag[i] = 0;                                                \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+static inline void filter_arrays_##q(SensorArrays_##q *a, int num_readings) {  \
+    for (int i = 0; i < num_readings; i++) {                                   \
+        int64_t sum = 0;                                                       \
+        int count = 0;                                                         \
+                                                                               \
+        for (int j = -FILTER_WINDOW/2; j <= FILTER_WINDOW/2; j++) {            \
+            int idx = i + j;                                                   \
+            if (idx >= 0 && idx < num_readings) {                              \
+                sum += a->raw_value[idx];                                      \
+                count++;                                                       \
+            }                                                                  \
+        }                                                                      \
+                                                                               \
+        a->filtered_value[i] = (elem_t)round_div(sum, count);                  \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+static inline void detect_anomalies_arrays_##q(SensorArrays_##q *a,            \
+                                               int num_readings) {             \
+    const int64_t threshold = THRESHOLD * q##_raw_scale;                       \
+    const int64_t limit = 140 * q##_raw_scale;                                 \
+                                                                               \
+    for (int i = 0; i < num_readings; i++) {                                   \
+        int64_t deviation = (int64_t)a->filtered_value[i] - a->raw_value[i];   \
+                                                                               \
+        if (deviation < 0) deviation = -deviation;                             \
+        if (deviation > threshold || a->filtered_value[i] > limit) {           \
+            a->anomaly_flag[i] = 1;                                            \
+        }                                                                      \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+/* Aggregates in fixed point; min/max returned for the normalization */        \
+static inline void aggregate_arrays_##q(const SensorArrays_##q *a,             \
+                                        int num_readings, AggregateStats *stats, \
+                                        int64_t *min_fixed, int64_t *max_fixed) { \
+    int64_t min_val = INT64_MAX, max_val = INT64_MIN, sum = 0;                 \
+    uint32_t anomalies = 0;                                                    \
+                                                                               \
+    for (int i = 0; i < num_readings; i++) {                                   \
+        int64_t val = a->filtered_value[i];                                    \
+                                                                               \
+        if (val < min_val) min_val = val;                                      \
+        if (val > max_val) max_val = val;                                      \
+                                                                               \
+        sum += val;                                                            \
+        anomalies += a->anomaly_flag[i];                                       \
+    }                                                                          \
+                                                                               \
+    *min_fixed = min_val;                                                      \
+    *max_fixed = max_val;                                                      \
+    stats->min_value = (float)min_val / q##_raw_scale;                         \
+    stats->max_value = (float)max_val / q##_raw_scale;                         \
+    stats->sum = (float)((double)sum / q##_raw_scale);                         \
+    stats->anomaly_count = anomalies;                                          \
+    stats->total_samples = num_readings;                                       \
+}                                                                              \
+                                                                               \
+static inline void normalize_arrays_##q(SensorArrays_##q *a, int num_readings, \
+                                        int64_t min_val, int64_t max_val) {    \
+    int64_t range = max_val - min_val;                                         \
+                                                                               \
+    if (range < 1) return;  /* Avoid division by zero */                       \
+                                                                               \
+    for (int i = 0; i < num_readings; i++) {                                   \
+        int64_t val = round_div((a->filtered_value[i] - min_val) << (frac_bits), \
+                                range);                                        \
+                                                                               \
+        a->filtered_value[i] = (elem_t)(val < q##_one ? val : q##_one - 1);    \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+static inline void per_sensor_stats_arrays_##q(const SensorArrays_##q *a,      \
+                                               float sensor_avg[MAX_SENSORS]) { \
+    int samples = edge_size.samples_per_sensor;                                \
+                                                                               \
+    for (int sensor = 0; sensor < edge_size.num_sensors; sensor++) {           \
+        int64_t sensor_sum = 0;                                                \
+                                                                               \
+        for (int i = sensor * samples; i < (sensor + 1) * samples; i++) {      \
+            sensor_sum += a->filtered_value[i];                                \
+        }                                                                      \
+                                                                               \
+        sensor_avg[sensor] = (float)((double)sensor_sum / samples / q##_one);  \
+    }                                                                          \
+}
+
+DEFINE_FIXED_KERNELS(q15, int16_t, 15)
+DEFINE_FIXED_KERNELS(q31, int32_t, 31)
+
+#endif // EDGE_LAYOUT_H
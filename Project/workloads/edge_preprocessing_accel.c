@@ -0,0 +1,153 @@
+/*
+ * Edge Pre-processing Workload (filter accelerator offload)
+ *
+ * The pipeline of edge_preprocessing.c (same ROI markers) with the moving
+ * average filter and the anomaly detection either on the CPU ("cpu") or
+ * offloaded to the FilterAccelerator model (devices/filter_accelerator.cc,
+ * "accel"). The offload is one fused job: the driver programs the
+ * accelerator's registers with the reading range, starts it and polls its
+ * status until the results have been written back by DMA. In accel mode
+ * the anomaly detection phase is therefore empty (it ran in ROI_FILTER).
+ *
+ * The accelerator works on physical addresses, so the readings live in a
+ * DMA buffer that edge_power_config.py (--accelerator) maps at a fixed
+ * virtual address, next to the uncacheable register window; both
+ * addresses are passed as arguments. The buffer is cacheable: the DMA
+ * reads and writes are coherent with the CPU caches.
+ *
+ * Usage: edge_preprocessing_accel [--sensors=N] [--samples=N] [--seed=N]
+ *                                 [cpu|accel] [accel_base] [buffer_base]
+ */
+
+#include <string.h>
+
+#include "edge_kernels.h"
+#include "edge_roi.h"
+
+// Registers (64-bit words) of devices/filter_accelerator.hh
+#define ACCEL_CTRL   0
+#define ACCEL_STATUS 1
+#define ACCEL_COUNT  2
+#define ACCEL_BEGIN  3
+#define ACCEL_END    4
+
+#define ACCEL_CTRL_START  0x1
+#define ACCEL_CTRL_DETECT 0x2
+#define ACCEL_STATUS_DONE 2
+
+// Filter and flag anomalies of readings [begin, end) on the accelerator
+static void accel_filter_detect(volatile uint64_t *regs, int num_readings,
+                                int begin, int end) {
+    regs[ACCEL_COUNT] = num_readings;
+    regs[ACCEL_BEGIN] = begin;
+    regs[ACCEL_END] = end;
+    // The readings must be visible before the job starts
+    __sync_synchronize();
+    regs[ACCEL_CTRL] = ACCEL_CTRL_START | ACCEL_CTRL_DETECT;
+    while (regs[ACCEL_STATUS] != ACCEL_STATUS_DONE) {
+        // Poll the status register
+    }
+    __sync_synchronize();
+}
+
+int main(int argc, char **argv) {
+    int offload = 0;
+    unsigned long accel_base = 0;
+    unsigned long buffer_base = 0;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        if (strcmp(argv[arg], "accel") == 0) {
+            offload = 1;
+        } else if (strcmp(argv[arg], "cpu") != 0) {
+            printf("ERROR: mode must be cpu or accel\n");
+            return 1;
+        }
+    }
+    if (argc > arg + 1) {
+        accel_base = strtoul(argv[arg + 1], NULL, 0);
+    }
+    if (argc > arg + 2) {
+        buffer_base = strtoul(argv[arg + 2], NULL, 0);
+    }
+    if (offload && (!accel_base || !buffer_base)) {
+        printf("ERROR: accel mode needs accel_base and buffer_base "
+               "(edge_power_config.py --accelerator)\n");
+        return 1;
+    }
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (accelerator)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    if (offload) {
+        printf("  Filter/detect: accelerator at 0x%lx, buffer at 0x%lx\n",
+               accel_base, buffer_base);
+    } else {
+        printf("  Filter/detect: cpu\n");
+    }
+    printf("========================================\n\n");
+
+    SensorReading *readings = offload ? (SensorReading *)buffer_base :
+        (SensorReading *)malloc(edge_size.total_samples * sizeof(SensorReading));
+
+    if (!readings) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+
+    printf("Step 1: Generating sensor data...\n");
+    generate_sensor_data(readings);
+
+    if (offload) {
+        printf("Step 2-3: Filtering and detecting anomalies (accelerator)...\n");
+        ROI_BEGIN(ROI_FILTER);
+        accel_filter_detect((volatile uint64_t *)accel_base,
+                            edge_size.total_samples, 0, edge_size.total_samples);
+        ROI_END(ROI_FILTER);
+        ROI_BEGIN(ROI_ANOMALY_DETECTION);
+        ROI_END(ROI_ANOMALY_DETECTION);
+    } else {
+        printf("Step 2: Applying moving average filter...\n");
+        ROI_BEGIN(ROI_FILTER);
+        apply_moving_average_filter(readings, edge_size.total_samples);
+        ROI_END(ROI_FILTER);
+
+        printf("Step 3: Detecting anomalies...\n");
+        ROI_BEGIN(ROI_ANOMALY_DETECTION);
+        detect_anomalies(readings, edge_size.total_samples);
+        ROI_END(ROI_ANOMALY_DETECTION);
+    }
+
+    printf("Step 4: Computing aggregate statistics...\n");
+    AggregateStats stats;
+    ROI_BEGIN(ROI_AGGREGATE);
+    compute_aggregate_stats(readings, edge_size.total_samples, &stats);
+    ROI_END(ROI_AGGREGATE);
+
+    printf("Step 5: Normalizing data...\n");
+    ROI_BEGIN(ROI_NORMALIZE);
+    normalize_data(readings, edge_size.total_samples,
+                   stats.min_value, stats.max_value);
+    ROI_END(ROI_NORMALIZE);
+
+    printf("Step 6: Computing per-sensor statistics...\n");
+    float sensor_avg[MAX_SENSORS];
+    ROI_BEGIN(ROI_PER_SENSOR_STATS);
+    compute_per_sensor_stats(readings, edge_size.total_samples, sensor_avg);
+    ROI_END(ROI_PER_SENSOR_STATS);
+    print_per_sensor_stats(sensor_avg);
+
+    print_aggregate_report(&stats);
+    printf("Edge preprocessing completed successfully!\n");
+
+    if (!offload) {
+        free(readings);
+    }
+    return 0;
+}
@@ -0,0 +1,268 @@
+/*
+ * Edge Pre-processing Workload: Data Layout and Number Format Variants
+ *
+ * The pipeline of edge_preprocessing.c (filter, anomaly detection,
+ * aggregate, normalize, per-sensor stats; same ROI markers) on one of four
+ * representations of the readings (edge_layout.h):
+ *
+ *   aos  array of SensorReading structs, float (edge_preprocessing.c)
+ *   soa  struct of arrays, float
+ *   q15  struct of arrays, int16 Q15
+ *   q31  struct of arrays, int32 Q31
+ *
+ * With "check" the float AoS pipeline is run afterwards on the same input
+ * (outside the ROI markers) and every reading is compared with it: the
+ * anomaly flags must match exactly and the normalized values within the
+ * format's tolerance. The program exits with status 2 if the check fails.
+ *
+ * Usage: edge_preprocessing_layout [--sensors=N] [--samples=N] [--seed=N]
+ *                                  [aos|soa|q15|q31] [check]
+ */
+
+#include <string.h>
+
+#include "edge_kernels.h"
+#include "edge_layout.h"
+#include "edge_roi.h"
+
+typedef enum {
+    LAYOUT_AOS,
+    LAYOUT_SOA,
+    LAYOUT_Q15,
+    LAYOUT_Q31,
+} EdgeLayout;
+
+static const char *const layout_names[] = {"aos", "soa", "q15", "q31"};
+
+// Bytes per reading of every layout (sensor id, raw, filtered, flag)
+static const size_t layout_bytes[] = {
+    sizeof(SensorReading),
+    sizeof(int32_t) + 2 * sizeof(float) + sizeof(uint8_t),
+    sizeof(int32_t) + 2 * sizeof(int16_t) + sizeof(uint8_t),
+    sizeof(int32_t) + 2 * sizeof(int32_t) + sizeof(uint8_t),
+};
+
+// Largest normalized-value difference accepted against the float pipeline.
+// Fixed point adds the filter rounding (one raw LSB) relative to the range.
+static const float layout_tolerance[] = {0.0f, 0.0f, 1.0f / 8192, 1e-5f};
+static const float layout_raw_lsb[] = {0.0f, 0.0f, 1.0f / 128, 1.0f / 8388608};
+
+static EdgeLayout layout = LAYOUT_AOS;
+static SensorReading *readings;
+static SensorArrays arrays;
+static SensorArrays_q15 arrays_q15;
+static SensorArrays_q31 arrays_q31;
+// The normalization leaves a constant signal unscaled (raw units)
+static int normalized = 1;
+
+static int alloc_layout(int n) {
+    switch (layout) {
+      case LAYOUT_SOA: return alloc_sensor_arrays(&arrays, n);
+      case LAYOUT_Q15: return alloc_arrays_q15(&arrays_q15, n);
+      case LAYOUT_Q31: return alloc_arrays_q31(&arrays_q31, n);
+      default:
+        readings = (SensorReading *)malloc(n * sizeof(SensorReading));
+        return readings != NULL;
+    }
+}
+
+static void free_layout(void) {
+    switch (layout) {
+      case LAYOUT_SOA: free_sensor_arrays(&arrays); break;
+      case LAYOUT_Q15: free_arrays_q15(&arrays_q15); break;
+      case LAYOUT_Q31: free_arrays_q31(&arrays_q31); break;
+      default: free(readings); break;
+    }
+}
+
+// Run the pipeline on the selected layout
+static void run_pipeline(AggregateStats *stats, float sensor_avg[MAX_SENSORS]) {
+    int n = edge_size.total_samples;
+    int64_t min_fixed = 0, max_fixed = 0;
+
+    printf("Step 1: Generating sensor data...\n");
+    switch (layout) {
+      case LAYOUT_SOA: generate_sensor_arrays(&arrays); break;
+      case LAYOUT_Q15: generate_arrays_q15(&arrays_q15); break;
+      case LAYOUT_Q31: generate_arrays_q31(&arrays_q31); break;
+      default: generate_sensor_data(readings); break;
+    }
+
+    printf("Step 2: Applying moving average filter...\n");
+    ROI_BEGIN(ROI_FILTER);
+    switch (layout) {
+      case LAYOUT_SOA: filter_arrays(&arrays, n); break;
+      case LAYOUT_Q15: filter_arrays_q15(&arrays_q15, n); break;
+      case LAYOUT_Q31: filter_arrays_q31(&arrays_q31, n); break;
+      default: apply_moving_average_filter(readings, n); break;
+    }
+    ROI_END(ROI_FILTER);
+
+    printf("Step 3: Detecting anomalies...\n");
+    ROI_BEGIN(ROI_ANOMALY_DETECTION);
+    switch (layout) {
+      case LAYOUT_SOA: detect_anomalies_arrays(&arrays, n); break;
+      case LAYOUT_Q15: detect_anomalies_arrays_q15(&arrays_q15, n); break;
+      case LAYOUT_Q31: detect_anomalies_arrays_q31(&arrays_q31, n); break;
+      default: detect_anomalies(readings, n); break;
+    }
+    ROI_END(ROI_ANOMALY_DETECTION);
+
+    printf("Step 4: Computing aggregate statistics...\n");
+    ROI_BEGIN(ROI_AGGREGATE);
+    switch (layout) {
+      case LAYOUT_SOA: aggregate_arrays(&arrays, n, stats); break;
+      case LAYOUT_Q15:
+        aggregate_arrays_q15(&arrays_q15, n, stats, &min_fixed, &max_fixed);
+        break;
+      case LAYOUT_Q31:
+        aggregate_arrays_q31(&arrays_q31, n, stats, &min_fixed, &max_fixed);
+        break;
+      default: compute_aggregate_stats(readings, n, stats); break;
+    }
+    ROI_END(ROI_AGGREGATE);
+
+    printf("Step 5: Normalizing data...\n");
+    ROI_BEGIN(ROI_NORMALIZE);
+    switch (layout) {
+      case LAYOUT_SOA:
+        normalize_arrays(&arrays, n, stats->min_value, stats->max_value);
+        break;
+      case LAYOUT_Q15:
+        normalize_arrays_q15(&arrays_q15, n, min_fixed, max_fixed);
+        break;
+      case LAYOUT_Q31:
+        normalize_arrays_q31(&arrays_q31, n, min_fixed, max_fixed);
+        break;
+      default: normalize_data(readings, n, stats->min_value, stats->max_value); break;
+    }
+    ROI_END(ROI_NORMALIZE);
+    normalized = (layout == LAYOUT_Q15 || layout == LAYOUT_Q31) ?
+        max_fixed > min_fixed : stats->max_value - stats->min_value >= 0.001f;
+
+    printf("Step 6: Computing per-sensor statistics...\n");
+    ROI_BEGIN(ROI_PER_SENSOR_STATS);
+    switch (layout) {
+      case LAYOUT_SOA: per_sensor_stats_arrays(&arrays, sensor_avg); break;
+      case LAYOUT_Q15: per_sensor_stats_arrays_q15(&arrays_q15, sensor_avg); break;
+      case LAYOUT_Q31: per_sensor_stats_arrays_q31(&arrays_q31, sensor_avg); break;
+      default: compute_per_sensor_stats(readings, n, sensor_avg); break;
+    }
+    ROI_END(ROI_PER_SENSOR_STATS);
+}
+
+// Normalized value and anomaly flag of reading i in the selected layout
+static float output_value(int i, uint8_t *flag) {
+    switch (layout) {
+      case LAYOUT_SOA:
+        *flag = arrays.anomaly_flag[i];
+        return arrays.filtered_value[i];
+      case LAYOUT_Q15:
+        *flag = arrays_q15.anomaly_flag[i];
+        return (float)arrays_q15.filtered_value[i] /
+               (normalized ? q15_one : q15_raw_scale);
+      case LAYOUT_Q31:
+        *flag = arrays_q31.anomaly_flag[i];
+        return (float)((double)arrays_q31.filtered_value[i] /
+                       (normalized ? q31_one : q31_raw_scale));
+      default:
+        *flag = readings[i].anomaly_flag;
+        return readings[i].filtered_value;
+    }
+}
+
+// Compare every reading with the float AoS pipeline; returns 0 if equivalent
+static int check_equivalence(const AggregateStats *stats) {
+    int n = edge_size.total_samples;
+    SensorReading *reference = (SensorReading *)malloc(n * sizeof(SensorReading));
+    AggregateStats ref_stats;
+    float max_error = 0.0f, tolerance = layout_tolerance[layout];
+    int flag_mismatches = 0;
+
+    if (!reference) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+    generate_sensor_data(reference);
+    apply_moving_average_filter(reference, n);
+    detect_anomalies(reference, n);
+    compute_aggregate_stats(reference, n, &ref_stats);
+    normalize_data(reference, n, ref_stats.min_value, ref_stats.max_value);
+    tolerance += normalized ?
+        layout_raw_lsb[layout] / (ref_stats.max_value - ref_stats.min_value) :
+        layout_raw_lsb[layout];  // constant signal left in raw units
+
+    for (int i = 0; i < n; i++) {
+        uint8_t flag;
+        float error = fabsf(output_value(i, &flag) - reference[i].filtered_value);
+
+        if (error > max_error) max_error = error;
+        if (flag != reference[i].anomaly_flag) flag_mismatches++;
+    }
+    free(reference);
+
+    int pass = (max_error <= tolerance && flag_mismatches == 0 &&
+                stats->anomaly_count == ref_stats.anomaly_count);
+    printf("Equivalence check vs aos: %s (max normalized error %.3g, "
+           "tolerance %.3g, %d anomaly flag mismatches)\n",
+           pass ? "PASS" : "FAIL", max_error, tolerance,
+           flag_mismatches);
+    return !pass;
+}
+
+int main(int argc, char **argv) {
+    int check = 0;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        int mode = -1;
+        for (int l = LAYOUT_AOS; l <= LAYOUT_Q31; l++) {
+            if (strcmp(argv[arg], layout_names[l]) == 0) mode = l;
+        }
+        if (mode < 0) {
+            printf("ERROR: layout must be aos, soa, q15 or q31\n");
+            return 1;
+        }
+        layout = (EdgeLayout)mode;
+    }
+    if (argc > arg + 1) {
+        if (strcmp(argv[arg + 1], "check") != 0) {
+            printf("ERROR: unknown argument '%s' (expected check)\n", argv[arg + 1]);
+            return 1;
+        }
+        check = 1;
+    }
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (Layouts)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    printf("  Layout: %s (%zu bytes per reading, %zu bytes)\n",
+           layout_names[layout], layout_bytes[layout],
+           layout_bytes[layout] * edge_size.total_samples);
+    printf("========================================\n\n");
+
+    if (!alloc_layout(edge_size.total_samples)) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+
+    AggregateStats stats;
+    float sensor_avg[MAX_SENSORS];
+    run_pipeline(&stats, sensor_avg);
+    print_per_sensor_stats(sensor_avg);
+    print_aggregate_report(&stats);
+
+    int failed = check && check_equivalence(&stats);
+    free_layout();
+    if (failed) {
+        return 2;
+    }
+    printf("Edge preprocessing completed successfully!\n");
+    return 0;
+}
@@ -0,0 +1,252 @@
+/*
+ * Edge Pre-processing Workload (multithreaded)
+ *
+ * Same pipeline as edge_preprocessing.c, but the readings are partitioned
+ * into contiguous shards, one per pthread, so that each core of a
+ * multi-core edge processor handles its own slice of the sensor batch:
+ * 1. Filter + anomaly detection on the local shard
+ * 2. Partial aggregate statistics on the local shard (reduced by thread 0)
+ * 3. Normalization of the local shard with the global min/max
+ *
+ * Phases are separated by a barrier. The main thread acts as worker 0, so
+ * running with N threads needs N simulated cores (gem5 SE mode maps each
+ * cloned thread onto the next free hardware context, i.e. thread t runs on
+ * system.cpu[t]).
+ *
+ * Task placement (heterogeneous big.LITTLE systems): when num_little is
+ * given, threads [0, num_little) - the little cores - run the streaming
+ * filter/detect and normalize phases, and threads [num_little, num_threads)
+ * - the big cores - run the aggregation phase.
+ *
+ * Sharing of the aggregates (cost of coherence in the aggregation phase):
+ *   padded  per-thread partial statistics, one cache line each (default)
+ *   packed  per-thread partial statistics packed next to each other, so
+ *           neighbouring threads falsely share cache lines
+ *   shared  one global AggregateStats protected by a mutex; every thread
+ *           merges a partial of SHARED_CHUNK readings at a time into it
+ *           (true sharing; the float sum may differ in the last digits)
+ *
+ * Usage: edge_preprocessing_mt [--sensors=N] [--samples=N] [--seed=N]
+ *                              [num_threads] [num_little] [sharing]
+ *        (default: 4 threads, every thread runs every phase, padded)
+ */
+
+#include <pthread.h>
+#include <string.h>
+
+#include "edge_kernels.h"
+
+#define MAX_THREADS 64
+#define CACHE_LINE 64
+#define SHARED_CHUNK 64
+
+// Per-thread partial statistics, padded and aligned to one cache line each
+// to avoid false sharing
+typedef struct {
+    AggregateStats stats;
+    char pad[CACHE_LINE - sizeof(AggregateStats)];
+} __attribute__((aligned(CACHE_LINE))) PaddedStats;
+
+_Static_assert(sizeof(PaddedStats) == CACHE_LINE,
+               "PaddedStats must fill exactly one cache line");
+
+// Layout of the aggregation results shared between the threads
+typedef enum {
+    SHARING_PADDED,
+    SHARING_PACKED,
+    SHARING_SHARED,
+} SharingMode;
+
+static const char *const sharing_names[] = {"padded", "packed", "shared"};
+
+// Contiguous range of thread ids that shares one pipeline phase
+typedef struct {
+    int first;
+    int count;
+} ThreadGroup;
+
+static SensorReading *readings;
+static PaddedStats partial_stats[MAX_THREADS];
+static AggregateStats packed_stats[MAX_THREADS];
+static AggregateStats shared_stats = {1e9, -1e9, 0.0f, 0, 0};
+static pthread_mutex_t shared_lock = PTHREAD_MUTEX_INITIALIZER;
+static SharingMode sharing = SHARING_PADDED;
+static AggregateStats global_stats;
+static pthread_barrier_t phase_barrier;
+static int num_threads = 4;
+static ThreadGroup stream_group;     // filter/detect and normalize
+static ThreadGroup aggregate_group;  // partial aggregation and reduction
+
+// Shard of the readings owned by thread t within group g.
+// Returns 0 if t does not take part in the phase.
+static int shard_range(const ThreadGroup *g, int t, int *begin, int *end) {
+    if (t < g->first || t >= g->first + g->count) return 0;
+
+    int idx = t - g->first;
+    int shard = edge_size.total_samples / g->count;
+    *begin = idx * shard;
+    *end = (idx == g->count - 1) ? edge_size.total_samples : (idx + 1) * shard;
+    return 1;
+}
+
+// Aggregate the shard [begin, end) of thread t with the selected sharing
+static void aggregate_shard(int t, int begin, int end) {
+    AggregateStats chunk;
+
+    switch (sharing) {
+      case SHARING_PADDED:
+        compute_aggregate_stats_range(readings, begin, end, &partial_stats[t].stats);
+        break;
+      case SHARING_PACKED:
+        compute_aggregate_stats_range(readings, begin, end, &packed_stats[t]);
+        break;
+      case SHARING_SHARED:
+        for (int i = begin; i < end; i += SHARED_CHUNK) {
+            int chunk_end = (i + SHARED_CHUNK < end) ? i + SHARED_CHUNK : end;
+            compute_aggregate_stats_range(readings, i, chunk_end, &chunk);
+            pthread_mutex_lock(&shared_lock);
+            merge_aggregate_stats(&shared_stats, &chunk);
+            pthread_mutex_unlock(&shared_lock);
+        }
+        break;
+    }
+}
+
+// Reduce the per-thread partial statistics of the aggregation group
+static void reduce_aggregates(void) {
+    int first = aggregate_group.first;
+
+    if (sharing == SHARING_SHARED) {
+        global_stats = shared_stats;
+        return;
+    }
+    global_stats = (sharing == SHARING_PADDED) ? partial_stats[first].stats
+                                               : packed_stats[first];
+    for (int p = first + 1; p < first + aggregate_group.count; p++) {
+        merge_aggregate_stats(&global_stats,
+                              (sharing == SHARING_PADDED) ? &partial_stats[p].stats
+                                                          : &packed_stats[p]);
+    }
+}
+
+static void *edge_worker(void *arg) {
+    int t = (int)(intptr_t)arg;
+    int begin, end;
+
+    if (shard_range(&stream_group, t, &begin, &end)) {
+        apply_moving_average_filter_range(readings, edge_size.total_samples, begin, end);
+        detect_anomalies_range(readings, begin, end);
+    }
+    pthread_barrier_wait(&phase_barrier);
+
+    if (shard_range(&aggregate_group, t, &begin, &end)) {
+        aggregate_shard(t, begin, end);
+    }
+    pthread_barrier_wait(&phase_barrier);
+
+    // First aggregation thread reduces the partial statistics
+    if (t == aggregate_group.first) {
+        reduce_aggregates();
+    }
+    pthread_barrier_wait(&phase_barrier);
+
+    if (shard_range(&stream_group, t, &begin, &end)) {
+        normalize_data_range(readings, begin, end,
+                             global_stats.min_value, global_stats.max_value);
+    }
+    return NULL;
+}
+
+int main(int argc, char **argv) {
+    int num_little = 0;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        num_threads = atoi(argv[arg]);
+    }
+    if (argc > arg + 1) {
+        num_little = atoi(argv[arg + 1]);
+    }
+    if (argc > arg + 2) {
+        int mode = -1;
+        for (int m = SHARING_PADDED; m <= SHARING_SHARED; m++) {
+            if (strcmp(argv[arg + 2], sharing_names[m]) == 0) mode = m;
+        }
+        if (mode < 0) {
+            printf("ERROR: sharing must be padded, packed or shared\n");
+            return 1;
+        }
+        sharing = (SharingMode)mode;
+    }
+    if (num_threads < 1 || num_threads > MAX_THREADS) {
+        printf("ERROR: num_threads must be between 1 and %d\n", MAX_THREADS);
+        return 1;
+    }
+    if (num_little < 0 || num_little >= num_threads) {
+        printf("ERROR: num_little must be between 0 and num_threads - 1\n");
+        return 1;
+    }
+
+    if (num_little > 0) {
+        stream_group = (ThreadGroup){0, num_little};
+        aggregate_group = (ThreadGroup){num_little, num_threads - num_little};
+    } else {
+        stream_group = (ThreadGroup){0, num_threads};
+        aggregate_group = stream_group;
+    }
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (multithreaded)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    printf("  Threads: %d\n", num_threads);
+    if (num_little > 0) {
+        printf("  Task placement: filter/normalize on threads 0-%d, "
+               "aggregation on threads %d-%d\n",
+               num_little - 1, num_little, num_threads - 1);
+    }
+    printf("  Aggregate sharing: %s\n", sharing_names[sharing]);
+    printf("========================================\n\n");
+
+    // Allocate sensor data
+    readings = (SensorReading *)malloc(edge_size.total_samples * sizeof(SensorReading));
+
+    if (!readings) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+
+    printf("Step 1: Generating sensor data...\n");
+    generate_sensor_data(readings);
+
+    printf("Step 2: Filter, detect, aggregate and normalize on %d threads...\n",
+           num_threads);
+    pthread_t threads[MAX_THREADS];
+
+    pthread_barrier_init(&phase_barrier, NULL, num_threads);
+    for (int t = 1; t < num_threads; t++) {
+        pthread_create(&threads[t], NULL, edge_worker, (void *)(intptr_t)t);
+    }
+    edge_worker((void *)(intptr_t)0);
+    for (int t = 1; t < num_threads; t++) {
+        pthread_join(threads[t], NULL);
+    }
+    pthread_barrier_destroy(&phase_barrier);
+
+    printf("Step 3: Computing per-sensor statistics...\n");
+    float sensor_avg[MAX_SENSORS];
+    compute_per_sensor_stats(readings, edge_size.total_samples, sensor_avg);
+    print_per_sensor_stats(sensor_avg);
+
+    // Print results
+    print_aggregate_report(&global_stats);
+    printf("Edge preprocessing completed successfully!\n");
+
+    free(readings);
+    return 0;
+}
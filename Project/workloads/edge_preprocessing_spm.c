@@ -0,0 +1,221 @@
+/*
+ * Edge Pre-processing Workload (scratchpad, double-buffered windows)
+ *
+ * The pipeline of edge_preprocessing.c with all processing done in a
+ * software-managed scratchpad: readings stay in DRAM and are staged
+ * window by window into two scratchpad buffers. While window w is
+ * processed in one buffer, window w+1 has already been copied into the
+ * other, and the results of window w are copied back before the buffers
+ * swap. The CPU does the copies itself (there is no DMA engine), so the
+ * overlap comes only from the core's memory-level parallelism.
+ *
+ * Pass 1 filters, detects anomalies and accumulates the aggregate
+ * statistics window by window (every buffer carries FILTER_WINDOW/2
+ * readings of halo on each side). Pass 2 normalizes with the global
+ * min/max and accumulates the per-sensor sums. Statistics are accumulated
+ * in reading order, so the output is identical to edge_preprocessing.
+ *
+ * The scratchpad is mapped by edge_power_config.py (--scratchpad) at a
+ * fixed virtual address that the config passes as spm_base; without it
+ * (spm_base 0, e.g. a native run) the buffers are malloc'ed.
+ *
+ * Usage: edge_preprocessing_spm [--sensors=N] [--samples=N] [--seed=N]
+ *                               [window_size] [spm_base] [spm_size]
+ *        window_size: readings per window (default: 256)
+ *        spm_base:    virtual address of the scratchpad (default: 0)
+ *        spm_size:    scratchpad size in bytes (default: 32768)
+ */
+
+#include <string.h>
+
+#include "edge_kernels.h"
+
+#define DEFAULT_WINDOW_SIZE 256
+#define DEFAULT_SPM_SIZE 32768
+#define HALO (FILTER_WINDOW / 2)
+
+static int window_size = DEFAULT_WINDOW_SIZE;
+static SensorReading *buffers[2];  // Double buffer in the scratchpad
+
+// First reading of window w and its staged range [begin, end) with halo
+static void window_range(int w, int halo, int *first, int *begin, int *end) {
+    int n = edge_size.total_samples;
+
+    *first = w * window_size;
+    *begin = *first - halo > 0 ? *first - halo : 0;
+    *end = *first + window_size + halo < n ? *first + window_size + halo : n;
+}
+
+// Copy window w (with halo readings) from DRAM into buffer slot
+static void stage_in(const SensorReading *readings, int w, int halo, int slot) {
+    int first, begin, end;
+
+    window_range(w, halo, &first, &begin, &end);
+    memcpy(buffers[slot], &readings[begin], (end - begin) * sizeof(SensorReading));
+}
+
+// Copy the window part of buffer slot back to DRAM
+static void stage_out(SensorReading *readings, int w, int halo, int slot) {
+    int first, begin, end;
+
+    window_range(w, halo, &first, &begin, &end);
+    if (end > first + window_size) end = first + window_size;
+    memcpy(&readings[first], &buffers[slot][first - begin],
+           (end - first) * sizeof(SensorReading));
+}
+
+// Accumulate readings [begin, end) into running statistics (reading order)
+static void accumulate_stats(const SensorReading *buf, int begin, int end,
+                             AggregateStats *stats) {
+    for (int i = begin; i < end; i++) {
+        float val = buf[i].filtered_value;
+
+        if (val < stats->min_value) stats->min_value = val;
+        if (val > stats->max_value) stats->max_value = val;
+
+        stats->sum += val;
+        stats->anomaly_count += buf[i].anomaly_flag;
+    }
+}
+
+// Pass 1: filter, detect anomalies and aggregate, window by window
+static void filter_pass(SensorReading *readings, int num_windows,
+                        AggregateStats *stats) {
+    stats->min_value = 1e9;
+    stats->max_value = -1e9;
+    stats->sum = 0.0f;
+    stats->anomaly_count = 0;
+    stats->total_samples = edge_size.total_samples;
+
+    stage_in(readings, 0, HALO, 0);
+    for (int w = 0; w < num_windows; w++) {
+        int slot = w & 1;
+        int first, begin, end;
+
+        if (w + 1 < num_windows) {
+            stage_in(readings, w + 1, HALO, slot ^ 1);
+        }
+
+        window_range(w, HALO, &first, &begin, &end);
+        // The window's readings within the buffer (end may include halo)
+        int lo = first - begin;
+        int hi = lo + (end - first < window_size ? end - first : window_size);
+        apply_moving_average_filter_range(buffers[slot], end - begin, lo, hi);
+        detect_anomalies_range(buffers[slot], lo, hi);
+        accumulate_stats(buffers[slot], lo, hi, stats);
+
+        stage_out(readings, w, HALO, slot);
+    }
+}
+
+// Pass 2: normalize and accumulate the per-sensor sums, window by window
+static void normalize_pass(SensorReading *readings, int num_windows,
+                           const AggregateStats *stats,
+                           float sensor_avg[MAX_SENSORS]) {
+    float sensor_sum[MAX_SENSORS] = {0};
+    int samples = edge_size.samples_per_sensor;
+
+    stage_in(readings, 0, 0, 0);
+    for (int w = 0; w < num_windows; w++) {
+        int slot = w & 1;
+        int first, begin, end;
+
+        if (w + 1 < num_windows) {
+            stage_in(readings, w + 1, 0, slot ^ 1);
+        }
+
+        window_range(w, 0, &first, &begin, &end);
+        normalize_data_range(buffers[slot], 0, end - begin,
+                             stats->min_value, stats->max_value);
+        for (int i = 0; i < end - begin; i++) {
+            sensor_sum[(first + i) / samples] += buffers[slot][i].filtered_value;
+        }
+
+        stage_out(readings, w, 0, slot);
+    }
+
+    for (int sensor = 0; sensor < edge_size.num_sensors; sensor++) {
+        sensor_avg[sensor] = sensor_sum[sensor] / samples;
+    }
+}
+
+int main(int argc, char **argv) {
+    unsigned long spm_base = 0;
+    unsigned long spm_size = DEFAULT_SPM_SIZE;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        window_size = atoi(argv[arg]);
+    }
+    if (argc > arg + 1) {
+        spm_base = strtoul(argv[arg + 1], NULL, 0);
+    }
+    if (argc > arg + 2) {
+        spm_size = strtoul(argv[arg + 2], NULL, 0);
+    }
+
+    size_t buffer_bytes = (window_size + 2 * HALO) * sizeof(SensorReading);
+    if (window_size < 1 || window_size > edge_size.total_samples ||
+        2 * buffer_bytes > spm_size) {
+        printf("ERROR: window_size must be 1..%d and two windows of %zu bytes "
+               "must fit the %lu-byte scratchpad\n",
+               edge_size.total_samples, buffer_bytes, spm_size);
+        return 1;
+    }
+
+    int num_windows = (edge_size.total_samples + window_size - 1) / window_size;
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (scratchpad)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    printf("  Readings per window: %d\n", window_size);
+    printf("  Windows: %d\n", num_windows);
+    if (spm_base) {
+        printf("  Scratchpad: %lu bytes at 0x%lx (2 x %zu-byte buffers)\n",
+               spm_size, spm_base, buffer_bytes);
+    } else {
+        printf("  Scratchpad: none (heap buffers)\n");
+    }
+    printf("========================================\n\n");
+
+    SensorReading *readings = (SensorReading *)malloc(
+        edge_size.total_samples * sizeof(SensorReading));
+    void *heap_buffers = NULL;
+
+    if (spm_base) {
+        buffers[0] = (SensorReading *)spm_base;
+    } else {
+        heap_buffers = malloc(2 * buffer_bytes);
+        buffers[0] = (SensorReading *)heap_buffers;
+    }
+    if (!readings || !buffers[0]) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+    buffers[1] = buffers[0] + window_size + 2 * HALO;
+
+    printf("Step 1: Generating sensor data...\n");
+    generate_sensor_data(readings);
+
+    printf("Step 2: Filtering, detecting anomalies and aggregating...\n");
+    AggregateStats stats;
+    filter_pass(readings, num_windows, &stats);
+
+    printf("Step 3: Normalizing and computing per-sensor statistics...\n");
+    float sensor_avg[MAX_SENSORS];
+    normalize_pass(readings, num_windows, &stats, sensor_avg);
+    print_per_sensor_stats(sensor_avg);
+
+    print_aggregate_report(&stats);
+    printf("Edge preprocessing completed successfully!\n");
+
+    free(heap_buffers);
+    free(readings);
+    return 0;
+}
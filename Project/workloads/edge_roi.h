@@ -0,0 +1,37 @@
+/*
+ * Region-of-interest markers for the edge pre-processing workload
+ *
+ * Each pipeline stage is wrapped in ROI_BEGIN/ROI_END. When compiled with
+ * -DEDGE_M5OPS the markers become gem5 m5ops work items
+ * (m5_work_begin/m5_work_end with the phase id as work id); the config
+ * (edge_power_config.py --roi) exits on those work items, resets the stats
+ * at ROI_BEGIN and dumps them at ROI_END, so every stats dump covers
+ * exactly one phase. Without -DEDGE_M5OPS the markers compile to nothing
+ * and the binary runs natively or in an unmodified gem5 config.
+ *
+ * Build with m5ops (libm5 from gem5/util/m5):
+ *   aarch64-linux-gnu-gcc -O2 -static -DEDGE_M5OPS -I$GEM5/include \
+ *       edge_preprocessing.c -o edge_preprocessing_roi_arm \
+ *       -L$GEM5/util/m5/build/arm64/out -lm5 -lm
+ */
+
+#ifndef EDGE_ROI_H
+#define EDGE_ROI_H
+
+// Phase ids (must match ROI_PHASES in edge_power_config.py)
+#define ROI_FILTER            0
+#define ROI_ANOMALY_DETECTION 1
+#define ROI_AGGREGATE         2
+#define ROI_NORMALIZE         3
+#define ROI_PER_SENSOR_STATS  4
+
+#ifdef EDGE_M5OPS
+#include <gem5/m5ops.h>
+#define ROI_BEGIN(phase) m5_work_begin((phase), 0)
+#define ROI_END(phase)   m5_work_end((phase), 0)
+#else
+#define ROI_BEGIN(phase) ((void)(phase))
+#define ROI_END(phase)   ((void)(phase))
+#endif
+
+#endif // EDGE_ROI_H
@@ -0,0 +1,275 @@
+/*
+ * Vectorized Edge Pre-processing Kernels (NEON and SVE)
+ *
+ * NEON (128-bit) and SVE (vector-length agnostic) versions of the moving
+ * average filter, the aggregate statistics and the normalization of
+ * edge_kernels.h. The readings stay in their SensorReading layout: a
+ * 16-byte reading is four 32-bit lanes, so a de-interleaving structure
+ * load (vld4q_f32 / svld4_f32) puts sensor ids, raw values, filtered values
+ * and anomaly flags in separate vectors, and the matching store writes the
+ * untouched fields back unchanged.
+ *
+ * The filter and the normalization produce bit-identical results to the
+ * scalar kernels (same additions in the same order, true division). The
+ * aggregate sum is accumulated per lane, so it may differ from the scalar
+ * sum in the last digits; min, max and the anomaly count are exact.
+ *
+ * A variant is only available if the compiler targets it (__ARM_NEON for
+ * NEON, __ARM_FEATURE_SVE for SVE, e.g. -march=armv8-a+sve); the scalar
+ * kernels are always available.
+ */
+
+#ifndef EDGE_SIMD_H
+#define EDGE_SIMD_H
+
+#include <string.h>
+
+#include "edge_kernels.h"
+
+#ifdef __ARM_NEON
+#include <arm_neon.h>
+#endif
+#ifdef __ARM_FEATURE_SVE
+#include <arm_sve.h>
+#endif
+
+// Kernel implementations selectable at runtime
+typedef enum {
+    EDGE_SCALAR,
+    EDGE_NEON,
+    EDGE_SVE,
+} EdgeKernelVariant;
+
+static const char *const edge_variant_names[] = {"scalar", "neon", "sve"};
+#define NUM_EDGE_VARIANTS 3
+
+// Variant with the given name, or -1 if unknown
+static inline int find_edge_variant(const char *name) {
+    for (int v = 0; v < NUM_EDGE_VARIANTS; v++) {
+        if (strcmp(name, edge_variant_names[v]) == 0) return v;
+    }
+    return -1;
+}
+
+// Whether the variant was compiled into this binary
+static inline int edge_variant_available(EdgeKernelVariant variant) {
+    switch (variant) {
+      case EDGE_SCALAR: return 1;
+#ifdef __ARM_NEON
+      case EDGE_NEON: return 1;
+#endif
+#ifdef __ARM_FEATURE_SVE
+      case EDGE_SVE: return 1;
+#endif
+      default: return 0;
+    }
+}
+
+// Vector length of the variant in bits (0 for scalar)
+static inline int edge_variant_bits(EdgeKernelVariant variant) {
+    switch (variant) {
+#ifdef __ARM_NEON
+      case EDGE_NEON: return 128;
+#endif
+#ifdef __ARM_FEATURE_SVE
+      case EDGE_SVE: return (int)svcntw() * 32;
+#endif
+      default: return 0;
+    }
+}
+
+#ifdef __ARM_NEON
+// Filter readings [FILTER_WINDOW/2, num_readings - FILTER_WINDOW/2) four at a
+// time; returns the first reading left for the scalar kernel
+static inline int filter_neon(SensorReading *readings, int num_readings) {
+    const int half = FILTER_WINDOW / 2;
+    const float32x4_t count = vdupq_n_f32((float)FILTER_WINDOW);
+    int i = half;
+
+    for (; i + 4 <= num_readings - half; i += 4) {
+        float32x4x4_t r = vld4q_f32((const float *)&readings[i]);
+        float32x4_t sum = vld4q_f32((const float *)&readings[i - half]).val[1];
+
+        for (int j = -half + 1; j <= half; j++) {
+            sum = vaddq_f32(sum, vld4q_f32((const float *)&readings[i + j]).val[1]);
+        }
+        r.val[2] = vdivq_f32(sum, count);
+        vst4q_f32((float *)&readings[i], r);
+    }
+    return i;
+}
+
+static inline int normalize_neon(SensorReading *readings, int num_readings,
+                                 float min_val, float range) {
+    const float32x4_t vmin = vdupq_n_f32(min_val);
+    const float32x4_t vrange = vdupq_n_f32(range);
+    int i = 0;
+
+    for (; i + 4 <= num_readings; i += 4) {
+        float32x4x4_t r = vld4q_f32((const float *)&readings[i]);
+        r.val[2] = vdivq_f32(vsubq_f32(r.val[2], vmin), vrange);
+        vst4q_f32((float *)&readings[i], r);
+    }
+    return i;
+}
+
+static inline int aggregate_neon(const SensorReading *readings, int num_readings,
+                                 AggregateStats *stats) {
+    float32x4_t vmin = vdupq_n_f32(stats->min_value);
+    float32x4_t vmax = vdupq_n_f32(stats->max_value);
+    float32x4_t vsum = vdupq_n_f32(0.0f);
+    uint32x4_t vcount = vdupq_n_u32(0);
+    const uint32x4_t flag_mask = vdupq_n_u32(0xff);
+    int i = 0;
+
+    for (; i + 4 <= num_readings; i += 4) {
+        float32x4x4_t r = vld4q_f32((const float *)&readings[i]);
+        vmin = vminq_f32(vmin, r.val[2]);
+        vmax = vmaxq_f32(vmax, r.val[2]);
+        vsum = vaddq_f32(vsum, r.val[2]);
+        // anomaly_flag is the first byte of the fourth lane
+        vcount = vaddq_u32(vcount, vandq_u32(vreinterpretq_u32_f32(r.val[3]), flag_mask));
+    }
+    stats->min_value = vminvq_f32(vmin);
+    stats->max_value = vmaxvq_f32(vmax);
+    stats->sum += vaddvq_f32(vsum);
+    stats->anomaly_count += vaddvq_u32(vcount);
+    return i;
+}
+#endif // __ARM_NEON
+
+#ifdef __ARM_FEATURE_SVE
+static inline int filter_sve(SensorReading *readings, int num_readings) {
+    const int half = FILTER_WINDOW / 2;
+    const int end = num_readings - half;
+    const svfloat32_t count = svdup_f32((float)FILTER_WINDOW);
+    int i = half;
+
+    for (; i < end; i += (int)svcntw()) {
+        svbool_t pg = svwhilelt_b32(i, end);
+        svfloat32x4_t r = svld4_f32(pg, (const float *)&readings[i]);
+        svfloat32_t sum = svget4_f32(svld4_f32(pg, (const float *)&readings[i - half]), 1);
+
+        for (int j = -half + 1; j <= half; j++) {
+            sum = svadd_f32_x(pg, sum,
+                              svget4_f32(svld4_f32(pg, (const float *)&readings[i + j]), 1));
+        }
+        r = svset4_f32(r, 2, svdiv_f32_x(pg, sum, count));
+        svst4_f32(pg, (float *)&readings[i], r);
+    }
+    return end > half ? end : half;
+}
+
+static inline int normalize_sve(SensorReading *readings, int num_readings,
+                                float min_val, float range) {
+    for (int i = 0; i < num_readings; i += (int)svcntw()) {
+        svbool_t pg = svwhilelt_b32(i, num_readings);
+        svfloat32x4_t r = svld4_f32(pg, (const float *)&readings[i]);
+        svfloat32_t value = svsub_n_f32_x(pg, svget4_f32(r, 2), min_val);
+        r = svset4_f32(r, 2, svdiv_n_f32_x(pg, value, range));
+        svst4_f32(pg, (float *)&readings[i], r);
+    }
+    return num_readings;
+}
+
+static inline int aggregate_sve(const SensorReading *readings, int num_readings,
+                                AggregateStats *stats) {
+    svfloat32_t vmin = svdup_f32(stats->min_value);
+    svfloat32_t vmax = svdup_f32(stats->max_value);
+    svfloat32_t vsum = svdup_f32(0.0f);
+    svuint32_t vcount = svdup_u32(0);
+
+    for (int i = 0; i < num_readings; i += (int)svcntw()) {
+        svbool_t pg = svwhilelt_b32(i, num_readings);
+        svfloat32x4_t r = svld4_f32(pg, (const float *)&readings[i]);
+        svfloat32_t value = svget4_f32(r, 2);
+        svuint32_t flag = svand_n_u32_x(pg, svreinterpret_u32_f32(svget4_f32(r, 3)), 0xff);
+
+        // Inactive lanes keep their previous value (_m)
+        vmin = svmin_f32_m(pg, vmin, value);
+        vmax = svmax_f32_m(pg, vmax, value);
+        vsum = svadd_f32_m(pg, vsum, value);
+        vcount = svadd_u32_m(pg, vcount, flag);
+    }
+    stats->min_value = svminv_f32(svptrue_b32(), vmin);
+    stats->max_value = svmaxv_f32(svptrue_b32(), vmax);
+    stats->sum += svaddv_f32(svptrue_b32(), vsum);
+    stats->anomaly_count += (uint32_t)svaddv_u32(svptrue_b32(), vcount);
+    return num_readings;
+}
+#endif // __ARM_FEATURE_SVE
+
+// Moving average filter of all readings with the selected variant
+static inline void edge_filter(EdgeKernelVariant variant, SensorReading *readings,
+                               int num_readings) {
+    const int half = FILTER_WINDOW / 2;
+    int done = half;
+
+    if (num_readings <= FILTER_WINDOW) variant = EDGE_SCALAR;
+    switch (variant) {
+#ifdef __ARM_NEON
+      case EDGE_NEON: done = filter_neon(readings, num_readings); break;
+#endif
+#ifdef __ARM_FEATURE_SVE
+      case EDGE_SVE: done = filter_sve(readings, num_readings); break;
+#endif
+      default:
+        apply_moving_average_filter(readings, num_readings);
+        return;
+    }
+    // Borders (partial windows) and the remainder use the scalar kernel
+    apply_moving_average_filter_range(readings, num_readings, 0, half);
+    apply_moving_average_filter_range(readings, num_readings, done, num_readings);
+}
+
+// Aggregate statistics of all readings with the selected variant
+static inline void edge_aggregate(EdgeKernelVariant variant, SensorReading *readings,
+                                  int num_readings, AggregateStats *stats) {
+    AggregateStats tail;
+    int done;
+
+    stats->min_value = 1e9;
+    stats->max_value = -1e9;
+    stats->sum = 0.0f;
+    stats->anomaly_count = 0;
+    stats->total_samples = num_readings;
+    switch (variant) {
+#ifdef __ARM_NEON
+      case EDGE_NEON: done = aggregate_neon(readings, num_readings, stats); break;
+#endif
+#ifdef __ARM_FEATURE_SVE
+      case EDGE_SVE: done = aggregate_sve(readings, num_readings, stats); break;
+#endif
+      default:
+        compute_aggregate_stats(readings, num_readings, stats);
+        return;
+    }
+    if (done < num_readings) {
+        compute_aggregate_stats_range(readings, done, num_readings, &tail);
+        tail.total_samples = 0;  // already counted
+        merge_aggregate_stats(stats, &tail);
+    }
+}
+
+// Normalization of all readings with the selected variant
+static inline void edge_normalize(EdgeKernelVariant variant, SensorReading *readings,
+                                  int num_readings, float min_val, float max_val) {
+    float range = max_val - min_val;
+    int done;
+
+    if (range < 0.001f) return;  // Same guard as normalize_data_range
+    switch (variant) {
+#ifdef __ARM_NEON
+      case EDGE_NEON: done = normalize_neon(readings, num_readings, min_val, range); break;
+#endif
+#ifdef __ARM_FEATURE_SVE
+      case EDGE_SVE: done = normalize_sve(readings, num_readings, min_val, range); break;
+#endif
+      default:
+        normalize_data(readings, num_readings, min_val, max_val);
+        return;
+    }
+    normalize_data_range(readings, done, num_readings, min_val, max_val);
+}
+
+#endif // EDGE_SIMD_H
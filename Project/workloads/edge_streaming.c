@@ -0,0 +1,134 @@
+/*
+ * Edge Pre-processing Workload (streaming input)
+ *
+ * Instead of generating the whole batch up front, readings "arrive" at a
+ * fixed rate and are processed one window at a time:
+ * 1. Generate the window's readings, then wait until the window has fully
+ *    arrived (timer-driven, busy-polling clock_gettime, which gem5 SE mode
+ *    answers with simulated time)
+ * 2. Filter, detect anomalies, update the running aggregate statistics and
+ *    normalize the window with the running min/max
+ *
+ * For every window the arrival, start and completion timestamps are
+ * recorded; they are printed after the run as
+ *     WINDOW <index> <arrival_ns> <start_ns> <done_ns>
+ * so that the gem5 config can compute per-window latency percentiles and
+ * the maximum sustainable input rate.
+ *
+ * Usage: edge_streaming [--sensors=N] [--samples=N] [--seed=N]
+ *                       [window_size] [arrival_rate]
+ *        window_size:  readings per window (default: 256)
+ *        arrival_rate: readings per second (default: 1000000)
+ */
+
+#include <time.h>
+
+#include "edge_kernels.h"
+
+#define DEFAULT_WINDOW_SIZE 256
+#define DEFAULT_ARRIVAL_RATE 1000000.0
+
+typedef struct {
+    uint64_t arrival_ns;
+    uint64_t start_ns;
+    uint64_t done_ns;
+} WindowTiming;
+
+static uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ull + (uint64_t)ts.tv_nsec;
+}
+
+int main(int argc, char **argv) {
+    int window_size = DEFAULT_WINDOW_SIZE;
+    double arrival_rate = DEFAULT_ARRIVAL_RATE;
+    int arg = parse_edge_options(argc, argv);
+
+    if (arg < 0) {
+        return 1;
+    }
+    if (argc > arg) {
+        window_size = atoi(argv[arg]);
+    }
+    if (argc > arg + 1) {
+        arrival_rate = atof(argv[arg + 1]);
+    }
+    if (window_size < 1 || window_size > edge_size.total_samples ||
+        arrival_rate <= 0.0) {
+        printf("ERROR: window_size must be 1..%d and arrival_rate > 0\n",
+               edge_size.total_samples);
+        return 1;
+    }
+
+    int num_windows = (edge_size.total_samples + window_size - 1) / window_size;
+
+    printf("========================================\n");
+    printf("Edge Pre-processing Workload (streaming)\n");
+    printf("========================================\n");
+    printf("Configuration:\n");
+    print_edge_size();
+    printf("  Filter window: %d\n", FILTER_WINDOW);
+    printf("  Readings per window: %d\n", window_size);
+    printf("  Windows: %d\n", num_windows);
+    printf("  Arrival rate: %.0f readings/s\n", arrival_rate);
+    printf("========================================\n\n");
+
+    SensorReading *readings = (SensorReading *)malloc(
+        edge_size.total_samples * sizeof(SensorReading));
+    WindowTiming *timing = (WindowTiming *)malloc(
+        num_windows * sizeof(WindowTiming));
+
+    if (!readings || !timing) {
+        printf("ERROR: Memory allocation failed!\n");
+        return 1;
+    }
+
+    AggregateStats stats = {1e9, -1e9, 0.0f, 0, 0};
+    AggregateStats window_stats;
+    uint32_t seed = edge_size.seed;
+    double ns_per_reading = 1e9 / arrival_rate;
+    uint64_t t0 = now_ns();
+
+    for (int w = 0; w < num_windows; w++) {
+        int begin = w * window_size;
+        int end = (begin + window_size < edge_size.total_samples) ?
+                  begin + window_size : edge_size.total_samples;
+
+        // Sensor front-end: the readings are fabricated while the window is
+        // still arriving, so generating them is not counted as service time
+        generate_sensor_data_range(readings, begin, end, &seed);
+
+        // The window is complete once its last reading has arrived
+        timing[w].arrival_ns = t0 + (uint64_t)(end * ns_per_reading);
+        while (now_ns() < timing[w].arrival_ns) {
+            // Poll the timer until the window arrives
+        }
+        timing[w].start_ns = now_ns();
+
+        // Only readings that have arrived can be used by the filter
+        apply_moving_average_filter_range(readings, end, begin, end);
+        detect_anomalies_range(readings, begin, end);
+        compute_aggregate_stats_range(readings, begin, end, &window_stats);
+        merge_aggregate_stats(&stats, &window_stats);
+        normalize_data_range(readings, begin, end,
+                             stats.min_value, stats.max_value);
+
+        timing[w].done_ns = now_ns();
+    }
+
+    // Report timestamps after the run so printing does not perturb latency
+    for (int w = 0; w < num_windows; w++) {
+        printf("WINDOW %d %llu %llu %llu\n", w,
+               (unsigned long long)timing[w].arrival_ns,
+               (unsigned long long)timing[w].start_ns,
+               (unsigned long long)timing[w].done_ns);
+    }
+
+    print_aggregate_report(&stats);
+    printf("Edge preprocessing completed successfully!\n");
+
+    free(timing);
+    free(readings);
+    return 0;
+}